@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
 
-from .models import TriggerTopic, User, UserTriggerPreference
+from .models import TriggerTopic, TriggerTopicKeyword, User, UserTriggerPreference
 
 
 @admin.register(User)
@@ -38,11 +38,25 @@ class UserAdmin(DjangoUserAdmin):
     search_fields = ("username", "email", "full_name", "gender_identity", "pronouns")
 
 
+class TriggerTopicKeywordInline(admin.TabularInline):
+    model = TriggerTopicKeyword
+    extra = 0
+
+
 @admin.register(TriggerTopic)
 class TriggerTopicAdmin(admin.ModelAdmin):
-    list_display = ("name", "slug", "created_by", "created_at")
+    list_display = ("name", "slug", "bit", "created_by", "created_at")
     prepopulated_fields = {"slug": ("name",)}
     search_fields = ("name", "description")
+    readonly_fields = ("bit",)
+    inlines = [TriggerTopicKeywordInline]
+
+
+@admin.register(TriggerTopicKeyword)
+class TriggerTopicKeywordAdmin(admin.ModelAdmin):
+    list_display = ("topic", "keyword_id", "updated_at")
+    search_fields = ("topic__name", "keyword_id")
+    list_filter = ("topic",)
 
 
 @admin.register(UserTriggerPreference)
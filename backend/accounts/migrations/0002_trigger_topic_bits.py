@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def assign_trigger_bits(apps, schema_editor):
+    TriggerTopic = apps.get_model("accounts", "TriggerTopic")
+    topics = list(TriggerTopic.objects.order_by("pk")[:63])
+    for bit, topic in enumerate(topics):
+        topic.bit = bit
+    TriggerTopic.objects.bulk_update(topics, ["bit"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='triggertopic',
+            name='bit',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True, unique=True),
+        ),
+        migrations.CreateModel(
+            name='TriggerTopicKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword_id', models.PositiveIntegerField(db_index=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('topic', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='accounts.triggertopic')),
+            ],
+            options={
+                'ordering': ['topic', 'keyword_id'],
+                'constraints': [models.UniqueConstraint(fields=('topic', 'keyword_id'), name='unique_trigger_topic_keyword')],
+            },
+        ),
+        migrations.RunPython(assign_trigger_bits, migrations.RunPython.noop),
+    ]
@@ -58,12 +58,21 @@ class User(AbstractUser):
         return TriggerTopic.objects.filter(user_preferences__user=self)
 
 
+# MediaItem.trigger_mask is a signed 64-bit column.
+TRIGGER_BIT_COUNT = 63
+
+
 class TriggerTopic(models.Model):
-    """Curated list of trigger topics that users can opt out of seeing."""
+    """Curated list of trigger topics that users can opt out of seeing.
+
+    Each topic owns one ``bit`` of `MediaItem.trigger_mask`, assigned on first
+    save. Its TMDb keywords (`TriggerTopicKeyword`) decide which items set it.
+    """
 
     name = models.CharField(max_length=120, unique=True)
     slug = models.SlugField(max_length=120, unique=True)
     description = models.TextField(blank=True)
+    bit = models.PositiveSmallIntegerField(unique=True, null=True, blank=True, editable=False)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         null=True,
@@ -80,6 +89,37 @@ class TriggerTopic(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs) -> None:
+        if self.bit is None:
+            self.bit = self._next_free_bit()
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def _next_free_bit(cls) -> int:
+        taken = set(cls.objects.exclude(bit__isnull=True).values_list("bit", flat=True))
+        for bit in range(TRIGGER_BIT_COUNT):
+            if bit not in taken:
+                return bit
+        raise ValidationError(f"Only {TRIGGER_BIT_COUNT} trigger topics can be filtered on.")
+
+
+class TriggerTopicKeyword(models.Model):
+    """TMDb keyword whose presence flags an item with the topic's bit."""
+
+    topic = models.ForeignKey(TriggerTopic, on_delete=models.CASCADE, related_name="keywords")
+    keyword_id = models.PositiveIntegerField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["topic", "keyword_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["topic", "keyword_id"], name="unique_trigger_topic_keyword"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.topic} ← {self.keyword_id}"
+
 
 class UserTriggerPreference(models.Model):
     """User-specified trigger warnings, supporting curated or custom topics."""
@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "rest_framework",
+    "tmdb.apps.TmdbConfig",
     "accounts.apps.AccountsConfig",
     "planets.apps.PlanetsConfig",
     "media_catalog.apps.MediaCatalogConfig",
@@ -128,3 +129,8 @@ TMDB_CONFIG = {
     "TIMEOUT": float(os.environ.get("TMDB_TIMEOUT", "10")),
     "DEFAULT_BASE_URL": os.environ.get("TMDB_DEFAULT_BASE_URL", "https://api.themoviedb.org/3"),
 }
+
+# Seconds the feed and theme pages wait for fresh lists before serving snapshots.
+FEED_RENDER_DEADLINE = float(os.environ.get("FEED_RENDER_DEADLINE", "8"))
+# Seconds a published theme list is served as-is before a read regenerates it.
+FEED_LIST_MAX_AGE = float(os.environ.get("FEED_LIST_MAX_AGE", "21600"))
@@ -5,16 +5,18 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from planets.api import PlanetBuilderViewSet
-from media_catalog.api import IdentityTagViewSet, MediaListViewSet
+from media_catalog.api import IdentityTagViewSet, MediaItemExportView, MediaListGenerationJobViewSet, MediaListViewSet
 
 router = DefaultRouter()
 router.register(r"planets", PlanetBuilderViewSet, basename="planet-builder")
 router.register(r"media-lists", MediaListViewSet, basename="media-list")
 router.register(r"identity-tags", IdentityTagViewSet, basename="identity-tag")
+router.register(r"media-list-jobs", MediaListGenerationJobViewSet, basename="media-list-job")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("accounts/", include("django.contrib.auth.urls")),
     path("", include("frontend.urls")),
+    path("api/media-items/export/", MediaItemExportView.as_view(), name="media-item-export"),
     path("api/", include(router.urls)),
 ]
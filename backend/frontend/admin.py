@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import ThemeDetailSnapshot
+
+
+@admin.register(ThemeDetailSnapshot)
+class ThemeDetailSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("theme", "language", "media_list", "source_version", "updated_at")
+    search_fields = ("theme",)
+    list_filter = ("language",)
+    readonly_fields = ("payload",)
@@ -1,41 +1,92 @@
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlencode
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
 from rest_framework import permissions, status
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .services import build_feed_carousel, fetch_random_queer_movie
+from media_catalog.api.serializers import MediaListGenerationJobSerializer
+from media_catalog.models import MediaListGenerationJob
+from media_catalog.services import GenerationJobConflict
+
+from .services import (
+    build_feed_carousel,
+    build_job_carousel,
+    draw_random_queer_movie,
+    enqueue_feed_carousel_refresh,
+    feed_render_deadline,
+    iter_feed_carousels,
+)
+
+TEASER_MAX_AGE = 30
 
 
 class QueerFilmTeaserView(APIView):
     permission_classes = [permissions.AllowAny]
 
     def get(self, request, *args, **kwargs) -> Response:
-        movie = fetch_random_queer_movie()
+        movie = draw_random_queer_movie()
         if not movie:
-            return Response(
+            response = Response(
                 {"detail": "No film available right now."},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
-        return Response(movie)
+            patch_cache_control(response, no_store=True)
+            return response
+        response = Response(movie)
+        # A landing-page burst shares one draw from caches instead of each visit spending one.
+        patch_cache_control(response, public=True, max_age=TEASER_MAX_AGE)
+        return response
+
+
+def _job_payload(slug: str, job: MediaListGenerationJob, request, *, limit: Optional[int] = None) -> dict:
+    payload = dict(MediaListGenerationJobSerializer(job, context={"request": request}).data)
+    status_url = reverse("frontend:feed-carousel-job", kwargs={"slug": slug, "job_id": job.pk})
+    if limit is not None:
+        # The finished carousel is cut to the length the refresh asked for.
+        status_url = f"{status_url}?{urlencode({'limit': limit})}"
+    payload["status_url"] = request.build_absolute_uri(status_url)
+    return payload
+
+
+def _parse_limit(value) -> Optional[int]:
+    try:
+        return int(value) if value is not None else 12
+    except (TypeError, ValueError):
+        return None
+
+
+def _invalid_limit() -> Response:
+    return Response(
+        {"detail": "Le paramètre limit doit être un entier."},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
 
 
 class FeedCarouselRefreshView(APIView):
+    """GET serves a theme's carousel (the feed page loads each one lazily); POST queues a refresh."""
+
     permission_classes = [permissions.IsAuthenticated]
 
-    def post(self, request, slug: str, *args, **kwargs) -> Response:
-        limit = request.data.get("limit")
-        try:
-            limit_value = int(limit) if limit is not None else 12
-        except (TypeError, ValueError):
-            return Response(
-                {"detail": "Le paramètre limit doit être un entier."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+    def get(self, request, slug: str, *args, **kwargs) -> Response:
+        limit_value = _parse_limit(request.query_params.get("limit"))
+        if limit_value is None:
+            return _invalid_limit()
 
         carousel = build_feed_carousel(
             slug,
             user=request.user,
             limit=limit_value,
-            language=request.data.get("language"),
+            language=request.query_params.get("language") or getattr(request, "LANGUAGE_CODE", None),
+            deadline=feed_render_deadline(),
         )
         if carousel is None:
             return Response(
@@ -43,3 +94,118 @@ class FeedCarouselRefreshView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
         return Response({"carousel": carousel})
+
+    def post(self, request, slug: str, *args, **kwargs) -> Response:
+        limit_value = _parse_limit(request.data.get("limit"))
+        if limit_value is None:
+            return _invalid_limit()
+
+        try:
+            outcome = enqueue_feed_carousel_refresh(
+                slug,
+                user=request.user,
+                limit=limit_value,
+                language=request.data.get("language"),
+            )
+        except GenerationJobConflict as exc:
+            return Response(
+                {
+                    "detail": "Une génération avec d'autres paramètres est déjà en attente pour ce thème.",
+                    "job": _job_payload(slug, exc.job, request),
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        if outcome is None:
+            return Response(
+                {"detail": "Thème introuvable."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if "carousel" in outcome:
+            return Response({"carousel": outcome["carousel"]})
+
+        job_payload = _job_payload(slug, outcome["job"], request, limit=limit_value)
+        return Response(
+            {"job": job_payload},
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": job_payload["status_url"]},
+        )
+
+
+class FeedCarouselJobStatusView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, slug: str, job_id: int, *args, **kwargs) -> Response:
+        limit_value = _parse_limit(request.query_params.get("limit"))
+        if limit_value is None:
+            return _invalid_limit()
+
+        # Theme slugs are their identity tag's slug; another theme's job is not found here.
+        job = get_object_or_404(
+            MediaListGenerationJob.objects.select_related("media_list__source_keyword"),
+            pk=job_id,
+            tag__slug=slug,
+        )
+        body = {"job": _job_payload(slug, job, request)}
+        if job.is_finished:
+            body["carousel"] = build_job_carousel(slug, job, user=request.user, limit=limit_value)
+        return Response(body)
+
+
+def _sse_event(event: str, data: Any, *, event_id: Optional[str] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, cls=DjangoJSONEncoder)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets clients negotiate ``text/event-stream``; errors become one ``error`` event."""
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> str:
+        return _sse_event("error", data)
+
+
+def _feed_events(carousels: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    started = time.monotonic()
+    count = fallbacks = 0
+    for carousel in carousels:
+        count += 1
+        fallbacks += bool(carousel.get("fallback"))
+        yield _sse_event("carousel", carousel, event_id=carousel["theme"])
+    yield _sse_event(
+        "summary",
+        {
+            "carousels": count,
+            "fallbacks": fallbacks,
+            "elapsed_ms": round((time.monotonic() - started) * 1000),
+        },
+    )
+
+
+class FeedStreamView(APIView):
+    """Server-Sent Events: one ``carousel`` event per theme as it completes, then a ``summary``."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    def get(self, request, *args, **kwargs) -> StreamingHttpResponse:
+        limit_value = _parse_limit(request.query_params.get("limit"))
+        if limit_value is None:
+            return _invalid_limit()
+
+        carousels = iter_feed_carousels(
+            request.user,
+            limit=limit_value,
+            language=request.query_params.get("language") or getattr(request, "LANGUAGE_CODE", None),
+            deadline=feed_render_deadline(),
+        )
+        response = StreamingHttpResponse(_feed_events(carousels), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Keep nginx from buffering the stream until it ends.
+        response["X-Accel-Buffering"] = "no"
+        return response
@@ -1,7 +1,16 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class FrontendConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "frontend"
     verbose_name = "Public Frontend"
+
+    def ready(self) -> None:
+        from media_catalog.models import IdentityTag
+
+        from .themes import invalidate_theme_registry
+
+        post_save.connect(invalidate_theme_registry, sender=IdentityTag, dispatch_uid="frontend-theme-registry-save")
+        post_delete.connect(invalidate_theme_registry, sender=IdentityTag, dispatch_uid="frontend-theme-registry-delete")
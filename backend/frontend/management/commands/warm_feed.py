@@ -0,0 +1,163 @@
+"""Pre-generate feed carousels (and theme pages) before users hit them."""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from frontend.services import build_feed_carousel, build_theme_detail, get_feed_themes
+
+THEME_DETAIL_LIMIT = 36
+
+
+def _warm_theme(
+    theme_slug: str,
+    *,
+    user,
+    languages: List[str],
+    include_details: bool,
+    deadline: float,
+) -> List[Tuple[str, str, Optional[bool], float]]:
+    """Warm one theme for every language; returns (language, kind, fallback, seconds).
+
+    Each language has its own generated list. With ``include_details`` the theme
+    page runs first: its longer list is then fresh for the carousel, which reads
+    it instead of regenerating a shorter one over it. ``fallback`` is None when
+    the deadline skipped the step.
+    """
+
+    results: List[Tuple[str, str, Optional[bool], float]] = []
+    try:
+        for language in languages:
+            steps = [("carousel", build_feed_carousel, {})]
+            if include_details:
+                steps.insert(0, ("detail", build_theme_detail, {"limit": THEME_DETAIL_LIMIT}))
+            for kind, builder, extra in steps:
+                if time.monotonic() >= deadline:
+                    results.append((language, kind, None, 0.0))
+                    continue
+                started = time.monotonic()
+                payload = builder(theme_slug, user=user, language=language, **extra)
+                fallback = bool(payload.get("fallback")) if payload else True
+                results.append((language, kind, fallback, time.monotonic() - started))
+    finally:
+        # Worker threads open their own DB connection; release it.
+        connection.close()
+    return results
+
+
+class Command(BaseCommand):
+    help = "Pre-generate every FEED_THEMES carousel (optionally theme pages) for the given languages."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help="TMDb language to warm (repeatable). Defaults to TMDB_CONFIG['LANGUAGE'].",
+        )
+        parser.add_argument(
+            "--details",
+            action="store_true",
+            help=f"Also build each theme detail page (limit={THEME_DETAIL_LIMIT}).",
+        )
+        parser.add_argument("--workers", type=int, default=4, help="Concurrent themes (default: 4).")
+        parser.add_argument(
+            "--budget",
+            type=float,
+            default=300.0,
+            help="Total time budget in seconds; remaining work is skipped once spent (default: 300).",
+        )
+        parser.add_argument(
+            "--owner",
+            help="Username owning newly created lists. Defaults to the first superuser.",
+        )
+
+    def _resolve_owner(self, username: Optional[str]):
+        User = get_user_model()
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist as exc:
+                raise CommandError(f"Unknown user '{username}'") from exc
+        owner = User.objects.filter(is_superuser=True).order_by("pk").first()
+        if owner is None:
+            raise CommandError("No superuser found; pass --owner.")
+        return owner
+
+    def handle(self, *args, **options) -> None:
+        if options["workers"] <= 0:
+            raise CommandError("--workers must be positive")
+
+        owner = self._resolve_owner(options.get("owner"))
+        languages = options.get("languages") or [getattr(settings, "TMDB_CONFIG", {}).get("LANGUAGE", "en-US")]
+        themes = [theme["slug"] for theme in get_feed_themes()]
+        steps_per_theme = len(languages) * (2 if options["details"] else 1)
+        total = len(themes) * steps_per_theme
+
+        started = time.monotonic()
+        deadline = started + options["budget"]
+        done = 0
+        counts: Dict[str, int] = {"fresh": 0, "fallback": 0, "skipped": 0}
+
+        self.stdout.write(
+            f"Warming {len(themes)} themes × {len(languages)} language(s) "
+            f"with {options['workers']} worker(s), budget {options['budget']:.0f}s…"
+        )
+
+        with ThreadPoolExecutor(max_workers=options["workers"], thread_name_prefix="warm-feed") as executor:
+            pending = {
+                executor.submit(
+                    _warm_theme,
+                    slug,
+                    user=owner,
+                    languages=languages,
+                    include_details=options["details"],
+                    deadline=deadline,
+                ): slug
+                for slug in themes
+            }
+            while pending:
+                remaining = deadline - time.monotonic()
+                finished, _ = wait(pending, timeout=max(remaining, 0), return_when=FIRST_COMPLETED)
+                if not finished:
+                    # Budget spent: drop queued themes, let running ones hit their own deadline check.
+                    for future in pending:
+                        if future.cancel():
+                            done += steps_per_theme
+                            counts["skipped"] += steps_per_theme
+                            self.stdout.write(self.style.WARNING(f"[{done}/{total}] {pending[future]}: skipped (budget)"))
+                    pending = {future: slug for future, slug in pending.items() if not future.cancelled()}
+                    finished, _ = wait(pending)
+                for future in finished:
+                    slug = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as exc:  # noqa: BLE001 - report and keep warming the rest
+                        done += steps_per_theme
+                        counts["skipped"] += steps_per_theme
+                        self.stdout.write(self.style.ERROR(f"[{done}/{total}] {slug}: failed ({exc})"))
+                        continue
+                    for language, kind, fallback, seconds in results:
+                        done += 1
+                        if fallback is None:
+                            counts["skipped"] += 1
+                            self.stdout.write(self.style.WARNING(f"[{done}/{total}] {slug} {language} {kind}: skipped (budget)"))
+                        elif fallback:
+                            counts["fallback"] += 1
+                            self.stdout.write(self.style.WARNING(f"[{done}/{total}] {slug} {language} {kind}: fallback ({seconds:.1f}s)"))
+                        else:
+                            counts["fresh"] += 1
+                            self.stdout.write(f"[{done}/{total}] {slug} {language} {kind}: ok ({seconds:.1f}s)")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Feed warm-up finished in {elapsed:.1f}s: {counts['fresh']} fresh, "
+                f"{counts['fallback']} fallback, {counts['skipped']} skipped."
+            )
+        )
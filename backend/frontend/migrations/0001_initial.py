@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('media_catalog', '0010_identity_tag_keyword_yield'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThemeDetailSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('theme', models.SlugField(max_length=64)),
+                ('language', models.CharField(blank=True, max_length=16)),
+                ('payload', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('media_list', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='theme_snapshots', to='media_catalog.medialist')),
+                ('source_version', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='media_catalog.medialistversion')),
+            ],
+            options={
+                'ordering': ['theme', 'language'],
+                'constraints': [models.UniqueConstraint(fields=('theme', 'language'), name='unique_theme_detail_snapshot')],
+            },
+        ),
+    ]
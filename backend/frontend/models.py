@@ -0,0 +1,37 @@
+"""Materialized views of the feed pages."""
+
+from django.db import models
+
+from media_catalog.models import MediaList, MediaListVersion
+
+
+class ThemeDetailSnapshot(models.Model):
+    """Stored payload of a theme page for one language.
+
+    Valid while ``media_list`` still publishes ``source_version``; once a new
+    version is published the next view rebuilds it from that version.
+    """
+
+    theme = models.SlugField(max_length=64)
+    language = models.CharField(max_length=16, blank=True)
+    media_list = models.ForeignKey(MediaList, on_delete=models.CASCADE, related_name="theme_snapshots")
+    source_version = models.ForeignKey(
+        MediaListVersion,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    payload = models.JSONField(default=dict)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["theme", "language"]
+        constraints = [
+            models.UniqueConstraint(fields=["theme", "language"], name="unique_theme_detail_snapshot")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.theme} [{self.language or 'default'}]"
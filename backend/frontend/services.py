@@ -1,115 +1,49 @@
+import logging
+import math
 import random
-from typing import Any, Dict, Iterable, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from django.conf import settings
+from django.db import connection
+from django.db.models import F
+from django.utils import timezone
 
 from tmdb import TmdbClient
 from tmdb.exceptions import TmdbError
 from tmdb.services import sample_movie_by_keyword
 from tmdb.utils import get_tmdb_client
 
-from media_catalog.models import IdentityTag, MediaList
-from media_catalog.services import generate_media_list_for_identity
+from media_catalog.models import MediaList, MediaListGenerationJob
+from media_catalog.services import (
+    IdentityListRequest,
+    enqueue_media_list_generation,
+    generate_media_list_for_identity,
+    generate_media_lists_for_identities,
+)
+from media_catalog.services.generator import media_list_slug_for_tag
+from media_catalog.services.masks import (
+    FORMAT_LONG,
+    FORMAT_SHORT,
+    FORMAT_UNKNOWN_RUNTIME,
+    format_mask,
+    genre_bits,
+    genre_mask,
+)
+from media_catalog.services.triggers import trigger_mask_for_user
 
 from .fallbacks import FALLBACK_QUEER_MOVIES, FALLBACK_THEME_LISTS
+from .models import ThemeDetailSnapshot
+from .teasers import TeaserPool
+from .themes import FEED_THEMES, get_theme_registry
+
+LOGGER = logging.getLogger(__name__)
 
 POSTER_BASE_URL = "https://image.tmdb.org/t/p/w500"
 BACKDROP_BASE_URL = "https://image.tmdb.org/t/p/w780"
 
-FEED_THEMES: List[Dict[str, str]] = [
-    {
-        "slug": "trans-joy",
-        "title": "Transidentités",
-        "fallback": "transidentites",
-        "description": "Films et séries centrés sur les expériences et les joies trans.",
-    },
-    {
-        "slug": "lesbian-love",
-        "title": "Lesbiennes",
-        "fallback": "lesbiennes",
-        "description": "Histoires lesbiennes, romances, drames, docs et plus.",
-    },
-    {
-        "slug": "gay-celebration",
-        "title": "Gays",
-        "fallback": "queers",
-        "description": "Créations gays : pride, mémoire, fêtes, luttes et amours.",
-    },
-    {
-        "slug": "queer-joy",
-        "title": "Queers",
-        "fallback": "queers",
-        "description": "Panorama queer : joyeuses galaxies, club kids, ballrooms, résistance.",
-    },
-    {
-        "slug": "lgbt-history",
-        "title": "LGBTQIA+",
-        "fallback": "queers",
-        "description": "Archives et imaginaires LGBTQIA+ intergénérationnels.",
-    },
-    {
-        "slug": "non-binary",
-        "title": "Non-binaire",
-        "fallback": "transidentites",
-        "description": "Identités non-binaires, fluides et genderqueer à l’écran.",
-    },
-    {
-        "slug": "gender-studies",
-        "title": "Théories du Genre",
-        "fallback": "queers",
-        "description": "Essais, docs et fictions qui bousculent les cadres du genre.",
-    },
-    {
-        "slug": "radical-feminism",
-        "title": "Féminisme radical",
-        "fallback": "lesbiennes",
-        "description": "Héritages et combats transféministes décoloniaux.",
-    },
-    {
-        "slug": "intersex",
-        "title": "Intersex",
-        "fallback": "transidentites",
-        "description": "Récits intersexes : lutte, douceur et autodétermination.",
-    },
-    {
-        "slug": "asexual",
-        "title": "Asexuel",
-        "fallback": "queers",
-        "description": "Narrations ace et aromantiques, des contes aux docs.",
-    },
-    {
-        "slug": "tds-sex-work",
-        "title": "Travail du sexe",
-        "fallback": "queers",
-        "description": "Travail du sexe, mutual aid, luttes anti-répression.",
-    },
-    {
-        "slug": "bisexual",
-        "title": "Bi",
-        "fallback": "queers",
-        "description": "Identités bisexuelles, pansexuelles et plurisexuelles à l'écran.",
-    },
-    {
-        "slug": "pansexual",
-        "title": "Pan",
-        "fallback": "queers",
-        "description": "Narrations pansexuelles et polyromantiques, amours sans frontières.",
-    },
-    {
-        "slug": "disability-joy",
-        "title": "Joies handies",
-        "fallback": "queers",
-        "description": "Récits handis, mad pride, neurodivergence et fierté crip.",
-    },
-    {
-        "slug": "bipoc-lgbtq",
-        "title": "LGBTQ+ racisé·es",
-        "fallback": "queers",
-        "description": "Expériences LGBTQ+ racisées, décoloniales et intersectionnelles.",
-    },
-]
-
-
 def _normalize_language(language: Optional[str]) -> Optional[str]:
     if not language:
         return None
@@ -121,27 +55,17 @@ def _normalize_language(language: Optional[str]) -> Optional[str]:
 
 
 GENRE_CATEGORY_MAP: List[Dict[str, Any]] = [
-    {"title": "Horreur & frissons", "match": {"horror"}},
-    {"title": "Comédies et feel-good", "match": {"comedy"}},
-    {"title": "Documentaires & essais", "match": {"documentary"}},
-    {"title": "Science-fiction & fantastique", "match": {"science fiction", "fantasy"}},
-    {"title": "Romances & drames", "match": {"romance", "drama"}},
+    {"title": "Horreur & frissons", "mask": genre_bits("horror")},
+    {"title": "Comédies et feel-good", "mask": genre_bits("comedy")},
+    {"title": "Documentaires & essais", "mask": genre_bits("documentary")},
+    {"title": "Science-fiction & fantastique", "mask": genre_bits("science fiction", "fantasy")},
+    {"title": "Romances & drames", "mask": genre_bits("romance", "drama")},
 ]
 
-def _is_short_form(item: Dict[str, Any]) -> bool:
-    runtime = item.get("runtime")
-    return isinstance(runtime, (int, float)) and runtime <= 45
-
-
-def _is_long_form(item: Dict[str, Any]) -> bool:
-    runtime = item.get("runtime")
-    return isinstance(runtime, (int, float)) and runtime > 45
-
-
 FORMAT_RULES: List[Dict[str, Any]] = [
-    {"title": "Courts métrages", "predicate": _is_short_form},
-    {"title": "Longs métrages", "predicate": _is_long_form},
-    {"title": "Durée inconnue", "predicate": lambda item: item.get("runtime") in (None, "", 0)},
+    {"title": "Courts métrages", "mask": FORMAT_SHORT},
+    {"title": "Longs métrages", "mask": FORMAT_LONG},
+    {"title": "Durée inconnue", "mask": FORMAT_UNKNOWN_RUNTIME},
 ]
 
 
@@ -213,6 +137,23 @@ def _fallback_movie() -> Optional[Dict[str, Any]]:
     return random.choice(FALLBACK_QUEER_MOVIES)
 
 
+TEASER_KEYWORD = "Queer"
+TEASER_APPEND = "credits,external_ids"
+
+
+def _normalize_teaser(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    normalized = normalize_movie_payload(payload)
+    if not normalized:
+        return None
+    if not normalized.get("cast"):
+        summary = payload.get("summary", {}) or {}
+        cast = summary.get("cast") or []
+        normalized["cast"] = [person.get("name") for person in cast[:4] if person.get("name")]
+    if normalized.get("directors") is None:
+        normalized["directors"] = []
+    return normalized
+
+
 def fetch_random_queer_movie() -> Optional[Dict[str, Any]]:
     client: Optional[TmdbClient]
     try:
@@ -227,23 +168,48 @@ def fetch_random_queer_movie() -> Optional[Dict[str, Any]]:
         with client:
             payload = sample_movie_by_keyword(
                 client,
-                "Queer",
-                append_to_response="credits,external_ids",
+                TEASER_KEYWORD,
+                append_to_response=TEASER_APPEND,
             )
     except TmdbError:
         return _fallback_movie()
 
-    normalized = normalize_movie_payload(payload)
-    if normalized:
-        if not normalized.get("cast"):
-            summary = payload.get("summary", {}) or {}
-            cast = summary.get("cast") or []
-            normalized["cast"] = [person.get("name") for person in cast[:4] if person.get("name")]
-        if normalized.get("directors") is None:
-            normalized["directors"] = []
-        return normalized
+    return _normalize_teaser(payload) or _fallback_movie()
+
+
+def _fetch_teaser_batch(count: int) -> List[Dict[str, Any]]:
+    """Sample ``count`` films over one TMDb client for the teaser pool."""
+
+    try:
+        client = get_tmdb_client()
+    except ValueError:
+        return []
+    if not client:
+        return []
+
+    films: List[Dict[str, Any]] = []
+    with client:
+        for _ in range(count):
+            try:
+                payload = sample_movie_by_keyword(client, TEASER_KEYWORD, append_to_response=TEASER_APPEND)
+            except TmdbError:
+                break
+            normalized = _normalize_teaser(payload)
+            if normalized:
+                films.append(normalized)
+    return films
 
-    return _fallback_movie()
+
+TEASER_POOL = TeaserPool(_fetch_teaser_batch)
+
+
+def draw_random_queer_movie() -> Optional[Dict[str, Any]]:
+    """Pick the landing-page film from the pre-fetched pool without calling TMDb.
+
+    Falls back to the curated list while the pool is still filling.
+    """
+
+    return TEASER_POOL.draw() or _fallback_movie()
 
 
 def _build_backdrop_url(path: Optional[str]) -> Optional[str]:
@@ -380,6 +346,9 @@ def _serialize_media_item(media_item) -> Dict[str, Any]:
         "watch": watch_info,
         "similar": similar,
         "media_type": media_item.media_type,
+        "genre_mask": media_item.genre_mask,
+        "format_mask": media_item.format_mask,
+        "trigger_mask": media_item.trigger_mask,
         "metadata": {
             "summary": summary,
             "details": details,
@@ -387,11 +356,24 @@ def _serialize_media_item(media_item) -> Dict[str, Any]:
     }
 
 
-def _serialize_media_list(media_list: MediaList, *, title: str, theme_slug: str) -> Dict[str, Any]:
-    items = [
-        _serialize_media_item(item.media_item)
-        for item in media_list.items.select_related("media_item").order_by("position")
-    ]
+def _serialize_media_list(
+    media_list: MediaList,
+    *,
+    title: str,
+    theme_slug: str,
+    trigger_mask: int = 0,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Serialize the first ``limit`` published items, skipping those flagged by ``trigger_mask``."""
+
+    entries = media_list.current_items()
+    if trigger_mask:
+        entries = entries.annotate(trigger_hits=F("media_item__trigger_mask").bitand(trigger_mask)).filter(
+            trigger_hits=0
+        )
+    if limit is not None:
+        entries = entries[:limit]
+    items = [_serialize_media_item(item.media_item) for item in entries]
     return {
         "theme": theme_slug,
         "slug": media_list.slug,
@@ -402,7 +384,7 @@ def _serialize_media_list(media_list: MediaList, *, title: str, theme_slug: str)
     }
 
 
-def _fallback_carousel(theme: Dict[str, str]) -> Dict[str, Any]:
+def _fallback_carousel(theme: Mapping[str, str]) -> Dict[str, Any]:
     fallback_key = theme.get("fallback") or theme["slug"]
     payload = FALLBACK_THEME_LISTS.get(fallback_key, {"items": []})
     items = payload.get("items", [])
@@ -435,6 +417,248 @@ def _fallback_carousel(theme: Dict[str, str]) -> Dict[str, Any]:
     }
 
 
+# Generation that outlives a request's deadline finishes here and warms the next view.
+FEED_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="feed-build")
+
+
+def _close_connection_after(func: Callable[..., Any], **kwargs: Any) -> Any:
+    try:
+        return func(**kwargs)
+    finally:
+        connection.close()
+
+
+def _submit_background(func: Callable[..., Any], **kwargs: Any) -> Future:
+    return FEED_EXECUTOR.submit(_close_connection_after, func, **kwargs)
+
+
+def _published_lists(tags: Iterable[Any], language: Optional[str]) -> Dict[int, MediaList]:
+    """Last published ``language`` list of each tag, keyed by tag id, in one query."""
+
+    tag_ids = {media_list_slug_for_tag(tag, language): tag.pk for tag in tags}
+    return {
+        tag_ids[media_list.slug]: media_list
+        for media_list in MediaList.objects.filter(slug__in=tag_ids).select_related(
+            "source_keyword", "current_version"
+        )
+    }
+
+
+def feed_render_deadline() -> Optional[float]:
+    """Per-request generation budget in seconds; None when disabled (0)."""
+
+    return getattr(settings, "FEED_RENDER_DEADLINE", None) or None
+
+
+def _is_fresh(media_list: Optional[MediaList], limit: int) -> bool:
+    """Whether reads can serve ``media_list`` without regenerating it."""
+
+    if media_list is None or media_list.current_version is None or media_list.item_count < limit:
+        return False
+    max_age = timedelta(seconds=getattr(settings, "FEED_LIST_MAX_AGE", 0))
+    return media_list.current_version.created_at >= timezone.now() - max_age
+
+
+def _generate_theme_list(tag, *, deadline: Optional[float], **generation: Any) -> Optional[MediaList]:
+    """Generate ``tag``'s list, or None when TMDb fails.
+
+    Past ``deadline`` seconds, returns the last published list (or None) and
+    lets generation finish in the background.
+    """
+
+    try:
+        if deadline is None:
+            return generate_media_list_for_identity(tag=tag, **generation)
+        future = _submit_background(generate_media_list_for_identity, tag=tag, **generation)
+        return future.result(timeout=deadline)
+    except FutureTimeoutError:
+        LOGGER.warning("Theme %s exceeded %.1fs; serving its published list", tag.slug, deadline)
+        return _published_lists([tag], generation.get("language")).get(tag.pk)
+    except TmdbError:
+        return None
+
+
+def _generate_feed_lists(
+    requests: Sequence[IdentityListRequest],
+    *,
+    user,
+    limit: int,
+    language: Optional[str],
+) -> Dict[int, MediaList]:
+    try:
+        return generate_media_lists_for_identities(
+            requests,
+            owner=user,
+            limit=limit,
+            include_adult=False,
+            language=language,
+            visibility=MediaList.VISIBILITY_UNLISTED,
+        )
+    except TmdbError:
+        return {}
+
+
+# Feed plans run apart from FEED_EXECUTOR, whose workers wait on them.
+FEED_PLAN_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="feed-plan")
+
+# In-flight plan per (language, generation limit): the tag ids it covers and its future.
+_FEED_PLANS: Dict[Tuple[Optional[str], int], Tuple[frozenset, Future]] = {}
+_FEED_PLANS_LOCK = threading.Lock()
+
+
+def _stale_feed_requests(*, limit: int, language: Optional[str]) -> List[IdentityListRequest]:
+    """One request per feed theme whose published list is not fresh for ``limit``."""
+
+    registry = get_theme_registry()
+    tagged = [(theme, tag) for theme in registry.themes if (tag := registry.tag_for(theme["slug"])) is not None]
+    published = _published_lists((tag for _, tag in tagged), language)
+    return [
+        IdentityListRequest(tag=tag, title=theme["title"], description=_theme_list_description(theme))
+        for theme, tag in tagged
+        if not _is_fresh(published.get(tag.pk), limit)
+    ]
+
+
+def _forget_feed_plan(key: Tuple[Optional[str], int], future: Future) -> None:
+    with _FEED_PLANS_LOCK:
+        if key in _FEED_PLANS and _FEED_PLANS[key][1] is future:
+            del _FEED_PLANS[key]
+
+
+def _join_feed_plan(
+    tag,
+    *,
+    user,
+    limit: int,
+    language: Optional[str],
+    background: bool,
+) -> Optional[Future]:
+    """The in-flight feed plan covering ``tag``, started over every stale theme if none runs.
+
+    Every theme read in a feed build therefore shares one plan, and movies that
+    several themes discover are fetched once. ``tag`` None joins whichever plan
+    runs. Returns None when a plan runs that does not cover ``tag``. Without
+    ``background`` a new plan runs in the calling thread before returning.
+    """
+
+    key = (language, limit)
+    with _FEED_PLANS_LOCK:
+        current = _FEED_PLANS.get(key)
+        if current is not None:
+            tag_ids, future = current
+            return future if tag is None or tag.pk in tag_ids else None
+        requests = _stale_feed_requests(limit=limit, language=language)
+        if tag is not None and all(request.tag.pk != tag.pk for request in requests):
+            requests.append(IdentityListRequest(tag=tag))
+        if background:
+            future = FEED_PLAN_EXECUTOR.submit(
+                _close_connection_after,
+                _generate_feed_lists,
+                requests=requests,
+                user=user,
+                limit=limit,
+                language=language,
+            )
+        else:
+            future = Future()
+            future.set_running_or_notify_cancel()
+        _FEED_PLANS[key] = (frozenset(request.tag.pk for request in requests), future)
+
+    if background:
+        future.add_done_callback(lambda done: _forget_feed_plan(key, done))
+        return future
+    try:
+        future.set_result(_generate_feed_lists(requests, user=user, limit=limit, language=language))
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        _forget_feed_plan(key, future)
+    return future
+
+
+def _planned_theme_list(
+    theme: Mapping[str, str],
+    tag,
+    *,
+    user,
+    limit: int,
+    language: Optional[str],
+    deadline: Optional[float],
+) -> Optional[MediaList]:
+    """``tag``'s list from the shared feed plan; None when the plan fails it or runs past ``deadline``."""
+
+    future = _join_feed_plan(tag, user=user, limit=limit, language=language, background=deadline is not None)
+    if future is None:
+        return _generate_theme_list(
+            tag,
+            deadline=deadline,
+            owner=user,
+            limit=limit,
+            include_adult=False,
+            language=language,
+            visibility=MediaList.VISIBILITY_UNLISTED,
+            title=theme["title"],
+            description=_theme_list_description(theme),
+        )
+    try:
+        return future.result(timeout=deadline).get(tag.pk)
+    except FutureTimeoutError:
+        LOGGER.warning("Feed plan for %s exceeded %.1fs; serving its published list", tag.slug, deadline)
+        return None
+
+
+def _theme_list(
+    theme: Mapping[str, str],
+    tag,
+    *,
+    user,
+    limit: int,
+    language: Optional[str],
+    deadline: Optional[float],
+    planned: bool = False,
+) -> Optional[MediaList]:
+    """``tag``'s published list while fresh and holding ``limit`` items, else a regenerated one.
+
+    ``planned`` regenerates through the shared feed plan rather than alone.
+    When TMDb fails, a stale or short published list still beats the fallback.
+    """
+
+    published = _published_lists([tag], language).get(tag.pk)
+    if _is_fresh(published, limit):
+        return published
+    if planned:
+        media_list = _planned_theme_list(theme, tag, user=user, limit=limit, language=language, deadline=deadline)
+    else:
+        media_list = _generate_theme_list(
+            tag,
+            deadline=deadline,
+            owner=user,
+            limit=limit,
+            include_adult=False,
+            language=language,
+            visibility=MediaList.VISIBILITY_UNLISTED,
+            title=theme["title"],
+            description=_theme_list_description(theme),
+        )
+    if media_list is None and published is not None and published.current_version_id is not None:
+        return published
+    return media_list
+
+
+def _theme_list_description(theme: Mapping[str, str]) -> str:
+    return f"Sélection de films et séries autour de {theme['title'].lower()}"
+
+
+# Extra candidates generated for users filtering trigger topics, so dropping
+# flagged items still leaves full carousels.
+TRIGGER_OVERFETCH_RATIO = 1.5
+
+
+def _generation_limit(limit: int, trigger_mask: int) -> int:
+    return math.ceil(limit * TRIGGER_OVERFETCH_RATIO) if trigger_mask else limit
+
+
 def get_feed_themes() -> List[Dict[str, str]]:
     return FEED_THEMES
 
@@ -445,74 +669,255 @@ def build_feed_carousel(
     user,
     limit: int = 12,
     language: Optional[str] = None,
+    deadline: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
-    theme = next((entry for entry in FEED_THEMES if entry["slug"] == theme_slug), None)
+    """One theme's carousel, read from its published list while that list is fresh.
+
+    The list is regenerated only when it is missing, too short for ``limit`` or
+    older than ``FEED_LIST_MAX_AGE``, so feed views and theme pages (which need
+    more items) stop republishing it in turn. Regeneration joins the shared feed
+    plan, so the carousels of one feed build cost a single plan.
+    """
+
+    registry = get_theme_registry()
+    theme = registry.get(theme_slug)
     if not theme:
         return None
 
-    try:
-        tag = IdentityTag.objects.get(slug=theme_slug)
-    except IdentityTag.DoesNotExist:
+    tag = registry.tag_for(theme_slug)
+    if tag is None:
         return _fallback_carousel(theme)
 
     language = _normalize_language(language or getattr(settings, "TMDB_CONFIG", {}).get("LANGUAGE"))
+    trigger_mask = trigger_mask_for_user(user)
+
+    media_list = _theme_list(
+        theme,
+        tag,
+        user=user,
+        limit=_generation_limit(limit, trigger_mask),
+        language=language,
+        deadline=deadline,
+        planned=True,
+    )
+    if media_list is None:
+        return _fallback_carousel(theme)
 
-    try:
-        media_list = generate_media_list_for_identity(
-            tag=tag,
-            owner=user,
-            limit=limit,
-            include_adult=False,
-            language=language,
-            visibility=MediaList.VISIBILITY_UNLISTED,
-            title=theme["title"],
-            description=f"Sélection de films et séries autour de {theme['title'].lower()}",
-        )
-    except TmdbError:
+    return _serialize_media_list(
+        media_list,
+        title=theme["title"],
+        theme_slug=theme_slug,
+        trigger_mask=trigger_mask,
+        limit=limit,
+    )
+
+
+def enqueue_feed_carousel_refresh(
+    theme_slug: str,
+    *,
+    user,
+    limit: int = 12,
+    language: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Queue a background regeneration of a feed carousel.
+
+    Users filtering trigger topics get the same over-fetch as lazy reads. Returns
+    ``{"job": job}`` once queued, ``{"carousel": ...}`` when the theme has no
+    identity tag (nothing to generate, the fallback is served directly), or
+    ``None`` for unknown themes.
+    """
+
+    registry = get_theme_registry()
+    theme = registry.get(theme_slug)
+    if not theme:
+        return None
+
+    tag = registry.tag_for(theme_slug)
+    if tag is None:
+        return {"carousel": _fallback_carousel(theme)}
+
+    language = _normalize_language(language or getattr(settings, "TMDB_CONFIG", {}).get("LANGUAGE"))
+    job, _ = enqueue_media_list_generation(
+        tag=tag,
+        requested_by=user,
+        limit=_generation_limit(limit, trigger_mask_for_user(user)),
+        include_adult=False,
+        language=language,
+        visibility=MediaList.VISIBILITY_UNLISTED,
+        title=theme["title"],
+        description=_theme_list_description(theme),
+    )
+    return {"job": job}
+
+
+def build_job_carousel(
+    theme_slug: str,
+    job: MediaListGenerationJob,
+    *,
+    user,
+    limit: int = 12,
+) -> Optional[Dict[str, Any]]:
+    """Serialize, for ``user``, the carousel produced by a finished feed refresh job."""
+
+    theme = get_theme_registry().get(theme_slug)
+    if not theme:
+        return None
+    if job.status == MediaListGenerationJob.STATUS_FAILED:
         return _fallback_carousel(theme)
+    if job.status != MediaListGenerationJob.STATUS_SUCCEEDED or not job.media_list:
+        return None
+    return _serialize_media_list(
+        job.media_list,
+        title=theme["title"],
+        theme_slug=theme_slug,
+        trigger_mask=trigger_mask_for_user(user),
+        limit=limit,
+    )
 
-    return _serialize_media_list(media_list, title=theme["title"], theme_slug=theme_slug)
 
+def build_feed_carousels(
+    user,
+    *,
+    limit: int = 12,
+    language: Optional[str] = None,
+    deadline: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Build every feed carousel from one shared generation plan.
+
+    Fresh published lists are served as-is; the stale ones are regenerated by
+    the in-flight feed plan, which fetches and stores movies that several themes
+    discover once. Themes without a tag, or whose generation fails, get their
+    fallback list. Past ``deadline`` seconds, themes render from their last
+    published list while the plan keeps running to warm the next view.
+    """
+
+    registry = get_theme_registry()
+    language = _normalize_language(language or getattr(settings, "TMDB_CONFIG", {}).get("LANGUAGE"))
+    trigger_mask = trigger_mask_for_user(user)
+    generation_limit = _generation_limit(limit, trigger_mask)
+
+    tags = {theme["slug"]: registry.tag_for(theme["slug"]) for theme in registry.themes}
+    media_lists = _published_lists((tag for tag in tags.values() if tag is not None), language)
+    if not all(_is_fresh(media_lists.get(tag.pk), generation_limit) for tag in tags.values() if tag is not None):
+        future = _join_feed_plan(
+            None, user=user, limit=generation_limit, language=language, background=deadline is not None
+        )
+        try:
+            media_lists.update(future.result(timeout=deadline))
+        except FutureTimeoutError:
+            LOGGER.warning("Feed build exceeded %.1fs; serving published lists", deadline)
 
-def build_feed_carousels(user, *, limit: int = 12, language: Optional[str] = None) -> List[Dict[str, Any]]:
     carousels: List[Dict[str, Any]] = []
-    for theme in FEED_THEMES:
-        data = build_feed_carousel(theme["slug"], user=user, limit=limit, language=language)
-        if data:
-            carousels.append(data)
+    for theme in registry.themes:
+        tag = tags[theme["slug"]]
+        media_list = media_lists.get(tag.pk) if tag is not None else None
+        carousels.append(_theme_carousel(theme, media_list, trigger_mask=trigger_mask, limit=limit))
     return carousels
 
 
-def _item_key(item: Dict[str, Any]) -> str:
-    return str(item.get("tmdb_id") or item.get("id") or item.get("title") or id(item))
+def iter_feed_carousels(
+    user,
+    *,
+    limit: int = 12,
+    language: Optional[str] = None,
+    deadline: Optional[float] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield every feed carousel as soon as it is ready, in completion order.
+
+    Each theme goes through ``build_feed_carousel`` on ``FEED_EXECUTOR``, so the
+    stale ones share one feed plan and fresh ones stream at once. Past
+    ``deadline`` seconds the remaining themes are yielded from their last
+    published list, or fallback, while their generation keeps running.
+    """
+
+    registry = get_theme_registry()
+    futures = {
+        _submit_background(
+            build_feed_carousel,
+            theme_slug=theme["slug"],
+            user=user,
+            limit=limit,
+            language=language,
+        ): theme
+        for theme in registry.themes
+    }
+    pending = set(futures)
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            pending.discard(future)
+            theme = futures[future]
+            try:
+                carousel = future.result()
+            except Exception:  # noqa: BLE001 - one broken theme must not end the stream
+                LOGGER.exception("Feed carousel %s failed", theme["slug"])
+                carousel = None
+            yield carousel or _fallback_carousel(theme)
+    except FutureTimeoutError:
+        LOGGER.warning("Feed stream exceeded %.1fs; serving published lists", deadline)
+        trigger_mask = trigger_mask_for_user(user)
+        remaining = [theme for future, theme in futures.items() if future in pending]
+        tags = {theme["slug"]: registry.tag_for(theme["slug"]) for theme in remaining}
+        language = _normalize_language(language or getattr(settings, "TMDB_CONFIG", {}).get("LANGUAGE"))
+        published = _published_lists((tag for tag in tags.values() if tag is not None), language)
+        for theme in remaining:
+            tag = tags[theme["slug"]]
+            media_list = published.get(tag.pk) if tag is not None else None
+            yield _theme_carousel(theme, media_list, trigger_mask=trigger_mask, limit=limit)
+
+
+def _theme_carousel(
+    theme: Mapping[str, str],
+    media_list: Optional[MediaList],
+    *,
+    trigger_mask: int,
+    limit: int,
+) -> Dict[str, Any]:
+    if media_list is None:
+        return _fallback_carousel(theme)
+    return _serialize_media_list(
+        media_list,
+        title=theme["title"],
+        theme_slug=theme["slug"],
+        trigger_mask=trigger_mask,
+        limit=limit,
+    )
 
 
 def _build_sections(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    sections: List[Dict[str, Any]] = []
-    covered: set[str] = set()
-
-    for rule in FORMAT_RULES:
-        predicate = rule["predicate"]
-        bucket = [item for item in items if predicate(item)]
-        if bucket:
-            sections.append({"title": rule["title"], "items": bucket})
-            covered.update(_item_key(item) for item in bucket)
-
-    for genre_map in GENRE_CATEGORY_MAP:
-        match_set = {token.lower() for token in genre_map["match"]}
-        bucket = [
-            item
-            for item in items
-            if any((genre or "").lower() in match_set for genre in item.get("genres", []))
-        ]
-        if bucket:
-            sections.append({"title": genre_map["title"], "items": bucket})
-            covered.update(_item_key(item) for item in bucket)
-
-    remaining = [item for item in items if _item_key(item) not in covered]
+    """Bucket items into format then genre sections in a single pass.
+
+    Catalog items carry masks computed at ingest. Every item has a format bit,
+    so a zero ``format_mask`` means none were computed (fallback data, rows not
+    yet backfilled) and the masks are derived from the payload instead.
+    """
+
+    rules = FORMAT_RULES + GENRE_CATEGORY_MAP
+    buckets: List[List[Dict[str, Any]]] = [[] for _ in rules]
+    remaining: List[Dict[str, Any]] = []
+    format_count = len(FORMAT_RULES)
+
+    for item in items:
+        formats = item.get("format_mask")
+        if formats:
+            genres = item.get("genre_mask") or 0
+        else:
+            formats = format_mask(item.get("runtime"))
+            genres = genre_mask(item.get("genres") or ())
+        matched = False
+        for index, rule in enumerate(rules):
+            if (formats if index < format_count else genres) & rule["mask"]:
+                buckets[index].append(item)
+                matched = True
+        if not matched:
+            remaining.append(item)
+
+    sections = [
+        {"title": rule["title"], "items": bucket}
+        for rule, bucket in zip(rules, buckets)
+        if bucket
+    ]
     if remaining:
         sections.append({"title": "Autres essentiels", "items": remaining})
-
     return sections
 
 
@@ -530,7 +935,7 @@ def _select_feature_item(items: List[Dict[str, Any]]) -> Optional[Dict[str, Any]
 
 def _build_detail_payload(
     *,
-    theme: Dict[str, str],
+    theme: Mapping[str, str],
     items: List[Dict[str, Any]],
     fallback: bool,
     media_list: Optional[MediaList],
@@ -553,43 +958,116 @@ def _build_detail_payload(
     }
 
 
+def _fresh_theme_snapshot(theme_slug: str, language: str) -> Optional[ThemeDetailSnapshot]:
+    """The stored page for ``theme_slug``, if its list still publishes the same version."""
+
+    return (
+        ThemeDetailSnapshot.objects.filter(
+            theme=theme_slug,
+            language=language,
+            source_version__isnull=False,
+            media_list__current_version=F("source_version"),
+        )
+        .only("payload")
+        .first()
+    )
+
+
+def _store_theme_snapshot(
+    theme_slug: str,
+    language: str,
+    media_list: MediaList,
+    payload: Dict[str, Any],
+) -> None:
+    if media_list.current_version_id is None:
+        # Hand-made lists have no version to validate the snapshot against.
+        return
+    ThemeDetailSnapshot.objects.update_or_create(
+        theme=theme_slug,
+        language=language,
+        defaults={
+            "media_list": media_list,
+            "source_version_id": media_list.current_version_id,
+            "payload": payload,
+        },
+    )
+
+
+def _hide_triggered_items(payload: Dict[str, Any], trigger_mask: int) -> Dict[str, Any]:
+    """Drop items flagged with any of ``trigger_mask``'s topics from a theme page."""
+
+    def visible(item: Dict[str, Any]) -> bool:
+        return not (item.get("trigger_mask") or 0) & trigger_mask
+
+    sections = []
+    kept: Dict[Any, Dict[str, Any]] = {}
+    for section in payload["sections"]:
+        items = [item for item in section["items"] if visible(item)]
+        if items:
+            sections.append({**section, "items": items})
+            for item in items:
+                kept.setdefault(item.get("id") or item.get("tmdb_id") or item.get("title"), item)
+
+    feature = payload["feature"]
+    if feature is not None and not visible(feature):
+        feature = _select_feature_item(list(kept.values()))
+    return {**payload, "sections": sections, "feature": feature, "items_count": len(kept)}
+
+
 def build_theme_detail(
     theme_slug: str,
     *,
     user,
     limit: int = 36,
     language: Optional[str] = None,
+    deadline: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
-    theme = next((entry for entry in FEED_THEMES if entry["slug"] == theme_slug), None)
+    """Serve a theme page from its snapshot, rebuilding it when the list changed.
+
+    Items flagged with a trigger topic ``user`` opted out of are left out.
+
+    A stale snapshot is rebuilt from the list's published version. Generation
+    only runs when that list is missing, shorter than ``limit`` or older than
+    ``FEED_LIST_MAX_AGE``; it is bounded by ``deadline`` seconds, past which the
+    page renders the last published list, or its fallback, while generation
+    finishes in the background. Lists and snapshots are both per language.
+    """
+
+    registry = get_theme_registry()
+    theme = registry.get(theme_slug)
     if not theme:
         return None
 
     language = _normalize_language(language or getattr(settings, "TMDB_CONFIG", {}).get("LANGUAGE"))
 
-    try:
-        tag = IdentityTag.objects.get(slug=theme_slug)
-    except IdentityTag.DoesNotExist:
+    tag = registry.tag_for(theme_slug)
+    if tag is None:
         fallback = _fallback_carousel(theme)
         return _build_detail_payload(theme=theme, items=fallback["items"], fallback=True, media_list=None)
 
-    try:
-        media_list = generate_media_list_for_identity(
-            tag=tag,
-            owner=user,
-            limit=limit,
-            include_adult=False,
-            language=language,
-            visibility=MediaList.VISIBILITY_UNLISTED,
-            title=theme["title"],
-            description=f"Sélection de films et séries autour de {theme['title'].lower()}",
-        )
-    except TmdbError:
+    trigger_mask = trigger_mask_for_user(user)
+    snapshot = _fresh_theme_snapshot(theme_slug, language or "")
+    if snapshot is not None:
+        return _hide_triggered_items(snapshot.payload, trigger_mask) if trigger_mask else snapshot.payload
+
+    media_list = _theme_list(
+        theme,
+        tag,
+        user=user,
+        limit=_generation_limit(limit, trigger_mask),
+        language=language,
+        deadline=deadline,
+    )
+    if media_list is None:
         fallback = _fallback_carousel(theme)
         return _build_detail_payload(theme=theme, items=fallback["items"], fallback=True, media_list=None)
 
     items = [
         _serialize_media_item(entry.media_item)
-        for entry in media_list.items.select_related("media_item").order_by("position")
+        for entry in media_list.current_items()
     ]
 
-    return _build_detail_payload(theme=theme, items=items, fallback=False, media_list=media_list)
+    payload = _build_detail_payload(theme=theme, items=items, fallback=False, media_list=media_list)
+    # The snapshot is shared by every user, so it keeps flagged items.
+    _store_theme_snapshot(theme_slug, language or "", media_list, payload)
+    return _hide_triggered_items(payload, trigger_mask) if trigger_mask else payload
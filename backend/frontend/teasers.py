@@ -0,0 +1,120 @@
+"""In-process reservoir of pre-fetched teaser films for the public landing page."""
+
+import logging
+import random
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from django.db import connection
+
+LOGGER = logging.getLogger(__name__)
+
+Film = Dict[str, Any]
+
+
+class TeaserPool:
+    """Serve random films from memory and refill from TMDb off the request path.
+
+    Each film is shown up to ``max_serves`` times before it is retired. When the
+    reservoir drops below ``low_water`` a background thread calls ``fetch`` to top
+    it back up to ``capacity``; draws never wait on TMDb.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], List[Film]],
+        *,
+        capacity: int = 24,
+        low_water: int = 8,
+        max_serves: int = 5,
+        background: bool = True,
+    ) -> None:
+        if not 0 <= low_water < capacity:
+            raise ValueError("low_water must be between 0 and capacity")
+        self._fetch = fetch
+        self.capacity = capacity
+        self.low_water = low_water
+        self.max_serves = max_serves
+        self.background = background
+
+        self._films: List[Film] = []
+        self._serves: List[int] = []
+        self._lock = threading.Lock()
+        self._refilling = False
+
+    def __len__(self) -> int:
+        return len(self._films)
+
+    def draw(self) -> Optional[Film]:
+        """Return a random film in O(1), or None while the reservoir is empty."""
+
+        with self._lock:
+            film: Optional[Film] = None
+            if self._films:
+                index = random.randrange(len(self._films))
+                film = self._films[index]
+                self._serves[index] += 1
+                if self._serves[index] >= self.max_serves:
+                    # Swap-remove keeps retirement O(1).
+                    self._films[index] = self._films[-1]
+                    self._serves[index] = self._serves[-1]
+                    self._films.pop()
+                    self._serves.pop()
+            needs_refill = len(self._films) < self.low_water and not self._refilling
+            if needs_refill:
+                self._refilling = True
+
+        if needs_refill:
+            if self.background:
+                threading.Thread(target=self._background_refill, name="teaser-pool-refill", daemon=True).start()
+            else:
+                self._refill_and_release()
+        return film
+
+    def refill(self) -> int:
+        """Top the reservoir up to capacity; returns the number of films added."""
+
+        with self._lock:
+            missing = self.capacity - len(self._films)
+            known = {film.get("tmdb_id") for film in self._films}
+        if missing <= 0:
+            return 0
+
+        try:
+            fetched = self._fetch(missing)
+        except Exception:  # noqa: BLE001 - a failed refill must never break the page
+            LOGGER.exception("Teaser pool refill failed")
+            return 0
+
+        added = 0
+        with self._lock:
+            for film in fetched:
+                if len(self._films) >= self.capacity:
+                    break
+                tmdb_id = film.get("tmdb_id")
+                if tmdb_id and tmdb_id in known:
+                    continue
+                known.add(tmdb_id)
+                self._films.append(film)
+                self._serves.append(0)
+                added += 1
+        return added
+
+    def clear(self) -> None:
+        with self._lock:
+            self._films.clear()
+            self._serves.clear()
+
+    def _background_refill(self) -> None:
+        try:
+            self._refill_and_release()
+        finally:
+            # Keyword resolution hits the DB; don't leak the thread's connection.
+            connection.close()
+
+    def _refill_and_release(self) -> None:
+        try:
+            self.refill()
+        finally:
+            with self._lock:
+                self._refilling = False
@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 from django.contrib.auth import get_user_model
@@ -5,11 +6,13 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from media_catalog.models import IdentityTag
+from accounts.models import TriggerTopic, UserTriggerPreference
+from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListGenerationJob
+from media_catalog.services.versions import publish_media_list_version
 
 
 class QueerFilmTeaserViewTests(APITestCase):
-    @mock.patch("frontend.api.fetch_random_queer_movie")
+    @mock.patch("frontend.api.draw_random_queer_movie")
     def test_returns_movie_payload(self, mock_fetch) -> None:
         mock_fetch.return_value = {
             "title": "Starshine",
@@ -22,13 +25,15 @@ class QueerFilmTeaserViewTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json()["directors"], ["Director Q"])
+        self.assertEqual(response["Cache-Control"], "public, max-age=30")
 
-    @mock.patch("frontend.api.fetch_random_queer_movie", return_value=None)
+    @mock.patch("frontend.api.draw_random_queer_movie", return_value=None)
     def test_returns_service_unavailable_when_missing(self, mock_fetch) -> None:
         response = self.client.get(reverse("frontend:queer-film-teaser"))
 
         self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
         self.assertIn("detail", response.json())
+        self.assertEqual(response["Cache-Control"], "no-store")
 
 
 class FeedCarouselRefreshViewTests(APITestCase):
@@ -43,19 +48,103 @@ class FeedCarouselRefreshViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     @mock.patch("frontend.api.build_feed_carousel")
-    def test_returns_serialized_carousel(self, mock_build) -> None:
-        mock_build.return_value = {"theme": "trans-joy", "title": "Transidentités", "items": []}
+    def test_get_returns_single_carousel(self, mock_build) -> None:
+        mock_build.return_value = {"theme": "trans-joy", "items": [], "fallback": True}
         self.client.force_authenticate(self.user)
         url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "trans-joy"})
 
-        response = self.client.post(url, {"limit": 6}, format="json")
+        response = self.client.get(url, {"limit": 4, "language": "fr-FR"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.json()["carousel"]["theme"], "trans-joy")
-        mock_build.assert_called_once()
+        _, kwargs = mock_build.call_args
+        self.assertEqual(kwargs["limit"], 4)
+        self.assertEqual(kwargs["language"], "fr-FR")
 
     @mock.patch("frontend.api.build_feed_carousel", return_value=None)
-    def test_returns_404_for_unknown_theme(self, mock_build) -> None:
+    def test_get_returns_404_for_unknown_theme(self, mock_build) -> None:
+        self.client.force_authenticate(self.user)
+        url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "unknown"})
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_rejects_invalid_limit(self) -> None:
+        self.client.force_authenticate(self.user)
+        url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "trans-joy"})
+
+        response = self.client.get(url, {"limit": "abc"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_queues_refresh_job(self) -> None:
+        self.client.force_authenticate(self.user)
+        url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "trans-joy"})
+
+        response = self.client.post(url, {"limit": 6}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job_payload = response.json()["job"]
+        job = MediaListGenerationJob.objects.get(pk=job_payload["id"])
+        self.assertEqual(job.limit, 6)
+        self.assertEqual(job.visibility, MediaList.VISIBILITY_UNLISTED)
+        self.assertTrue(job_payload["status_url"].endswith(f"/api/feed/carousels/trans-joy/jobs/{job.pk}/?limit=6"))
+
+    def test_job_status_returns_carousel_when_finished(self) -> None:
+        self.client.force_authenticate(self.user)
+        url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "trans-joy"})
+        job_id = self.client.post(url, {}, format="json").json()["job"]["id"]
+        status_url = reverse("frontend:feed-carousel-job", kwargs={"slug": "trans-joy", "job_id": job_id})
+
+        pending = self.client.get(status_url)
+        self.assertEqual(pending.status_code, status.HTTP_200_OK)
+        self.assertNotIn("carousel", pending.json())
+
+        MediaListGenerationJob.objects.filter(pk=job_id).update(status=MediaListGenerationJob.STATUS_FAILED)
+        finished = self.client.get(status_url)
+
+        self.assertEqual(finished.json()["job"]["status"], MediaListGenerationJob.STATUS_FAILED)
+        self.assertTrue(finished.json()["carousel"]["fallback"])
+
+    def test_trigger_filtered_refresh_overfetches_and_hides_flagged_items(self) -> None:
+        topic = TriggerTopic.objects.create(name="Violence", slug="violence")
+        UserTriggerPreference.objects.create(user=self.user, topic=topic)
+        self.client.force_authenticate(self.user)
+        url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "trans-joy"})
+        job_payload = self.client.post(url, {"limit": 2}, format="json").json()["job"]
+
+        job_id = job_payload["id"]
+        self.assertEqual(MediaListGenerationJob.objects.get(pk=job_id).limit, 3)
+        media_list = MediaList.objects.create(title="Trans", slug="trans-joy-job", owner=self.user)
+        publish_media_list_version(
+            media_list,
+            [
+                MediaItem.objects.create(tmdb_id=1, title="Storm", trigger_mask=1 << topic.bit),
+                MediaItem.objects.create(tmdb_id=2, title="Calm"),
+                MediaItem.objects.create(tmdb_id=3, title="Dawn"),
+                MediaItem.objects.create(tmdb_id=4, title="Dusk"),
+            ],
+        )
+        MediaListGenerationJob.objects.filter(pk=job_id).update(
+            status=MediaListGenerationJob.STATUS_SUCCEEDED, media_list=media_list
+        )
+        response = self.client.get(job_payload["status_url"])
+
+        self.assertEqual([item["title"] for item in response.json()["carousel"]["items"]], ["Calm", "Dawn"])
+
+    def test_job_status_is_not_found_under_another_theme(self) -> None:
+        self.client.force_authenticate(self.user)
+        url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "trans-joy"})
+        job_id = self.client.post(url, {}, format="json").json()["job"]["id"]
+
+        response = self.client.get(
+            reverse("frontend:feed-carousel-job", kwargs={"slug": "lesbian-love", "job_id": job_id})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_returns_404_for_unknown_theme(self) -> None:
         self.client.force_authenticate(self.user)
         url = reverse("frontend:feed-carousel-refresh", kwargs={"slug": "unknown"})
 
@@ -70,3 +159,36 @@ class FeedCarouselRefreshViewTests(APITestCase):
         response = self.client.post(url, {"limit": "abc"}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class FeedStreamViewTests(APITestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.user = User.objects.create_user("astro", password="orbit-strong-42")
+        self.url = reverse("frontend:feed-stream")
+
+    def test_requires_authentication(self) -> None:
+        response = self.client.get(self.url, HTTP_ACCEPT="text/event-stream")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @mock.patch("frontend.api.iter_feed_carousels")
+    def test_streams_one_event_per_carousel_then_summary(self, mock_iter) -> None:
+        mock_iter.return_value = iter(
+            [
+                {"theme": "queer-joy", "items": [], "fallback": True},
+                {"theme": "trans-joy", "items": [{"title": "Joyful Nebula"}]},
+            ]
+        )
+        self.client.force_authenticate(self.user)
+
+        response = self.client.get(self.url, HTTP_ACCEPT="text/event-stream")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        body = b"".join(response.streaming_content).decode()
+        events = [block.split("\n") for block in body.strip().split("\n\n")]
+        self.assertEqual([lines[0] for lines in events], ["event: carousel", "event: carousel", "event: summary"])
+        self.assertEqual(events[0][1], "id: queer-joy")
+        summary = json.loads(events[2][1].removeprefix("data: "))
+        self.assertEqual(summary["carousels"], 2)
+        self.assertEqual(summary["fallbacks"], 1)
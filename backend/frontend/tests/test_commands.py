@@ -0,0 +1,64 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from frontend.services import FEED_THEMES
+
+
+class WarmFeedCommandTests(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.admin = User.objects.create_superuser("admin", password="orbit-strong-42")
+
+    @mock.patch("frontend.management.commands.warm_feed.build_theme_detail")
+    @mock.patch("frontend.management.commands.warm_feed.build_feed_carousel")
+    def test_warms_every_theme_per_language(self, mock_carousel, mock_detail) -> None:
+        mock_carousel.return_value = {"fallback": False, "items": []}
+        mock_detail.return_value = {"fallback": True, "items": []}
+        out = StringIO()
+
+        call_command(
+            "warm_feed",
+            "--language=fr-FR",
+            "--language=en-US",
+            "--details",
+            "--workers=3",
+            stdout=out,
+        )
+
+        self.assertEqual(mock_carousel.call_count, len(FEED_THEMES) * 2)
+        self.assertEqual(mock_detail.call_count, len(FEED_THEMES) * 2)
+        self.assertEqual(mock_detail.call_args.kwargs["limit"], 36)
+        self.assertEqual(mock_carousel.call_args.kwargs["user"], self.admin)
+        self.assertIn(f"{len(FEED_THEMES) * 2} fresh, {len(FEED_THEMES) * 2} fallback, 0 skipped", out.getvalue())
+
+    @mock.patch("frontend.management.commands.warm_feed.build_theme_detail")
+    @mock.patch("frontend.management.commands.warm_feed.build_feed_carousel")
+    def test_details_warm_before_the_carousel_reads_their_list(self, mock_carousel, mock_detail) -> None:
+        steps = mock.Mock()
+        steps.attach_mock(mock_carousel, "carousel")
+        steps.attach_mock(mock_detail, "detail")
+        mock_carousel.return_value = {"fallback": False, "items": []}
+        mock_detail.return_value = {"fallback": False, "items": []}
+
+        call_command("warm_feed", "--details", "--workers=1", stdout=StringIO())
+
+        first_theme = FEED_THEMES[0]["slug"]
+        self.assertEqual([call[0] for call in steps.mock_calls[:2]], ["detail", "carousel"])
+        self.assertEqual(steps.mock_calls[0].args[0], first_theme)
+
+    @mock.patch("frontend.management.commands.warm_feed.build_feed_carousel")
+    def test_exhausted_budget_skips_remaining_work(self, mock_carousel) -> None:
+        out = StringIO()
+
+        call_command("warm_feed", "--budget=0", stdout=out)
+
+        mock_carousel.assert_not_called()
+        self.assertIn(f"0 fresh, 0 fallback, {len(FEED_THEMES)} skipped", out.getvalue())
+
+    def test_unknown_owner_is_rejected(self) -> None:
+        with self.assertRaises(CommandError):
+            call_command("warm_feed", "--owner=nobody", stdout=StringIO())
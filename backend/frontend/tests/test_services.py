@@ -1,16 +1,31 @@
+import threading
 from unittest import mock
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.test import SimpleTestCase, TestCase
 
+from accounts.models import TriggerTopic, UserTriggerPreference
 from frontend.fallbacks import FALLBACK_QUEER_MOVIES
+from frontend.models import ThemeDetailSnapshot
 from frontend.services import (
+    FEED_THEMES,
+    _build_sections,
     build_feed_carousel,
+    build_feed_carousels,
     build_theme_detail,
     fetch_random_queer_movie,
+    iter_feed_carousels,
     normalize_movie_payload,
 )
 from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListItem
+from media_catalog.services.versions import publish_media_list_version
+from media_catalog.services.generator import media_list_slug_for_tag
+from media_catalog.services.masks import FORMAT_LONG, FORMAT_SHORT, genre_bits
+from tmdb import TmdbError
+
+# Language the services fall back to; generated lists are keyed by it.
+FEED_LANGUAGE = settings.TMDB_CONFIG["LANGUAGE"]
 
 
 class NormalizeMoviePayloadTests(SimpleTestCase):
@@ -173,9 +188,9 @@ class BuildFeedCarouselTests(TestCase):
         )
         MediaListItem.objects.create(media_list=self.media_list, media_item=self.media_item, position=1)
 
-    @mock.patch("frontend.services.generate_media_list_for_identity")
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
     def test_returns_serialized_carousel(self, mock_generate) -> None:
-        mock_generate.return_value = self.media_list
+        mock_generate.return_value = {self.tag.pk: self.media_list}
 
         carousel = build_feed_carousel("trans-joy", user=self.user)
 
@@ -189,7 +204,126 @@ class BuildFeedCarouselTests(TestCase):
         self.assertTrue(item["watch"]["providers"])
         self.assertTrue(item["similar"])
 
-    def test_returns_fallback_when_tag_missing(self) -> None:
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    def test_builds_every_carousel_from_one_plan(self, mock_generate) -> None:
+        mock_generate.return_value = {self.tag.pk: self.media_list}
+
+        carousels = build_feed_carousels(self.user)
+
+        mock_generate.assert_called_once()
+        self.assertEqual([carousel["theme"] for carousel in carousels], [theme["slug"] for theme in FEED_THEMES])
+        by_theme = {carousel["theme"]: carousel for carousel in carousels}
+        self.assertFalse(by_theme["trans-joy"].get("fallback"))
+        self.assertEqual(by_theme["trans-joy"]["items"][0]["title"], "Joyful Nebula")
+        self.assertTrue(by_theme["lesbian-love"]["fallback"])
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    def test_feed_deadline_renders_published_lists_and_fallbacks(self, mock_generate) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        mock_generate.side_effect = lambda *args, **kwargs: release.wait(5)
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+
+        carousels = build_feed_carousels(self.user, deadline=0.05)
+
+        by_theme = {carousel["theme"]: carousel for carousel in carousels}
+        self.assertEqual(len(carousels), len(FEED_THEMES))
+        self.assertFalse(by_theme["trans-joy"].get("fallback"))
+        self.assertTrue(by_theme["queer-joy"]["fallback"])
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    def test_theme_reads_share_the_in_flight_plan(self, mock_generate) -> None:
+        IdentityTag.objects.get_or_create(slug="gay-celebration", defaults={"name": "Gay"})
+        release = threading.Event()
+        self.addCleanup(release.set)
+        mock_generate.side_effect = lambda *args, **kwargs: release.wait(5)
+
+        build_feed_carousel("trans-joy", user=self.user, deadline=0.05)
+        build_feed_carousel("gay-celebration", user=self.user, deadline=0.05)
+
+        mock_generate.assert_called_once()
+        planned = {request.tag.slug for request in mock_generate.call_args.args[0]}
+        self.assertLessEqual({"trans-joy", "gay-celebration"}, planned)
+
+    @mock.patch("frontend.services.build_feed_carousel")
+    def test_streams_carousels_in_completion_order(self, mock_build) -> None:
+        first_slug = FEED_THEMES[0]["slug"]
+        others_done = threading.Event()
+        self.addCleanup(others_done.set)
+
+        def build(theme_slug, **kwargs):
+            if theme_slug == first_slug:
+                others_done.wait(5)
+            elif theme_slug == FEED_THEMES[-1]["slug"]:
+                others_done.set()
+            return {"theme": theme_slug, "items": []}
+
+        mock_build.side_effect = build
+
+        themes = [carousel["theme"] for carousel in iter_feed_carousels(self.user)]
+
+        self.assertEqual(sorted(themes), sorted(theme["slug"] for theme in FEED_THEMES))
+        self.assertNotEqual(themes[0], first_slug)
+
+    @mock.patch("frontend.services.build_feed_carousel")
+    def test_stream_deadline_serves_remaining_themes_from_published_lists(self, mock_build) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        mock_build.side_effect = lambda theme_slug, **kwargs: release.wait(5)
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+
+        carousels = list(iter_feed_carousels(self.user, deadline=0.05))
+
+        by_theme = {carousel["theme"]: carousel for carousel in carousels}
+        self.assertEqual(len(carousels), len(FEED_THEMES))
+        self.assertEqual(by_theme["trans-joy"]["items"][0]["title"], "Joyful Nebula")
+        self.assertTrue(by_theme["queer-joy"]["fallback"])
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    def test_hides_triggering_items_and_tops_up_from_overfetch(self, mock_generate) -> None:
+        topic = TriggerTopic.objects.create(name="Violence", slug="violence")
+        UserTriggerPreference.objects.create(user=self.user, topic=topic)
+        flagged = MediaItem.objects.create(tmdb_id=1000, title="Storm", trigger_mask=1 << topic.bit)
+        calm = MediaItem.objects.create(tmdb_id=1001, title="Calm Sea")
+        MediaListItem.objects.create(media_list=self.media_list, media_item=flagged, position=2)
+        MediaListItem.objects.create(media_list=self.media_list, media_item=calm, position=3)
+        mock_generate.return_value = {self.tag.pk: self.media_list}
+
+        carousel = build_feed_carousel("trans-joy", user=self.user, limit=2)
+
+        assert carousel is not None
+        self.assertEqual([item["title"] for item in carousel["items"]], ["Joyful Nebula", "Calm Sea"])
+        self.assertEqual(mock_generate.call_args.kwargs["limit"], 3)
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    def test_serves_fresh_published_list_without_regenerating(self, mock_generate) -> None:
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+        publish_media_list_version(self.media_list, [self.media_item])
+
+        carousel = build_feed_carousel("trans-joy", user=self.user, limit=1)
+
+        assert carousel is not None
+        self.assertEqual(carousel["items"][0]["title"], "Joyful Nebula")
+        mock_generate.assert_not_called()
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    def test_regenerates_stale_or_short_published_lists(self, mock_generate) -> None:
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+        publish_media_list_version(self.media_list, [self.media_item])
+        mock_generate.return_value = {self.tag.pk: self.media_list}
+
+        build_feed_carousel("trans-joy", user=self.user, limit=2)
+        with self.settings(FEED_LIST_MAX_AGE=0):
+            build_feed_carousel("trans-joy", user=self.user, limit=1)
+
+        self.assertEqual(mock_generate.call_count, 2)
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities", return_value={})
+    def test_returns_fallback_when_tag_missing(self, mock_generate) -> None:
         carousel = build_feed_carousel("lesbian-love", user=self.user)
 
         self.assertIsNotNone(carousel)
@@ -268,8 +402,145 @@ class BuildThemeDetailTests(TestCase):
         self.assertIn("Courts métrages", section_titles)
         self.assertIn("Documentaires & essais", section_titles)
 
+    def test_deadline_serves_published_list_while_generation_continues(self) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+
+        def slow_generation(**kwargs):
+            release.wait(5)
+            return self.media_list
+
+        with mock.patch("frontend.services.generate_media_list_for_identity", side_effect=slow_generation) as mock_generate:
+            detail = build_theme_detail("trans-joy", user=self.user, deadline=0.05)
+            self.assertEqual(mock_generate.call_count, 1)
+
+        assert detail is not None
+        self.assertFalse(detail["fallback"])
+        self.assertEqual(detail["list_slug"], self.media_list.slug)
+        self.assertEqual(detail["items_count"], 1)
+
+    @mock.patch("frontend.services.generate_media_list_for_identity")
+    def test_deadline_falls_back_without_published_list(self, mock_generate) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+        mock_generate.side_effect = lambda **kwargs: release.wait(5)
+
+        detail = build_theme_detail("trans-joy", user=self.user, deadline=0.05)
+
+        assert detail is not None
+        self.assertTrue(detail["fallback"])
+
+    @mock.patch("frontend.services.generate_media_list_for_identity")
+    def test_serves_snapshot_until_a_new_version_is_published(self, mock_generate) -> None:
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+        publish_media_list_version(self.media_list, [self.media_item])
+
+        first = build_theme_detail("trans-joy", user=self.user, limit=1, language="fr-FR")
+        # The user's trigger topics, then the snapshot.
+        with self.assertNumQueries(2):
+            cached = build_theme_detail("trans-joy", user=self.user, limit=1, language="fr-FR")
+
+        mock_generate.assert_not_called()
+        self.assertEqual(cached, first)
+        self.assertEqual(ThemeDetailSnapshot.objects.get(theme="trans-joy").language, "fr-FR")
+
+        other = MediaItem.objects.create(tmdb_id=556, title="Second Orbit", metadata={})
+        publish_media_list_version(self.media_list, [other, self.media_item])
+        rebuilt = build_theme_detail("trans-joy", user=self.user, limit=1, language="fr-FR")
+
+        self.assertEqual(rebuilt["items_count"], 2)
+        self.assertEqual(
+            ThemeDetailSnapshot.objects.get(theme="trans-joy").source_version_id,
+            self.media_list.current_version_id,
+        )
+
+    @mock.patch("frontend.services.generate_media_list_for_identity")
+    def test_shared_snapshot_is_filtered_per_user(self, mock_generate) -> None:
+        topic = TriggerTopic.objects.create(name="Deuil", slug="deuil")
+        sensitive = get_user_model().objects.create_user("nova", password="orbit-strong-42")
+        UserTriggerPreference.objects.create(user=sensitive, topic=topic)
+        self.media_item.trigger_mask = 1 << topic.bit
+        self.media_item.save(update_fields=["trigger_mask"])
+        other = MediaItem.objects.create(tmdb_id=556, title="Second Orbit", metadata={})
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+        publish_media_list_version(self.media_list, [self.media_item, other])
+
+        everyone = build_theme_detail("trans-joy", user=self.user, limit=2)
+        filtered = build_theme_detail("trans-joy", user=sensitive, limit=2)
+
+        self.assertEqual(everyone["items_count"], 2)
+        self.assertEqual(everyone["feature"]["title"], "Orbiting Joy")
+        self.assertEqual(filtered["items_count"], 1)
+        self.assertEqual(filtered["feature"]["title"], "Second Orbit")
+        titles = {item["title"] for section in filtered["sections"] for item in section["items"]}
+        self.assertEqual(titles, {"Second Orbit"})
+        self.assertEqual(ThemeDetailSnapshot.objects.count(), 1)
+
+    @mock.patch("frontend.services.generate_media_list_for_identity")
+    def test_regenerates_a_list_shorter_than_the_page(self, mock_generate) -> None:
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+        feed_items = [
+            MediaItem.objects.create(tmdb_id=1000 + index, title=f"Feed {index}", metadata={}) for index in range(12)
+        ]
+        publish_media_list_version(self.media_list, feed_items)
+        detail_items = [
+            MediaItem.objects.create(tmdb_id=2000 + index, title=f"Detail {index}", metadata={}) for index in range(36)
+        ]
+
+        def generation(**kwargs):
+            publish_media_list_version(self.media_list, detail_items[: kwargs["limit"]])
+            return self.media_list
+
+        mock_generate.side_effect = generation
+
+        detail = build_theme_detail("trans-joy", user=self.user)
+
+        self.assertEqual(mock_generate.call_args.kwargs["limit"], 36)
+        self.assertEqual(detail["items_count"], 36)
+
+    @mock.patch("frontend.services.generate_media_list_for_identity")
+    def test_short_list_is_served_when_tmdb_fails(self, mock_generate) -> None:
+        self.media_list.slug = media_list_slug_for_tag(self.tag, FEED_LANGUAGE)
+        self.media_list.save(update_fields=["slug"])
+        publish_media_list_version(self.media_list, [self.media_item])
+        mock_generate.side_effect = TmdbError("boom")
+
+        detail = build_theme_detail("trans-joy", user=self.user)
+
+        self.assertFalse(detail["fallback"])
+        self.assertEqual(detail["items_count"], 1)
+
     def test_fallback_when_no_tag(self) -> None:
         detail = build_theme_detail("lesbian-love", user=self.user)
         self.assertIsNotNone(detail)
         assert detail is not None
         self.assertTrue(detail["fallback"])
+
+
+class BuildSectionsTests(SimpleTestCase):
+    def test_buckets_items_by_precomputed_masks(self) -> None:
+        items = [
+            {"tmdb_id": 1, "format_mask": FORMAT_SHORT, "genre_mask": genre_bits("documentary")},
+            {"tmdb_id": 2, "format_mask": FORMAT_LONG, "genre_mask": genre_bits("romance", "horror")},
+            # Fallback items carry no masks and are classified from their payload.
+            {"tmdb_id": 3, "runtime": 100, "genres": ["Comedy"]},
+        ]
+
+        sections = {section["title"]: [item["tmdb_id"] for item in section["items"]] for section in _build_sections(items)}
+
+        self.assertEqual(
+            sections,
+            {
+                "Courts métrages": [1],
+                "Longs métrages": [2, 3],
+                "Horreur & frissons": [2],
+                "Comédies et feel-good": [3],
+                "Documentaires & essais": [1],
+                "Romances & drames": [2],
+            },
+        )
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from frontend.fallbacks import FALLBACK_QUEER_MOVIES
+from frontend.services import draw_random_queer_movie
+from frontend.teasers import TeaserPool
+
+
+def _films(count: int, start: int = 1):
+    return [{"tmdb_id": tmdb_id, "title": f"Film {tmdb_id}"} for tmdb_id in range(start, start + count)]
+
+
+class TeaserPoolTests(SimpleTestCase):
+    def test_draw_refills_below_low_water_mark(self) -> None:
+        fetch = mock.MagicMock(side_effect=lambda count: _films(count))
+        pool = TeaserPool(fetch, capacity=4, low_water=2, max_serves=1, background=False)
+
+        self.assertIsNone(pool.draw())
+        fetch.assert_called_once_with(4)
+        self.assertEqual(len(pool), 4)
+
+        first = pool.draw()
+        second = pool.draw()
+        self.assertNotEqual(first["tmdb_id"], second["tmdb_id"])
+        self.assertEqual(fetch.call_count, 1)
+
+        pool.draw()  # drops to 1 film, below the low-water mark
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(fetch.call_args, mock.call(3))
+
+    def test_films_retire_after_max_serves(self) -> None:
+        pool = TeaserPool(lambda count: _films(1), capacity=2, low_water=0, max_serves=3, background=False)
+        pool.refill()
+
+        served = [pool.draw() for _ in range(3)]
+
+        self.assertEqual({film["tmdb_id"] for film in served}, {1})
+        self.assertEqual(len(pool), 0)
+
+    def test_refill_skips_duplicates_and_survives_errors(self) -> None:
+        pool = TeaserPool(lambda count: _films(2) + _films(2), capacity=5, low_water=1, background=False)
+        self.assertEqual(pool.refill(), 2)
+
+        broken = TeaserPool(mock.MagicMock(side_effect=RuntimeError("boom")), capacity=2, low_water=1, background=False)
+        with self.assertLogs("frontend.teasers", level="ERROR"):
+            self.assertEqual(broken.refill(), 0)
+
+
+class DrawRandomQueerMovieTests(SimpleTestCase):
+    @mock.patch("frontend.services.sample_movie_by_keyword")
+    @mock.patch("frontend.services.TEASER_POOL")
+    def test_serves_pool_film_without_calling_tmdb(self, mock_pool, mock_sample) -> None:
+        mock_pool.draw.return_value = {"tmdb_id": 7, "title": "Pooled"}
+
+        movie = draw_random_queer_movie()
+
+        self.assertEqual(movie["title"], "Pooled")
+        mock_sample.assert_not_called()
+
+    @mock.patch("frontend.services.random.choice")
+    @mock.patch("frontend.services.TEASER_POOL")
+    def test_falls_back_while_pool_is_empty(self, mock_pool, mock_choice) -> None:
+        mock_pool.draw.return_value = None
+        mock_choice.return_value = FALLBACK_QUEER_MOVIES[0]
+
+        movie = draw_random_queer_movie()
+
+        self.assertEqual(movie["title"], FALLBACK_QUEER_MOVIES[0]["title"])
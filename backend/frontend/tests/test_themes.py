@@ -0,0 +1,33 @@
+from django.test import TestCase
+
+from frontend.themes import FEED_THEMES, get_theme_registry, invalidate_theme_registry
+from media_catalog.models import IdentityTag
+
+
+class ThemeRegistryTests(TestCase):
+    def setUp(self) -> None:
+        invalidate_theme_registry()
+        self.addCleanup(invalidate_theme_registry)
+
+    def test_builds_with_a_single_tag_query(self) -> None:
+        with self.assertNumQueries(1):
+            registry = get_theme_registry()
+            for theme in FEED_THEMES:
+                registry.get(theme["slug"])
+                registry.tag_for(theme["slug"])
+            get_theme_registry()
+
+        self.assertEqual(len(registry.themes), len(FEED_THEMES))
+        self.assertIsNone(registry.get("unknown"))
+        with self.assertRaises(TypeError):
+            registry.by_slug["unknown"] = {}  # type: ignore[index]
+
+    def test_identity_tag_changes_invalidate_the_registry(self) -> None:
+        IdentityTag.objects.filter(slug="bisexual").delete()
+        self.assertIsNone(get_theme_registry().tag_for("bisexual"))
+
+        tag = IdentityTag.objects.create(slug="bisexual", name="Bi (test)")
+        self.assertEqual(get_theme_registry().tag_for("bisexual"), tag)
+
+        tag.delete()
+        self.assertIsNone(get_theme_registry().tag_for("bisexual"))
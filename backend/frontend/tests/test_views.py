@@ -5,6 +5,25 @@ from django.test import TestCase
 from django.urls import reverse
 
 
+class FeedViewTests(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.user = User.objects.create_user("member", password="constellation42")
+
+    @mock.patch("frontend.services.generate_media_lists_for_identities")
+    @mock.patch("frontend.services.generate_media_list_for_identity")
+    def test_renders_skeletons_without_generating(self, mock_single, mock_batch) -> None:
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("frontend:feed"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "data-carousel-skeleton")
+        self.assertContains(response, 'data-carousel="trans-joy"')
+        mock_single.assert_not_called()
+        mock_batch.assert_not_called()
+
+
 class ThemeDetailViewTests(TestCase):
     def setUp(self) -> None:
         User = get_user_model()
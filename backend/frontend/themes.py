@@ -0,0 +1,165 @@
+"""Process-wide registry of feed themes and their identity tags."""
+
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from media_catalog.models import IdentityTag
+from media_catalog.services.keywords import get_keyword_index
+
+FEED_THEMES: List[Dict[str, str]] = [
+    {
+        "slug": "trans-joy",
+        "title": "Transidentités",
+        "fallback": "transidentites",
+        "description": "Films et séries centrés sur les expériences et les joies trans.",
+    },
+    {
+        "slug": "lesbian-love",
+        "title": "Lesbiennes",
+        "fallback": "lesbiennes",
+        "description": "Histoires lesbiennes, romances, drames, docs et plus.",
+    },
+    {
+        "slug": "gay-celebration",
+        "title": "Gays",
+        "fallback": "queers",
+        "description": "Créations gays : pride, mémoire, fêtes, luttes et amours.",
+    },
+    {
+        "slug": "queer-joy",
+        "title": "Queers",
+        "fallback": "queers",
+        "description": "Panorama queer : joyeuses galaxies, club kids, ballrooms, résistance.",
+    },
+    {
+        "slug": "lgbt-history",
+        "title": "LGBTQIA+",
+        "fallback": "queers",
+        "description": "Archives et imaginaires LGBTQIA+ intergénérationnels.",
+    },
+    {
+        "slug": "non-binary",
+        "title": "Non-binaire",
+        "fallback": "transidentites",
+        "description": "Identités non-binaires, fluides et genderqueer à l’écran.",
+    },
+    {
+        "slug": "gender-studies",
+        "title": "Théories du Genre",
+        "fallback": "queers",
+        "description": "Essais, docs et fictions qui bousculent les cadres du genre.",
+    },
+    {
+        "slug": "radical-feminism",
+        "title": "Féminisme radical",
+        "fallback": "lesbiennes",
+        "description": "Héritages et combats transféministes décoloniaux.",
+    },
+    {
+        "slug": "intersex",
+        "title": "Intersex",
+        "fallback": "transidentites",
+        "description": "Récits intersexes : lutte, douceur et autodétermination.",
+    },
+    {
+        "slug": "asexual",
+        "title": "Asexuel",
+        "fallback": "queers",
+        "description": "Narrations ace et aromantiques, des contes aux docs.",
+    },
+    {
+        "slug": "tds-sex-work",
+        "title": "Travail du sexe",
+        "fallback": "queers",
+        "description": "Travail du sexe, mutual aid, luttes anti-répression.",
+    },
+    {
+        "slug": "bisexual",
+        "title": "Bi",
+        "fallback": "queers",
+        "description": "Identités bisexuelles, pansexuelles et plurisexuelles à l'écran.",
+    },
+    {
+        "slug": "pansexual",
+        "title": "Pan",
+        "fallback": "queers",
+        "description": "Narrations pansexuelles et polyromantiques, amours sans frontières.",
+    },
+    {
+        "slug": "disability-joy",
+        "title": "Joies handies",
+        "fallback": "queers",
+        "description": "Récits handis, mad pride, neurodivergence et fierté crip.",
+    },
+    {
+        "slug": "bipoc-lgbtq",
+        "title": "LGBTQ+ racisé·es",
+        "fallback": "queers",
+        "description": "Expériences LGBTQ+ racisées, décoloniales et intersectionnelles.",
+    },
+]
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeRegistry:
+    """Immutable snapshot of the feed themes, indexed by slug.
+
+    Built lazily on first use with a single bulk tag query, then shared by every
+    request until an `IdentityTag` changes in this process, or for at most
+    `REGISTRY_TTL` seconds after a change made elsewhere.
+    """
+
+    themes: Tuple[Mapping[str, str], ...]
+    by_slug: Mapping[str, Mapping[str, str]]
+    tags: Mapping[str, IdentityTag]
+
+    def get(self, slug: str) -> Optional[Mapping[str, str]]:
+        return self.by_slug.get(slug)
+
+    def tag_for(self, slug: str) -> Optional[IdentityTag]:
+        return self.tags.get(slug)
+
+    def keywords_for(self, slug: str) -> Tuple[int, ...]:
+        tag = self.tags.get(slug)
+        return get_keyword_index().keywords_for(tag.pk) if tag else ()
+
+
+REGISTRY_TTL = 60.0  # seconds; the only refresh other processes get
+
+_REGISTRY: Optional[ThemeRegistry] = None
+_REGISTRY_EXPIRES = 0.0
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _build_registry() -> ThemeRegistry:
+    themes = tuple(MappingProxyType(dict(theme)) for theme in FEED_THEMES)
+    slugs = [theme["slug"] for theme in themes]
+    tags = IdentityTag.objects.in_bulk(slugs, field_name="slug")
+    return ThemeRegistry(
+        themes=themes,
+        by_slug=MappingProxyType({theme["slug"]: theme for theme in themes}),
+        tags=MappingProxyType(tags),
+    )
+
+
+def get_theme_registry() -> ThemeRegistry:
+    global _REGISTRY, _REGISTRY_EXPIRES
+    registry = _REGISTRY
+    if registry is None or time.monotonic() >= _REGISTRY_EXPIRES:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None or time.monotonic() >= _REGISTRY_EXPIRES:
+                _REGISTRY = _build_registry()
+                _REGISTRY_EXPIRES = time.monotonic() + REGISTRY_TTL
+            registry = _REGISTRY
+    return registry
+
+
+def invalidate_theme_registry(**kwargs) -> None:
+    """Drop the cached registry; usable directly or as a model signal receiver."""
+
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        _REGISTRY = None
@@ -1,6 +1,6 @@
 from django.urls import path
 
-from .api import FeedCarouselRefreshView, QueerFilmTeaserView
+from .api import FeedCarouselJobStatusView, FeedCarouselRefreshView, FeedStreamView, QueerFilmTeaserView
 from .views import FeedView, ThemeDetailView, WelcomeView
 
 app_name = "frontend"
@@ -10,9 +10,15 @@ urlpatterns = [
     path("feed/", FeedView.as_view(), name="feed"),
     path("feed/themes/<slug:slug>/", ThemeDetailView.as_view(), name="theme-detail"),
     path("api/teasers/queer-film/", QueerFilmTeaserView.as_view(), name="queer-film-teaser"),
+    path("api/feed/stream/", FeedStreamView.as_view(), name="feed-stream"),
     path(
         "api/feed/carousels/<slug:slug>/",
         FeedCarouselRefreshView.as_view(),
         name="feed-carousel-refresh",
     ),
+    path(
+        "api/feed/carousels/<slug:slug>/jobs/<int:job_id>/",
+        FeedCarouselJobStatusView.as_view(),
+        name="feed-carousel-job",
+    ),
 ]
@@ -6,9 +6,9 @@ from django.views.generic import FormView, TemplateView
 
 from .forms import LoginForm, RegistrationForm
 from .services import (
-    build_feed_carousels,
     build_theme_detail,
-    fetch_random_queer_movie,
+    draw_random_queer_movie,
+    feed_render_deadline,
     get_feed_themes,
 )
 
@@ -20,7 +20,7 @@ class WelcomeView(TemplateView):
         context = super().get_context_data(**kwargs)
         context["login_form"] = LoginForm(self.request)
         context["registration_form"] = RegistrationForm()
-        context["random_movie"] = fetch_random_queer_movie()
+        context["random_movie"] = draw_random_queer_movie()
         context["login_url"] = reverse_lazy("login")
         context["signup_url"] = reverse_lazy("signup") if self._signup_url_exists() else reverse_lazy("login")
         return context
@@ -40,9 +40,8 @@ class FeedView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        language = getattr(self.request, "LANGUAGE_CODE", None)
+        # Carousels load per theme from the API, so the shell renders immediately.
         context["feed_themes"] = get_feed_themes()
-        context["carousels"] = build_feed_carousels(self.request.user, language=language)
         context["csrf_token"] = get_token(self.request)
         return context
 
@@ -54,7 +53,12 @@ class ThemeDetailView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         slug = self.kwargs.get("slug")
         language = getattr(self.request, "LANGUAGE_CODE", None)
-        detail = build_theme_detail(slug, user=self.request.user, language=language)
+        detail = build_theme_detail(
+            slug,
+            user=self.request.user,
+            language=language,
+            deadline=feed_render_deadline(),
+        )
         if detail is None:
             raise Http404("Thème introuvable")
         context["detail"] = detail
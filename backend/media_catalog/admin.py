@@ -1,6 +1,22 @@
 from django.contrib import admin
 
-from .models import IdentityTag, MediaItem, MediaList, MediaListItem
+from .models import (
+    CatalogSyncCheckpoint,
+    IdentityTag,
+    IdentityTagKeyword,
+    MediaItem,
+    MediaList,
+    MediaListGenerationJob,
+    MediaListItem,
+    MediaListLock,
+    MediaListVersion,
+)
+from .services.versions import refresh_item_counts
+
+
+class IdentityTagKeywordInline(admin.TabularInline):
+    model = IdentityTagKeyword
+    extra = 0
 
 
 @admin.register(IdentityTag)
@@ -9,6 +25,14 @@ class IdentityTagAdmin(admin.ModelAdmin):
     search_fields = ("name", "slug", "description")
     list_filter = ("is_curated",)
     prepopulated_fields = {"slug": ("name",)}
+    inlines = [IdentityTagKeywordInline]
+
+
+@admin.register(IdentityTagKeyword)
+class IdentityTagKeywordAdmin(admin.ModelAdmin):
+    list_display = ("tag", "keyword_id", "weight", "rank", "result_count", "overlap", "scored_at")
+    search_fields = ("tag__name", "tag__slug", "keyword_id")
+    list_filter = ("tag",)
 
 
 @admin.register(MediaItem)
@@ -18,6 +42,16 @@ class MediaItemAdmin(admin.ModelAdmin):
     list_filter = ("media_type", "identity_tags")
     autocomplete_fields = ("identity_tags",)
 
+    def delete_model(self, request, obj):
+        list_ids = list(MediaListItem.objects.filter(media_item=obj).values_list("media_list_id", flat=True))
+        super().delete_model(request, obj)
+        refresh_item_counts(list_ids)
+
+    def delete_queryset(self, request, queryset):
+        list_ids = list(MediaListItem.objects.filter(media_item__in=queryset).values_list("media_list_id", flat=True))
+        super().delete_queryset(request, queryset)
+        refresh_item_counts(list_ids)
+
 
 class MediaListItemInline(admin.TabularInline):
     model = MediaListItem
@@ -27,16 +61,21 @@ class MediaListItemInline(admin.TabularInline):
 
 @admin.register(MediaList)
 class MediaListAdmin(admin.ModelAdmin):
-    list_display = ("title", "owner", "visibility", "is_dynamic", "created_at")
+    list_display = ("title", "owner", "visibility", "is_dynamic", "current_version", "created_at")
     search_fields = ("title", "description", "owner__username")
     list_filter = ("visibility", "is_dynamic")
     autocomplete_fields = ("owner", "source_keyword")
+    raw_id_fields = ("current_version",)
     inlines = [MediaListItemInline]
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        refresh_item_counts([form.instance.pk])
+
 
 @admin.register(MediaListItem)
 class MediaListItemAdmin(admin.ModelAdmin):
-    list_display = ("media_list", "media_item", "position", "added_by", "created_at")
+    list_display = ("media_list", "version", "media_item", "position", "added_by", "created_at")
     search_fields = (
         "media_list__title",
         "media_item__title",
@@ -45,3 +84,46 @@ class MediaListItemAdmin(admin.ModelAdmin):
     )
     list_filter = ("media_list",)
     autocomplete_fields = ("media_list", "media_item", "added_by")
+
+    def save_model(self, request, obj, form, change):
+        # An item moved to another list changes both counts.
+        list_ids = [obj.media_list_id, form.initial.get("media_list")]
+        super().save_model(request, obj, form, change)
+        refresh_item_counts(list_id for list_id in list_ids if list_id is not None)
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        refresh_item_counts([obj.media_list_id])
+
+    def delete_queryset(self, request, queryset):
+        list_ids = list(queryset.values_list("media_list_id", flat=True))
+        super().delete_queryset(request, queryset)
+        refresh_item_counts(list_ids)
+
+
+@admin.register(CatalogSyncCheckpoint)
+class CatalogSyncCheckpointAdmin(admin.ModelAdmin):
+    list_display = ("name", "synced_until", "updated_at")
+    readonly_fields = ("last_report", "created_at", "updated_at")
+
+
+@admin.register(MediaListGenerationJob)
+class MediaListGenerationJobAdmin(admin.ModelAdmin):
+    list_display = ("tag", "language", "status", "attempts", "requested_by", "created_at", "finished_at")
+    list_filter = ("status",)
+    search_fields = ("tag__name", "tag__slug", "requested_by__username")
+    autocomplete_fields = ("tag", "requested_by", "media_list")
+    readonly_fields = ("created_at", "started_at", "finished_at", "updated_at")
+
+
+@admin.register(MediaListLock)
+class MediaListLockAdmin(admin.ModelAdmin):
+    list_display = ("key", "acquired_at", "expires_at")
+    search_fields = ("key",)
+
+
+@admin.register(MediaListVersion)
+class MediaListVersionAdmin(admin.ModelAdmin):
+    list_display = ("media_list", "number", "created_at")
+    search_fields = ("media_list__title", "media_list__slug")
+    readonly_fields = ("created_at",)
@@ -1,5 +1,5 @@
 """API wiring for the media_catalog app."""
 
-from .views import MediaListViewSet, IdentityTagViewSet
+from .views import IdentityTagViewSet, MediaItemExportView, MediaListGenerationJobViewSet, MediaListViewSet
 
-__all__ = ["MediaListViewSet", "IdentityTagViewSet"]
+__all__ = ["MediaListViewSet", "MediaListGenerationJobViewSet", "IdentityTagViewSet", "MediaItemExportView"]
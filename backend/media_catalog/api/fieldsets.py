@@ -0,0 +1,147 @@
+"""Sparse fieldsets (``?fields=``) and embed control (``?expand=``) for media lists.
+
+``fields`` takes top-level names plus ``items.<name>`` for list entries and
+``items.media_item.<name>`` for their media, e.g.
+``?fields=slug,title,items.position,items.media_item.title``. ``expand`` names
+the relations to embed (``items``, ``source_keyword``); a relation left out is
+omitted (``items``) or rendered as its primary key (``source_keyword``).
+Columns behind unrequested fields are never loaded.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
+
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+
+from media_catalog.models import MediaList, MediaListItem
+
+from .serializers import IdentityTagSerializer, MediaItemSerializer, MediaListItemSerializer
+
+# Serializer field → model columns it reads.
+LIST_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "id": ("id",),
+    "slug": ("slug",),
+    "title": ("title",),
+    "description": ("description",),
+    "visibility": ("visibility",),
+    "is_dynamic": ("is_dynamic",),
+    "source_keyword": ("source_keyword",),
+    "item_count": ("item_count",),
+    "share_url": ("slug",),
+    "updated_at": ("updated_at",),
+    "items": ("current_version",),
+}
+ITEM_FIELDS = frozenset(MediaListItemSerializer.Meta.fields)
+MEDIA_FIELDS = frozenset(MediaItemSerializer.Meta.fields)
+
+# Read by the view itself: visibility checks, conditional GET validators, cursors.
+REQUIRED_LIST_COLUMNS = ("id", "owner", "visibility", "created_at", "updated_at", "current_version")
+
+EXPANDABLE = frozenset({"items", "source_keyword"})
+DETAIL_EXPAND = EXPANDABLE
+LIST_EXPAND = frozenset({"source_keyword"})
+
+
+def _split(value: Optional[str]) -> Optional[FrozenSet[str]]:
+    if value is None:
+        return None
+    return frozenset(part.strip() for part in value.split(",") if part.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class Fieldset:
+    """Fields to render and relations to embed; ``None`` means every field."""
+
+    fields: Optional[FrozenSet[str]] = None
+    item_fields: Optional[FrozenSet[str]] = None
+    media_fields: Optional[FrozenSet[str]] = None
+    expand: FrozenSet[str] = DETAIL_EXPAND
+
+    @classmethod
+    def from_query(cls, params: Mapping[str, str], *, detail: bool) -> "Fieldset":
+        """Parse ``fields``/``expand``; unknown names raise a 400."""
+
+        requested = _split(params.get("fields")) or None
+        expand = _split(params.get("expand"))
+        if expand is None:
+            expand = DETAIL_EXPAND if detail else LIST_EXPAND
+
+        fields: Optional[set] = None
+        item_fields: set = set()
+        media_fields: set = set()
+        errors = []
+        if requested is not None:
+            fields = set()
+            for name in requested:
+                if name.startswith("items.media_item."):
+                    media_fields.add(name.removeprefix("items.media_item."))
+                elif name.startswith("items."):
+                    item_fields.add(name.removeprefix("items."))
+                else:
+                    fields.add(name)
+            if media_fields:
+                item_fields.add("media_item")
+            if item_fields:
+                fields.add("items")
+            if "items" in fields:
+                expand = expand | {"items"}
+            errors += [f"Unknown field: {name}" for name in sorted(fields - LIST_COLUMNS.keys())]
+            errors += [f"Unknown field: items.{name}" for name in sorted(item_fields - ITEM_FIELDS)]
+            errors += [f"Unknown field: items.media_item.{name}" for name in sorted(media_fields - MEDIA_FIELDS)]
+
+        errors += [f"Cannot expand: {name}" for name in sorted(expand - EXPANDABLE)]
+        if not detail and "items" in expand:
+            errors.append("Items are only available on a single list.")
+        if errors:
+            raise ValidationError({"detail": errors})
+
+        # An empty sub-selection means every field of that level.
+        return cls(
+            fields=frozenset(fields) if fields is not None else None,
+            item_fields=frozenset(item_fields) or None,
+            media_fields=frozenset(media_fields) or None,
+            expand=frozenset(expand),
+        )
+
+    @property
+    def variant(self) -> str:
+        """Short digest telling representations of the same list apart (for ETags)."""
+
+        if self == Fieldset():
+            return ""
+        key = "|".join(
+            ",".join(sorted(names)) if names is not None else "*"
+            for names in (self.fields, self.item_fields, self.media_fields, self.expand)
+        )
+        return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()[:12]
+
+    def wants(self, name: str) -> bool:
+        return self.fields is None or name in self.fields
+
+    def restrict_lists(self, queryset: QuerySet[MediaList]) -> QuerySet[MediaList]:
+        """Load only the list columns (and joins) the response needs."""
+
+        queryset = queryset.select_related(None)
+        embed_keyword = "source_keyword" in self.expand and self.wants("source_keyword")
+        if embed_keyword:
+            queryset = queryset.select_related("source_keyword")
+        if self.fields is None:
+            return queryset
+        columns = set(REQUIRED_LIST_COLUMNS)
+        for name in self.fields:
+            columns.update(LIST_COLUMNS[name])
+        if embed_keyword:
+            columns.update(f"source_keyword__{name}" for name in IdentityTagSerializer.Meta.fields)
+        return queryset.only(*columns)
+
+    def restrict_items(self, queryset: QuerySet[MediaListItem]) -> QuerySet[MediaListItem]:
+        """Load only the entry and media columns the response needs."""
+
+        if self.item_fields is None and self.media_fields is None:
+            return queryset
+        columns = {"id", "media_item", "media_item__id"}
+        columns.update(self.item_fields or ITEM_FIELDS)
+        columns.update(f"media_item__{name}" for name in self.media_fields or MEDIA_FIELDS)
+        return queryset.only(*columns)
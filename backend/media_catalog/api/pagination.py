@@ -0,0 +1,15 @@
+"""Pagination styles for the media catalog API."""
+
+from rest_framework.pagination import CursorPagination
+
+
+class MediaListCursorPagination(CursorPagination):
+    """Keyset pages over ``(created_at, id)``, newest first.
+
+    Each page is an index range scan, however many lists an owner has.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -0,0 +1,17 @@
+"""Request parsers specific to the media catalog API."""
+
+from rest_framework.parsers import BaseParser
+
+
+class CsvTextParser(BaseParser):
+    """A ``text/csv`` body becomes ``tmdb_ids``; the other fields come from the query string."""
+
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        request = parser_context.get("request")
+        data = request.query_params.dict() if request is not None else {}
+        data["tmdb_ids"] = stream.read().decode(encoding, errors="replace") if stream else ""
+        return data
@@ -0,0 +1,161 @@
+"""Dict-building twins of the media list serializers for the read hot path.
+
+``MediaListSummarySerializer`` and ``MediaListDetailSerializer`` pay a
+``to_representation`` call per field per row, which dominates on long lists.
+These functions build the same payloads straight from ``values()`` rows and
+honour the request's ``Fieldset``. ``tests.test_representations`` checks them
+against the DRF serializers; ``manage.py benchmark_list_serializers`` measures
+the gap. Writes still answer through the serializers.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+from media_catalog.models import MediaList
+
+from .fieldsets import Fieldset
+from .serializers import (
+    IdentityTagSerializer,
+    MediaItemSerializer,
+    MediaListDetailSerializer,
+    MediaListItemSerializer,
+    MediaListSummarySerializer,
+)
+
+Row = Mapping[str, Any]
+
+KEYWORD_FIELDS = IdentityTagSerializer.Meta.fields
+ITEM_FIELDS = MediaListItemSerializer.Meta.fields
+MEDIA_FIELDS = MediaItemSerializer.Meta.fields
+
+# Same formatting (ISO 8601, current time zone, ``Z`` for UTC) as the serializers.
+_DATETIME = serializers.DateTimeField()
+
+# Needed by the cursor pagination whatever the fieldset.
+CURSOR_COLUMNS = ("id", "created_at")
+
+
+def _list_fields(fieldset: Fieldset, *, detail: bool) -> List[str]:
+    names = MediaListDetailSerializer.Meta.fields if detail else MediaListSummarySerializer.Meta.fields
+    return [name for name in names if fieldset.wants(name) and (name != "items" or "items" in fieldset.expand)]
+
+
+def _embeds_keyword(fieldset: Fieldset) -> bool:
+    return "source_keyword" in fieldset.expand and fieldset.wants("source_keyword")
+
+
+def list_columns(fieldset: Fieldset, *, detail: bool = False) -> List[str]:
+    """``values()`` columns behind the list-level fields of a response."""
+
+    columns = set(CURSOR_COLUMNS)
+    for name in _list_fields(fieldset, detail=detail):
+        if name == "share_url":
+            columns.add("slug")
+        elif name == "items":
+            columns.add("current_version")
+        elif name == "source_keyword" and _embeds_keyword(fieldset):
+            columns.update(f"source_keyword__{field}" for field in KEYWORD_FIELDS)
+        else:
+            columns.add(name)
+    return sorted(columns)
+
+
+def _item_fields(fieldset: Fieldset) -> Iterable[str]:
+    return [name for name in ITEM_FIELDS if fieldset.item_fields is None or name in fieldset.item_fields]
+
+
+def _media_fields(fieldset: Fieldset) -> Iterable[str]:
+    return [name for name in MEDIA_FIELDS if fieldset.media_fields is None or name in fieldset.media_fields]
+
+
+def _share_prefix(request) -> Optional[str]:
+    # Slugs never need escaping, so the absolute URL is built once per response.
+    return request.build_absolute_uri("/lists/") if request else None
+
+
+def _list_payload(row: Row, names: Iterable[str], *, embed_keyword: bool, share_prefix: Optional[str]) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    for name in names:
+        if name == "items":
+            continue
+        if name == "source_keyword" and embed_keyword:
+            payload[name] = (
+                None
+                if row["source_keyword__id"] is None
+                else {field: row[f"source_keyword__{field}"] for field in KEYWORD_FIELDS}
+            )
+        elif name == "share_url":
+            payload[name] = f"{share_prefix}{row['slug']}/" if share_prefix else None
+        elif name == "updated_at":
+            payload[name] = _DATETIME.to_representation(row[name])
+        else:
+            payload[name] = row[name]
+    return payload
+
+
+def summary_payloads(rows: Iterable[Row], fieldset: Fieldset, *, request=None) -> List[Dict[str, Any]]:
+    """Summaries for ``values(*list_columns(fieldset))`` rows, e.g. one listing page."""
+
+    names = _list_fields(fieldset, detail=False)
+    embed_keyword = _embeds_keyword(fieldset)
+    share_prefix = _share_prefix(request)
+    return [_list_payload(row, names, embed_keyword=embed_keyword, share_prefix=share_prefix) for row in rows]
+
+
+def item_payloads(media_list: MediaList, fieldset: Fieldset) -> List[Dict[str, Any]]:
+    """The published entries of ``media_list`` from a single ``values()`` query."""
+
+    item_names = list(_item_fields(fieldset))
+    media_names = list(_media_fields(fieldset)) if "media_item" in item_names else []
+    columns = [name for name in item_names if name != "media_item"]
+    columns += [f"media_item__{name}" for name in media_names]
+    rows = media_list.current_items().select_related(None).values(*columns)
+
+    payloads = []
+    for row in rows:
+        payload = {}
+        for name in item_names:
+            if name != "media_item":
+                payload[name] = row[name]
+                continue
+            media = {field: row[f"media_item__{field}"] for field in media_names}
+            if media.get("release_date") is not None:
+                media["release_date"] = media["release_date"].isoformat()
+            payload[name] = media
+        payloads.append(payload)
+    return payloads
+
+
+def _instance_row(media_list: MediaList, columns: Iterable[str]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    for column in columns:
+        related, _, field = column.partition("__")
+        if field:
+            target = getattr(media_list, related)
+            row[column] = getattr(target, field) if target is not None else None
+        else:
+            row[column] = getattr(media_list, MediaList._meta.get_field(column).attname)
+    return row
+
+
+def detail_payload(media_list: MediaList, fieldset: Optional[Fieldset] = None, *, request=None) -> Dict[str, Any]:
+    """Detail of an already loaded list; only its items are queried."""
+
+    fieldset = fieldset or Fieldset()
+    names = _list_fields(fieldset, detail=True)
+    row = _instance_row(media_list, list_columns(fieldset, detail=True))
+    payload = _list_payload(row, names, embed_keyword=_embeds_keyword(fieldset), share_prefix=_share_prefix(request))
+    if "items" in names:
+        payload["items"] = item_payloads(media_list, fieldset)
+    return payload
+
+
+def listing_rows(queryset: QuerySet[MediaList], fieldset: Fieldset) -> QuerySet:
+    """``queryset`` as the ``values()`` rows ``summary_payloads`` reads.
+
+    Rows also carry ``updated_at``, which the listing's validators hash.
+    """
+
+    return queryset.values(*sorted({*list_columns(fieldset), "updated_at"}))
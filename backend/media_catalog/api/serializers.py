@@ -1,9 +1,28 @@
 """Serializers for media catalog API endpoints."""
 
 from typing import Optional
+
+from django.urls import reverse
 from rest_framework import serializers
 
-from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListItem
+from media_catalog.models import (
+    IdentityTag,
+    MediaItem,
+    MediaList,
+    MediaListGenerationJob,
+    MediaListItem,
+)
+from media_catalog.services.imports import parse_tmdb_ids
+
+
+def _sparse(fields: dict, context: dict, attr: str) -> dict:
+    """Keep only the fields the request's ``Fieldset`` (see ``fieldsets``) asks for."""
+
+    fieldset = context.get("fieldset")
+    wanted = getattr(fieldset, attr, None)
+    if wanted is None:
+        return fields
+    return {name: field for name, field in fields.items() if name in wanted}
 
 
 class IdentityTagSerializer(serializers.ModelSerializer):
@@ -22,6 +41,9 @@ class IdentityTagSerializer(serializers.ModelSerializer):
 
 
 class MediaItemSerializer(serializers.ModelSerializer):
+    def get_fields(self):
+        return _sparse(super().get_fields(), self.context, "media_fields")
+
     class Meta:
         model = MediaItem
         fields = (
@@ -41,6 +63,9 @@ class MediaItemSerializer(serializers.ModelSerializer):
 class MediaListItemSerializer(serializers.ModelSerializer):
     media_item = MediaItemSerializer(read_only=True)
 
+    def get_fields(self):
+        return _sparse(super().get_fields(), self.context, "item_fields")
+
     class Meta:
         model = MediaListItem
         fields = (
@@ -53,7 +78,7 @@ class MediaListItemSerializer(serializers.ModelSerializer):
 
 class MediaListSummarySerializer(serializers.ModelSerializer):
     source_keyword = IdentityTagSerializer(read_only=True)
-    item_count = serializers.SerializerMethodField()
+    item_count = serializers.IntegerField(read_only=True)
     share_url = serializers.SerializerMethodField()
 
     class Meta:
@@ -71,8 +96,16 @@ class MediaListSummarySerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
-    def get_item_count(self, obj: MediaList) -> int:
-        return getattr(obj, "item_count", None) or obj.items.count()
+    def get_fields(self):
+        fields = super().get_fields()
+        fieldset = self.context.get("fieldset")
+        if fieldset is None:
+            return fields
+        if "source_keyword" not in fieldset.expand:
+            fields["source_keyword"] = serializers.PrimaryKeyRelatedField(read_only=True)
+        if "items" not in fieldset.expand:
+            fields.pop("items", None)
+        return _sparse(fields, self.context, "fields")
 
     def get_share_url(self, obj: MediaList) -> Optional[str]:
         request = self.context.get("request")
@@ -82,11 +115,18 @@ class MediaListSummarySerializer(serializers.ModelSerializer):
 
 
 class MediaListDetailSerializer(MediaListSummarySerializer):
-    items = MediaListItemSerializer(source="items.all", many=True, read_only=True)
+    items = serializers.SerializerMethodField()
 
     class Meta(MediaListSummarySerializer.Meta):
         fields = MediaListSummarySerializer.Meta.fields + ("items",)
 
+    def get_items(self, obj: MediaList) -> list:
+        items = obj.current_items()
+        fieldset = self.context.get("fieldset")
+        if fieldset is not None:
+            items = fieldset.restrict_items(items)
+        return MediaListItemSerializer(items, many=True, context=self.context).data
+
 
 class MediaListGenerateSerializer(serializers.Serializer):
     identity_tag = serializers.PrimaryKeyRelatedField(queryset=IdentityTag.objects.all())
@@ -104,6 +144,34 @@ class MediaListGenerateSerializer(serializers.Serializer):
         return value or None
 
 
+class TmdbIdListField(serializers.Field):
+    """A JSON list of TMDb ids, or CSV text (or an uploaded CSV file) with one id per row."""
+
+    def to_internal_value(self, data):
+        if hasattr(data, "read"):
+            data = data.read()
+        if isinstance(data, bytes):
+            data = data.decode("utf-8-sig", errors="replace")
+        try:
+            return parse_tmdb_ids(data)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc)) from exc
+
+
+class MediaListImportSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=200)
+    description = serializers.CharField(required=False, allow_blank=True, default="")
+    visibility = serializers.ChoiceField(
+        choices=MediaList.VISIBILITY_CHOICES,
+        default=MediaList.VISIBILITY_PUBLIC,
+    )
+    language = serializers.CharField(required=False, allow_blank=True)
+    tmdb_ids = TmdbIdListField()
+
+    def validate_language(self, value: str) -> Optional[str]:
+        return value or None
+
+
 class MediaListUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = MediaList
@@ -117,3 +185,30 @@ class MediaListUpdateSerializer(serializers.ModelSerializer):
             "description": {"required": False},
             "visibility": {"required": False},
         }
+
+
+class MediaListGenerationJobSerializer(serializers.ModelSerializer):
+    identity_tag = serializers.SlugRelatedField(source="tag", slug_field="slug", read_only=True)
+    media_list = serializers.SlugRelatedField(slug_field="slug", read_only=True)
+    status_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MediaListGenerationJob
+        fields = (
+            "id",
+            "status",
+            "identity_tag",
+            "language",
+            "limit",
+            "media_list",
+            "error",
+            "status_url",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+
+    def get_status_url(self, obj: MediaListGenerationJob) -> Optional[str]:
+        path = reverse("media-list-job-detail", kwargs={"pk": obj.pk})
+        request = self.context.get("request")
+        return request.build_absolute_uri(path) if request else path
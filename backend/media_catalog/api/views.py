@@ -1,20 +1,40 @@
 """REST API endpoints for queer-forward media discovery."""
 
-from django.db.models import Count, QuerySet
-from django.http import Http404
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from django.db.models import Max, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Greatest
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
 from django.utils.translation import gettext_lazy as _
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotAuthenticated, PermissionDenied
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from media_catalog.models import IdentityTag, MediaList
-from media_catalog.services import generate_media_list_for_identity
+from tmdb import TmdbError
 
+from media_catalog.models import IdentityTag, MediaList, MediaListGenerationJob, MediaListItem
+from media_catalog.services import GenerationJobConflict, enqueue_media_list_generation
+from media_catalog.services.exports import EXPORT_CONTENT_TYPES, EXPORT_FORMATS, export_catalog, export_media_list
+from media_catalog.services.imports import import_media_list
+
+from .fieldsets import Fieldset
+from .pagination import MediaListCursorPagination
+from .parsers import CsvTextParser
+from .representations import detail_payload, listing_rows, summary_payloads
 from .serializers import (
     IdentityTagSerializer,
     MediaListDetailSerializer,
     MediaListGenerateSerializer,
+    MediaListGenerationJobSerializer,
+    MediaListImportSerializer,
     MediaListSummarySerializer,
     MediaListUpdateSerializer,
 )
@@ -31,6 +51,113 @@ def _as_bool(value) -> bool:
     return normalized in {"1", "true", "yes", "on"}
 
 
+# Unlisted lists are reachable by link only, so they stay out of shared caches.
+CACHE_CONTROL_BY_VISIBILITY: Dict[str, Dict[str, Any]] = {
+    MediaList.VISIBILITY_PUBLIC: {"public": True, "max_age": 60},
+    MediaList.VISIBILITY_UNLISTED: {"private": True, "max_age": 60},
+    MediaList.VISIBILITY_PRIVATE: {"private": True, "no_cache": True},
+}
+
+
+def _with_items_changed_at(queryset: QuerySet[MediaList]) -> QuerySet[MediaList]:
+    """Annotate each list with the last edit to its published entries or the media they show.
+
+    Note edits and catalog sync renames leave ``MediaList.updated_at`` alone.
+    """
+
+    published = MediaListItem.objects.filter(media_list=OuterRef("pk")).filter(
+        Q(version_id=OuterRef("current_version_id"))
+        | Q(version__isnull=True, media_list__current_version__isnull=True)
+    )
+    return queryset.annotate(
+        items_changed_at=Subquery(
+            published.values("media_list")
+            .annotate(changed=Max(Greatest("updated_at", "media_item__updated_at")))
+            .values("changed")
+        )
+    )
+
+
+def _media_list_changed_at(media_list: MediaList) -> datetime:
+    items_changed_at = getattr(media_list, "items_changed_at", None)
+    return max(media_list.updated_at, items_changed_at) if items_changed_at else media_list.updated_at
+
+
+def _media_list_etag(media_list: MediaList, variant: str = "") -> str:
+    suffix = f"-{variant}" if variant else ""
+    changed_at = _media_list_changed_at(media_list)
+    return f'"{media_list.pk}-{changed_at.timestamp():.6f}-{media_list.current_version_id or 0}{suffix}"'
+
+
+def _with_cache_headers(
+    response: HttpResponse,
+    *,
+    etag: str,
+    last_modified: Optional[datetime],
+    cache_control: Dict[str, Any],
+) -> HttpResponse:
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_cache_control(response, **cache_control)
+    if cache_control.get("private"):
+        patch_vary_headers(response, ("Authorization", "Cookie"))
+    return response
+
+
+def _not_modified(request, **validators: Any) -> Optional[HttpResponse]:
+    """A 304 when the client already holds this representation, before any serialization."""
+
+    last_modified = validators["last_modified"]
+    response = get_conditional_response(
+        request,
+        etag=validators["etag"],
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+        response=_with_cache_headers(HttpResponse(), **validators),
+    )
+    return response if response.status_code == status.HTTP_304_NOT_MODIFIED else None
+
+
+def _export_format(request) -> Optional[str]:
+    # Not ``format``: DRF reserves it for renderer negotiation.
+    value = request.query_params.get("output", "ndjson").lower()
+    return value if value in EXPORT_FORMATS else None
+
+
+def _invalid_export_format() -> Response:
+    return Response(
+        {"detail": _("Le paramètre output doit valoir ndjson ou csv.")},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _export_response(lines, export_format: str, filename: str) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(lines, content_type=EXPORT_CONTENT_TYPES[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    patch_cache_control(response, no_store=True)
+    return response
+
+
+def _accepted(job: MediaListGenerationJob, request) -> Response:
+    output = MediaListGenerationJobSerializer(job, context={"request": request})
+    return Response(
+        output.data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={"Location": output.data["status_url"]},
+    )
+
+
+def _job_conflict(exc: GenerationJobConflict, request) -> Response:
+    output = MediaListGenerationJobSerializer(exc.job, context={"request": request})
+    return Response(
+        {
+            "detail": _("Une génération avec d'autres paramètres est déjà en attente pour cette identité."),
+            "job": output.data,
+        },
+        status=status.HTTP_409_CONFLICT,
+    )
+
+
 class IdentityTagViewSet(viewsets.ReadOnlyModelViewSet):
     """Expose curated identity tags members can explore."""
 
@@ -49,19 +176,51 @@ class MediaListViewSet(viewsets.ModelViewSet):
 
     lookup_field = "slug"
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = MediaListCursorPagination
 
     def get_queryset(self) -> QuerySet[MediaList]:  # type: ignore[override]
-        qs = MediaList.objects.select_related("owner", "source_keyword")
         action = getattr(self, "action", None)
-        if action == "retrieve":
-            qs = qs.prefetch_related("items__media_item")
         if action == "list":
-            qs = qs.annotate(item_count=Count("items"))
-            if self.request.user.is_authenticated:
-                qs = qs.filter(owner=self.request.user)
+            return self.fieldset.restrict_lists(self._listed_lists())
+        if action == "retrieve":
+            return _with_items_changed_at(self.fieldset.restrict_lists(MediaList.objects.all()))
+        return MediaList.objects.select_related("owner", "source_keyword")
+
+    @property
+    def fieldset(self) -> Fieldset:
+        """``?fields=``/``?expand=`` of a read; writes always answer with the full detail."""
+
+        if not hasattr(self, "_fieldset"):
+            if self.action in {"list", "retrieve"}:
+                self._fieldset = Fieldset.from_query(self.request.query_params, detail=self.action == "retrieve")
             else:
-                qs = qs.filter(visibility=MediaList.VISIBILITY_PUBLIC)
-        return qs
+                self._fieldset = Fieldset()
+        return self._fieldset
+
+    def _listed_lists(self) -> QuerySet[MediaList]:
+        if self.request.user.is_authenticated:
+            return MediaList.objects.filter(owner=self.request.user)
+        return MediaList.objects.filter(visibility=MediaList.VISIBILITY_PUBLIC)
+
+    def _page_validators(self, rows: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Validators for the served page: an edit, publish, insert or delete within it changes them.
+
+        They are derived from the page's own rows, so a conditional request costs
+        the keyset page query rather than a scan of every list. There is no
+        ``Last-Modified``: a removal from the page would not move it.
+        """
+
+        stamps = ",".join(f"{row['id']}:{row['updated_at'].timestamp():.6f}" for row in rows)
+        digest = hashlib.md5(
+            f"{self.request.user.pk}|{self.request.get_full_path()}|{stamps}".encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        visibility = MediaList.VISIBILITY_PRIVATE if self.request.user.is_authenticated else MediaList.VISIBILITY_PUBLIC
+        return {
+            "etag": f'W/"{digest}"',
+            "last_modified": None,
+            "cache_control": CACHE_CONTROL_BY_VISIBILITY[visibility],
+        }
 
     def get_serializer_class(self):  # type: ignore[override]
         if self.action == "list":
@@ -71,11 +230,11 @@ class MediaListViewSet(viewsets.ModelViewSet):
         return MediaListDetailSerializer
 
     def get_permissions(self):  # type: ignore[override]
-        if self.action in {"create", "partial_update", "destroy", "refresh"}:
+        if self.action in {"create", "partial_update", "destroy", "refresh", "bulk_import"}:
             return [permissions.IsAuthenticated()]
         return super().get_permissions()
 
-    # default create uses ModelSerializer; override to call generator service.
+    # default create uses ModelSerializer; override to queue the generator service.
     def create(self, request, *args, **kwargs) -> Response:
         if request.user.is_anonymous:
             raise NotAuthenticated()
@@ -84,35 +243,50 @@ class MediaListViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         payload = serializer.validated_data
 
-        media_list = generate_media_list_for_identity(
-            tag=payload["identity_tag"],
-            owner=request.user,
-            limit=payload["limit"],
-            include_adult=payload["include_adult"],
-            language=payload.get("language"),
-            visibility=payload["visibility"],
-            title=payload.get("title"),
-            description=payload.get("description"),
-        )
-
-        output = MediaListDetailSerializer(media_list, context={"request": request})
-        return Response(output.data, status=status.HTTP_201_CREATED)
+        try:
+            job, _ = enqueue_media_list_generation(
+                tag=payload["identity_tag"],
+                requested_by=request.user,
+                limit=payload["limit"],
+                include_adult=payload["include_adult"],
+                language=payload.get("language"),
+                visibility=payload["visibility"],
+                title=payload.get("title"),
+                description=payload.get("description"),
+            )
+        except GenerationJobConflict as exc:
+            return _job_conflict(exc, request)
+        return _accepted(job, request)
+
+    def list(self, request, *args, **kwargs) -> HttpResponse:
+        fieldset = self.fieldset
+        rows = listing_rows(self.filter_queryset(self.get_queryset()), fieldset)
+        page = self.paginate_queryset(rows)
+        served = page if page is not None else list(rows)
+        validators = self._page_validators(served)
+        not_modified = _not_modified(request, **validators)
+        if not_modified is not None:
+            return not_modified
 
-    def list(self, request, *args, **kwargs) -> Response:
-        queryset = self.filter_queryset(self.get_queryset())
-        page = self.paginate_queryset(queryset)
-        serializer_cls = self.get_serializer_class()
-        context = {"request": request}
         if page is not None:
-            serializer = serializer_cls(page, many=True, context=context)
-            return self.get_paginated_response(serializer.data)
-        serializer = serializer_cls(queryset, many=True, context=context)
-        return Response(serializer.data)
+            response = self.get_paginated_response(summary_payloads(page, fieldset, request=request))
+        else:
+            response = Response(summary_payloads(served, fieldset, request=request))
+        return _with_cache_headers(response, **validators)
 
-    def retrieve(self, request, *args, **kwargs) -> Response:
+    def retrieve(self, request, *args, **kwargs) -> HttpResponse:
+        fieldset = self.fieldset
         instance = self.get_object()
-        serializer = MediaListDetailSerializer(instance, context={"request": request})
-        return Response(serializer.data)
+        validators = {
+            "etag": _media_list_etag(instance, fieldset.variant),
+            "last_modified": _media_list_changed_at(instance),
+            "cache_control": CACHE_CONTROL_BY_VISIBILITY[instance.visibility],
+        }
+        not_modified = _not_modified(request, **validators)
+        if not_modified is not None:
+            return not_modified
+
+        return _with_cache_headers(Response(detail_payload(instance, fieldset, request=request)), **validators)
 
     def get_object(self) -> MediaList:  # type: ignore[override]
         queryset = self.get_queryset()
@@ -160,7 +334,7 @@ class MediaListViewSet(viewsets.ModelViewSet):
 
         limit = request.data.get("limit")
         try:
-            limit_value = int(limit) if limit is not None else media_list.items.count() or 12
+            limit_value = int(limit) if limit is not None else media_list.current_items().count() or 12
         except (TypeError, ValueError):
             return Response(
                 {"detail": _("Le paramètre limit doit être un entier.")},
@@ -170,20 +344,61 @@ class MediaListViewSet(viewsets.ModelViewSet):
         include_adult = _as_bool(request.data.get("include_adult", False))
         language = request.data.get("language") or None
 
-        refreshed = generate_media_list_for_identity(
-            tag=media_list.source_keyword,
-            owner=request.user,
-            limit=limit_value,
-            include_adult=include_adult,
-            language=language,
-            visibility=media_list.visibility,
-            title=media_list.title,
-            description=media_list.description,
-        )
+        try:
+            job, _ = enqueue_media_list_generation(
+                tag=media_list.source_keyword,
+                requested_by=request.user,
+                limit=limit_value,
+                include_adult=include_adult,
+                language=language,
+                visibility=media_list.visibility,
+                title=media_list.title,
+                description=media_list.description,
+            )
+        except GenerationJobConflict as exc:
+            return _job_conflict(exc, request)
+        return _accepted(job, request)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[JSONParser, CsvTextParser, MultiPartParser, FormParser],
+    )
+    def bulk_import(self, request) -> Response:
+        """Create a hand-made list from TMDb ids: a JSON list, a ``text/csv`` body or an uploaded CSV."""
+
+        serializer = MediaListImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            report = import_media_list(owner=request.user, **serializer.validated_data)
+        except TmdbError:
+            return Response(
+                {"detail": _("TMDb est injoignable pour le moment, réessayez plus tard.")},
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
 
-        refreshed.refresh_from_db()
-        output = MediaListDetailSerializer(refreshed, context={"request": request})
-        return Response(output.data)
+        media_list = report.media_list
+        media_list.refresh_from_db()
+        body = {
+            "media_list": detail_payload(media_list, request=request),
+            "existing": report.existing,
+            "fetched": report.fetched,
+            "not_found": list(report.not_found),
+            "failed": list(report.failed),
+        }
+        location = request.build_absolute_uri(reverse("media-list-detail", kwargs={"slug": media_list.slug}))
+        return Response(body, status=status.HTTP_201_CREATED, headers={"Location": location})
+
+    @action(detail=True, methods=["get"], url_path="export")
+    def export(self, request, slug: str | None = None) -> HttpResponse:
+        """Stream the published entries as NDJSON (default) or CSV (``?output=csv``)."""
+
+        export_format = _export_format(request)
+        if export_format is None:
+            return _invalid_export_format()
+        media_list = self.get_object()
+        return _export_response(export_media_list(media_list, export_format), export_format, media_list.slug)
 
     def _user_can_view(self, media_list: MediaList) -> bool:
         request = self.request
@@ -194,3 +409,29 @@ class MediaListViewSet(viewsets.ModelViewSet):
         if media_list.visibility == MediaList.VISIBILITY_UNLISTED:
             return True
         return False
+
+
+class MediaItemExportView(APIView):
+    """Stream the whole MediaItem catalog as NDJSON (default) or CSV, for staff."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        export_format = _export_format(request)
+        if export_format is None:
+            return _invalid_export_format()
+        return _export_response(export_catalog(export_format), export_format, "media-catalog")
+
+
+class MediaListGenerationJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Poll the status of the list generations the requesting member queued."""
+
+    serializer_class = MediaListGenerationJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self) -> QuerySet[MediaListGenerationJob]:  # type: ignore[override]
+        return (
+            MediaListGenerationJob.objects.select_related("tag", "media_list")
+            .filter(requested_by=self.request.user)
+            .order_by("-created_at")
+        )
@@ -1,7 +1,21 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class MediaCatalogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "media_catalog"
     verbose_name = "Media Catalog"
+
+    def ready(self) -> None:
+        from accounts.models import TriggerTopic, TriggerTopicKeyword
+
+        from .models import IdentityTagKeyword
+        from .services.keywords import invalidate_keyword_index
+        from .services.triggers import invalidate_trigger_index
+
+        post_save.connect(invalidate_keyword_index, sender=IdentityTagKeyword, dispatch_uid="keyword-index-save")
+        post_delete.connect(invalidate_keyword_index, sender=IdentityTagKeyword, dispatch_uid="keyword-index-delete")
+        for model in (TriggerTopic, TriggerTopicKeyword):
+            post_save.connect(invalidate_trigger_index, sender=model, dispatch_uid=f"trigger-index-save-{model.__name__}")
+            post_delete.connect(invalidate_trigger_index, sender=model, dispatch_uid=f"trigger-index-delete-{model.__name__}")
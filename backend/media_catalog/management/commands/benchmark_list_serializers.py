@@ -0,0 +1,100 @@
+"""Time the DRF media list serializers against the ``values()`` fast path."""
+
+import time
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.test import APIRequestFactory
+
+from media_catalog.api.fieldsets import Fieldset
+from media_catalog.api.representations import detail_payload, listing_rows, summary_payloads
+from media_catalog.api.serializers import MediaListDetailSerializer, MediaListSummarySerializer
+from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListItem
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _best_of(rounds: int, render) -> float:
+    """Best wall time of ``rounds`` renders, in milliseconds."""
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Render a generated media list through the DRF serializers and the values() fast path "
+        "and report the speedup. Fixture rows are rolled back."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--items", type=int, default=200, help="Items in the benchmark list (default: 200).")
+        parser.add_argument("--lists", type=int, default=50, help="Lists in the summary page (default: 50).")
+        parser.add_argument("--rounds", type=int, default=20, help="Renders per path; the best is kept (default: 20).")
+
+    def handle(self, *args, **options) -> None:
+        if min(options["items"], options["lists"], options["rounds"]) < 1:
+            raise CommandError("--items, --lists and --rounds must be positive.")
+        try:
+            with transaction.atomic():
+                self._run(options["items"], options["lists"], options["rounds"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, item_count: int, list_count: int, rounds: int) -> None:
+        owner = get_user_model().objects.create_user("benchmark-list-serializers")
+        tag = IdentityTag.objects.create(name="Benchmark", slug="benchmark-list-serializers")
+        media_items = MediaItem.objects.bulk_create(
+            MediaItem(
+                tmdb_id=900_000_000 + index,
+                title=f"Benchmark film {index}",
+                overview="Lorem ipsum " * 20,
+                release_date=date(2000 + index % 25, 1, 1),
+                poster_url=f"https://image.tmdb.org/t/p/w500/{index}.jpg",
+                metadata={"summary": {"id": index, "genre_ids": [18, 10749], "popularity": index / 3}},
+            )
+            for index in range(item_count)
+        )
+        lists = [
+            MediaList.objects.create(title=f"Benchmark {index}", slug=f"benchmark-{index}", owner=owner, source_keyword=tag)
+            for index in range(list_count)
+        ]
+        media_list = lists[0]
+        MediaListItem.objects.bulk_create(
+            MediaListItem(media_list=media_list, media_item=item, position=position)
+            for position, item in enumerate(media_items, start=1)
+        )
+        media_list.refresh_item_count()
+
+        request = APIRequestFactory().get("/api/media-lists/", HTTP_HOST="localhost")
+        instance = MediaList.objects.select_related("source_keyword").get(pk=media_list.pk)
+        listing = MediaList.objects.filter(owner=owner).select_related("source_keyword").order_by("-created_at", "-id")
+        summary_fieldset = Fieldset(expand=frozenset({"source_keyword"}))
+        context = {"request": request}
+
+        timings = {
+            f"detail ({item_count} items)": (
+                _best_of(rounds, lambda: MediaListDetailSerializer(instance, context=context).data),
+                _best_of(rounds, lambda: detail_payload(instance, request=request)),
+            ),
+            f"summary ({list_count} lists)": (
+                _best_of(rounds, lambda: MediaListSummarySerializer(list(listing), many=True, context=context).data),
+                _best_of(
+                    rounds,
+                    lambda: summary_payloads(listing_rows(listing, summary_fieldset), summary_fieldset, request=request),
+                ),
+            ),
+        }
+        for label, (drf_ms, fast_ms) in timings.items():
+            self.stdout.write(
+                f"{label}: serializer {drf_ms:.2f} ms, values() {fast_ms:.2f} ms, {drf_ms / fast_ms:.1f}x faster"
+            )
@@ -0,0 +1,53 @@
+"""Export the MediaItem catalog, or one media list, as NDJSON or CSV."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from media_catalog.models import MediaList
+from media_catalog.services.exports import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, export_catalog, export_media_list
+
+
+class Command(BaseCommand):
+    help = "Stream the MediaItem catalog (or a list's published items) to stdout or a file, in constant memory."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--list", dest="slug", help="Export this media list instead of the whole catalog.")
+        parser.add_argument(
+            "--output",
+            choices=EXPORT_FORMATS,
+            default="ndjson",
+            help="Output format (default: ndjson).",
+        )
+        parser.add_argument("--file", help="Write here instead of stdout.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f"Rows fetched per database round trip (default: {EXPORT_CHUNK_SIZE}).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive.")
+        if options["slug"]:
+            media_list = MediaList.objects.filter(slug=options["slug"]).first()
+            if media_list is None:
+                raise CommandError(f"No media list with slug {options['slug']!r}.")
+            lines = export_media_list(media_list, options["output"], chunk_size=options["chunk_size"])
+        else:
+            lines = export_catalog(options["output"], chunk_size=options["chunk_size"])
+
+        if options["file"]:
+            with open(options["file"], "w", encoding="utf-8", newline="") as handle:
+                lines_written = self._write(lines, handle.write)
+        else:
+            lines_written = self._write(lines, lambda line: self.stdout.write(line, ending=""))
+        rows = lines_written - 1 if options["output"] == "csv" else lines_written
+        self.stderr.write(f"Exported {rows} row(s).", style_func=self.style.SUCCESS)
+
+    @staticmethod
+    def _write(lines, write) -> int:
+        written = 0
+        for line in lines:
+            write(line)
+            written += 1
+        return written
@@ -0,0 +1,35 @@
+"""Garbage-collect superseded media list versions (run from cron)."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from media_catalog.services.versions import VERSION_GRACE_PERIOD, prune_media_list_versions
+
+
+class Command(BaseCommand):
+    help = "Delete superseded MediaListVersion snapshots, keeping the newest per list."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=2,
+            help="Versions to keep per list, the current one included (default: 2).",
+        )
+        parser.add_argument(
+            "--grace-minutes",
+            type=int,
+            default=int(VERSION_GRACE_PERIOD.total_seconds() // 60),
+            help="Never delete versions younger than this (default: 60).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        try:
+            deleted = prune_media_list_versions(
+                keep=options["keep"],
+                grace_period=timedelta(minutes=options["grace_minutes"]),
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} media list version(s)."))
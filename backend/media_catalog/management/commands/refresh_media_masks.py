@@ -0,0 +1,22 @@
+"""Recompute MediaItem genre, format and trigger masks, e.g. after editing trigger keywords."""
+
+from django.core.management.base import BaseCommand
+
+from media_catalog.models import MediaItem
+from media_catalog.services.masks import backfill_media_masks
+
+
+class Command(BaseCommand):
+    help = "Recompute the precomputed bitmasks of every MediaItem from its stored TMDb metadata."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows read and updated per batch (default: 500).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        updated = backfill_media_masks(MediaItem.objects.all(), batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Updated the masks of {updated} media item(s)."))
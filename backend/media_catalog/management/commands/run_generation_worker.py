@@ -0,0 +1,60 @@
+"""Worker process executing queued media list generation jobs."""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from media_catalog.services.jobs import claim_next_job, expire_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = (
+        "Process pending MediaListGenerationJob rows. Start several of these "
+        "processes to scale out; claims are safe across workers."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue and exit instead of polling forever.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep when the queue is empty (default: 2).",
+        )
+        parser.add_argument(
+            "--expire-interval",
+            type=float,
+            default=60.0,
+            help="Seconds between sweeps failing jobs whose worker vanished (default: 60).",
+        )
+
+    def _expire_stale_jobs(self) -> None:
+        expired = expire_stale_jobs()
+        if expired:
+            self.stdout.write(self.style.WARNING(f"Marked {expired} stale running job(s) as failed."))
+
+    def handle(self, *args, **options) -> None:
+        self._expire_stale_jobs()
+        next_sweep = time.monotonic() + options["expire_interval"]
+
+        while True:
+            close_old_connections()
+            if time.monotonic() >= next_sweep:
+                # Another worker may have died mid-job since startup.
+                self._expire_stale_jobs()
+                next_sweep = time.monotonic() + options["expire_interval"]
+            job = claim_next_job()
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            job = run_job(job)
+            style = self.style.SUCCESS if job.status == job.STATUS_SUCCEEDED else self.style.ERROR
+            self.stdout.write(style(f"Job {job.pk} ({job.tag.slug}) → {job.status}"))
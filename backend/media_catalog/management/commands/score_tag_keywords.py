@@ -0,0 +1,46 @@
+"""Rank each identity tag's TMDb keywords by discover yield."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from media_catalog.models import IdentityTag
+from media_catalog.services.keyword_yield import score_tag_keywords
+from tmdb import TmdbError
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure result counts, overlap and popularity of every tag keyword on TMDb "
+        "and store a ranking so discovery queries the most productive keywords first."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--tag",
+            action="append",
+            dest="tags",
+            metavar="SLUG",
+            help="Only score this identity tag (repeatable; default: every mapped tag).",
+        )
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=1,
+            help="Discover pages sampled per keyword to estimate overlap (default: 1).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        tags = None
+        if options["tags"]:
+            tags = list(IdentityTag.objects.filter(slug__in=options["tags"]))
+            missing = set(options["tags"]) - {tag.slug for tag in tags}
+            if missing:
+                raise CommandError(f"Unknown identity tag(s): {', '.join(sorted(missing))}")
+
+        try:
+            rankings = score_tag_keywords(tags=tags, pages=options["pages"])
+        except (TmdbError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for slug, keyword_ids in rankings.items():
+            self.stdout.write(f"{slug}: {', '.join(str(keyword_id) for keyword_id in keyword_ids)}")
+        self.stdout.write(self.style.SUCCESS(f"Scored keywords for {len(rankings)} tag(s)."))
@@ -0,0 +1,32 @@
+"""Refresh catalog entries TMDb reports as changed since the last run."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from media_catalog.services import sync_catalog_changes
+from tmdb import TmdbError
+
+
+class Command(BaseCommand):
+    help = "Poll TMDb's movie change feed and refresh only the MediaItems that changed."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20,
+            help="Number of changed movies refreshed per detail batch (default: 20).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        try:
+            report = sync_catalog_changes(batch_size=options["batch_size"])
+        except (TmdbError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced {report.window_start:%Y-%m-%d %H:%M} → {report.window_end:%Y-%m-%d %H:%M}: "
+                f"{report.changed} changed, {report.refreshed} refreshed, "
+                f"{report.skipped} skipped, {report.missing} missing on TMDb."
+            )
+        )
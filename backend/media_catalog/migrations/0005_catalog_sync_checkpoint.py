@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 16:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0004_map_tmdb_keyword_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogSyncCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.SlugField(max_length=80, unique=True)),
+                ('synced_until', models.DateTimeField(blank=True, null=True)),
+                ('last_report', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+    ]
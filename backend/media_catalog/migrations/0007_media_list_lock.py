@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0006_media_list_generation_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaListLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=220, unique=True)),
+                ('token', models.CharField(max_length=64)),
+                ('acquired_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['key'],
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0007_media_list_lock'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='medialistitem',
+            unique_together=set(),
+        ),
+        migrations.CreateModel(
+            name='MediaListVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('media_list', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='versions', to='media_catalog.medialist')),
+            ],
+            options={
+                'ordering': ['media_list', '-number'],
+            },
+        ),
+        migrations.AddField(
+            model_name='medialist',
+            name='current_version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='media_catalog.medialistversion'),
+        ),
+        migrations.AddField(
+            model_name='medialistitem',
+            name='version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='media_catalog.medialistversion'),
+        ),
+        migrations.AddConstraint(
+            model_name='medialistitem',
+            constraint=models.UniqueConstraint(fields=('version', 'media_item'), name='unique_version_media_item'),
+        ),
+        migrations.AddConstraint(
+            model_name='medialistitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('version__isnull', True)), fields=('media_list', 'media_item'), name='unique_unversioned_media_list_item'),
+        ),
+        migrations.AddConstraint(
+            model_name='medialistversion',
+            constraint=models.UniqueConstraint(fields=('media_list', 'number'), name='unique_media_list_version_number'),
+        ),
+    ]
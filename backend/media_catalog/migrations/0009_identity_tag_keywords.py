@@ -0,0 +1,114 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Keyword IDs per identity tag, most representative first (formerly tmdb.keywords).
+TAG_KEYWORDS = {
+    "trans-joy": [
+        265451, 343076, 254152, 268076, 335948,
+        274776, 14702, 290527, 325300, 317540,
+        328899, 307399, 217271, 189962, 312909,
+    ],
+    "lesbian-love": [
+        264386, 308586, 315385, 319872, 9833,
+        15136, 305694, 328765, 345079, 308587,
+        290382, 272066,
+    ],
+    "gay-celebration": [
+        258533, 10180, 275157, 173672, 264411,
+        241179, 259285, 326218, 293495, 267923,
+        272617, 239239, 250937, 157096,
+    ],
+    "queer-joy": [
+        250606, 321567, 333327, 333766, 332049,
+        312912, 300642, 346116, 304694, 207958,
+        314127, 265587, 347179,
+    ],
+    "lgbt-history": [
+        158718, 346871, 348563, 275749, 313433,
+        280179, 156501, 267488, 271115, 271167,
+        325395, 253337, 236454,
+    ],
+    "non-binary": [
+        252909, 266529, 281283, 210039, 34221,
+        312910, 34214, 234700, 11402,
+    ],
+    "gender-studies": [
+        246413, 34214, 210039, 234700, 34221,
+        273188, 299718, 11402,
+    ],
+    "radical-feminism": [
+        309966, 2383, 11718, 301659, 293179,
+        228965, 6337, 338884, 161166, 208591,
+        221195, 296536,
+    ],
+    "intersex": [
+        240109, 257264, 9331, 273188,
+    ],
+    "asexual": [
+        329977, 247099, 329976, 322171,
+    ],
+    "tds-sex-work": [
+        271159, 13059, 245541, 226543, 190178,
+        163791, 279793, 254724,
+    ],
+    "bisexual": [
+        329968, 168812, 287417, 3183,
+    ],
+    "pansexual": [
+        262765, 155870,
+    ],
+    "disability-joy": [],
+    "bipoc-lgbtq": [
+        316515, 195624, 272309, 291081, 233840,
+        11550, 257456, 10144,
+    ],
+}
+
+
+def seed_tag_keywords(apps, schema_editor):
+    IdentityTag = apps.get_model("media_catalog", "IdentityTag")
+    IdentityTagKeyword = apps.get_model("media_catalog", "IdentityTagKeyword")
+
+    tags = IdentityTag.objects.in_bulk(list(TAG_KEYWORDS), field_name="slug")
+    rows = []
+    for slug, keyword_ids in TAG_KEYWORDS.items():
+        tag = tags.get(slug)
+        if tag is None:
+            continue
+        count = len(keyword_ids)
+        for index, keyword_id in enumerate(dict.fromkeys(keyword_ids)):
+            rows.append(IdentityTagKeyword(tag=tag, keyword_id=keyword_id, weight=round(1 - index / count, 3)))
+    IdentityTagKeyword.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def unseed_tag_keywords(apps, schema_editor):
+    apps.get_model("media_catalog", "IdentityTagKeyword").objects.all().delete()
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0008_media_list_versions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdentityTagKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword_id', models.PositiveIntegerField(db_index=True)),
+                ('weight', models.FloatField(default=1.0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='keywords', to='media_catalog.identitytag')),
+            ],
+            options={
+                'ordering': ['tag', '-weight', 'keyword_id'],
+                'constraints': [models.UniqueConstraint(fields=('tag', 'keyword_id'), name='unique_identity_tag_keyword')],
+            },
+        ),
+        migrations.RunPython(seed_tag_keywords, unseed_tag_keywords),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0009_identity_tag_keywords'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='identitytagkeyword',
+            options={'ordering': ['tag', models.OrderBy(models.F('rank'), nulls_last=True), '-weight', 'keyword_id']},
+        ),
+        migrations.AddField(
+            model_name='identitytagkeyword',
+            name='median_popularity',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='identitytagkeyword',
+            name='overlap',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='identitytagkeyword',
+            name='rank',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='identitytagkeyword',
+            name='result_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='identitytagkeyword',
+            name='scored_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:34
+
+from django.db import migrations, models
+
+MASK_FIELDS = ["genre_mask", "format_mask"]
+
+# Frozen copy of ``media_catalog.services.masks`` as of this migration: bit i is
+# the i-th genre below. Later changes to the app's table go through
+# ``refresh_media_masks``, not through this backfill.
+GENRES = (
+    (28, "action"),
+    (12, "adventure"),
+    (16, "animation"),
+    (35, "comedy"),
+    (80, "crime"),
+    (99, "documentary"),
+    (18, "drama"),
+    (10751, "family"),
+    (14, "fantasy"),
+    (36, "history"),
+    (27, "horror"),
+    (10402, "music"),
+    (9648, "mystery"),
+    (10749, "romance"),
+    (878, "science fiction"),
+    (10770, "tv movie"),
+    (53, "thriller"),
+    (10752, "war"),
+    (37, "western"),
+)
+BIT_BY_GENRE_ID = {genre_id: 1 << index for index, (genre_id, _) in enumerate(GENRES)}
+BIT_BY_GENRE_NAME = {name: 1 << index for index, (_, name) in enumerate(GENRES)}
+FORMAT_SHORT = 1
+FORMAT_LONG = 2
+FORMAT_UNKNOWN_RUNTIME = 4
+SHORT_FORM_MAX_RUNTIME = 45
+
+
+def genre_mask(genres):
+    mask = 0
+    for genre in genres or ():
+        if isinstance(genre, dict):
+            bit = BIT_BY_GENRE_ID.get(genre.get("id")) or BIT_BY_GENRE_NAME.get((genre.get("name") or "").lower())
+        elif isinstance(genre, int):
+            bit = BIT_BY_GENRE_ID.get(genre)
+        else:
+            bit = BIT_BY_GENRE_NAME.get(str(genre).lower())
+        mask |= bit or 0
+    return mask
+
+
+def format_mask(runtime):
+    if not isinstance(runtime, (int, float)) or isinstance(runtime, bool) or runtime <= 0:
+        return FORMAT_UNKNOWN_RUNTIME
+    return FORMAT_SHORT if runtime <= SHORT_FORM_MAX_RUNTIME else FORMAT_LONG
+
+
+def backfill_masks(apps, schema_editor):
+    MediaItem = apps.get_model("media_catalog", "MediaItem")
+    batch = []
+    for media_item in MediaItem.objects.only("pk", "metadata").iterator(chunk_size=500):
+        metadata = media_item.metadata or {}
+        summary = metadata.get("summary") or {}
+        details = metadata.get("details") or {}
+        media_item.genre_mask = genre_mask(details.get("genres") or summary.get("genre_ids") or ())
+        media_item.format_mask = format_mask(details.get("runtime") or summary.get("runtime"))
+        batch.append(media_item)
+        if len(batch) >= 500:
+            MediaItem.objects.bulk_update(batch, MASK_FIELDS)
+            batch = []
+    if batch:
+        MediaItem.objects.bulk_update(batch, MASK_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0010_identity_tag_keyword_yield'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaitem',
+            name='format_mask',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='mediaitem',
+            name='genre_mask',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_masks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0011_media_item_masks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediaitem',
+            name='trigger_mask',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_item_counts(apps, schema_editor):
+    MediaList = apps.get_model("media_catalog", "MediaList")
+    MediaListItem = apps.get_model("media_catalog", "MediaListItem")
+    media_lists = list(MediaList.objects.only("pk", "current_version_id"))
+    for media_list in media_lists:
+        media_list.item_count = MediaListItem.objects.filter(
+            media_list_id=media_list.pk,
+            version_id=media_list.current_version_id,
+        ).count()
+    MediaList.objects.bulk_update(media_lists, ["item_count"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0012_media_item_trigger_mask'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='medialist',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddField(
+            model_name='medialist',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='medialist',
+            index=models.Index(fields=['owner', '-created_at', '-id'], name='media_list_owner_created'),
+        ),
+        migrations.AddIndex(
+            model_name='medialist',
+            index=models.Index(fields=['visibility', '-created_at', '-id'], name='media_list_visibility_created'),
+        ),
+        migrations.RunPython(backfill_item_counts, migrations.RunPython.noop),
+    ]
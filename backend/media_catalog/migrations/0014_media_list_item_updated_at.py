@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-19 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('media_catalog', '0013_media_list_item_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='medialistitem',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
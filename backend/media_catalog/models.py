@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import QuerySet
+from django.utils import timezone
 
 
 class IdentityTag(models.Model):
@@ -31,6 +33,37 @@ class IdentityTag(models.Model):
         return self.name
 
 
+class IdentityTagKeyword(models.Model):
+    """TMDb keyword associated with an identity tag.
+
+    A tag maps to several keywords. ``rank``, computed offline from discover
+    yield, orders them when present, then ``weight``; the first acts as the
+    tag's primary keyword. The same keyword may serve several tags.
+    """
+
+    tag = models.ForeignKey(IdentityTag, on_delete=models.CASCADE, related_name="keywords")
+    keyword_id = models.PositiveIntegerField(db_index=True)
+    weight = models.FloatField(default=1.0)
+
+    rank = models.PositiveIntegerField(blank=True, null=True)
+    result_count = models.PositiveIntegerField(blank=True, null=True)
+    overlap = models.FloatField(blank=True, null=True)
+    median_popularity = models.FloatField(blank=True, null=True)
+    scored_at = models.DateTimeField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["tag", models.F("rank").asc(nulls_last=True), "-weight", "keyword_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["tag", "keyword_id"], name="unique_identity_tag_keyword"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.tag} ← {self.keyword_id} ({self.weight:g})"
+
+
 class MediaItem(models.Model):
     """Representation of a TMDb-backed media entity."""
 
@@ -50,6 +83,11 @@ class MediaItem(models.Model):
     backdrop_url = models.URLField(blank=True)
     overview = models.TextField(blank=True)
     metadata = models.JSONField(blank=True, default=dict)
+    # Precomputed from metadata at ingest, see media_catalog.services.masks.
+    genre_mask = models.PositiveBigIntegerField(default=0)
+    format_mask = models.PositiveSmallIntegerField(default=0)
+    # One bit per accounts.TriggerTopic whose keywords the item carries.
+    trigger_mask = models.PositiveBigIntegerField(default=0)
 
     identity_tags = models.ManyToManyField(IdentityTag, related_name="media_items", blank=True)
 
@@ -94,21 +132,85 @@ class MediaList(models.Model):
         null=True,
         blank=True,
     )
+    current_version = models.ForeignKey(
+        "MediaListVersion",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+    # Size of the published version, kept in step by publishing and item edits.
+    item_count = models.PositiveIntegerField(default=0)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # Keyset pagination of the API listing, per owner and for public lists.
+            models.Index(fields=["owner", "-created_at", "-id"], name="media_list_owner_created"),
+            models.Index(fields=["visibility", "-created_at", "-id"], name="media_list_visibility_created"),
+        ]
 
     def __str__(self) -> str:
         return self.title
 
+    def refresh_item_count(self) -> int:
+        """Recount the published items and store the result.
+
+        ``updated_at`` moves too: it is what the API's validators see change
+        when a hand-made list's items are edited.
+        """
+
+        self.item_count = self.current_items().count()
+        self.updated_at = timezone.now()
+        MediaList.objects.filter(pk=self.pk).update(item_count=self.item_count, updated_at=self.updated_at)
+        return self.item_count
+
+    def current_items(self) -> QuerySet["MediaListItem"]:
+        """Items of the published version (unversioned items for hand-made lists)."""
+
+        return (
+            MediaListItem.objects.filter(media_list=self, version_id=self.current_version_id)
+            .select_related("media_item")
+            .order_by("position", "-created_at")
+        )
+
+
+class MediaListVersion(models.Model):
+    """Immutable snapshot of a list's items.
+
+    Generation writes a complete new version, then publishes it by repointing
+    `MediaList.current_version`, so readers never observe a half-written set.
+    Superseded versions are removed by `prune_media_list_versions`.
+    """
+
+    media_list = models.ForeignKey(MediaList, on_delete=models.CASCADE, related_name="versions")
+    number = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["media_list", "-number"]
+        constraints = [
+            models.UniqueConstraint(fields=["media_list", "number"], name="unique_media_list_version_number")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.media_list} v{self.number}"
+
 
 class MediaListItem(models.Model):
     """Link media items to their list with ordering and annotations."""
 
     media_list = models.ForeignKey(MediaList, on_delete=models.CASCADE, related_name="items")
+    version = models.ForeignKey(
+        MediaListVersion,
+        on_delete=models.CASCADE,
+        related_name="items",
+        null=True,
+        blank=True,
+    )
     media_item = models.ForeignKey(MediaItem, on_delete=models.CASCADE, related_name="list_entries")
     position = models.PositiveIntegerField(validators=[MinValueValidator(1)], default=1)
     notes = models.TextField(blank=True)
@@ -120,10 +222,126 @@ class MediaListItem(models.Model):
         related_name="media_list_contributions",
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ("media_list", "media_item")
         ordering = ["position", "-created_at"]
+        constraints = [
+            models.UniqueConstraint(fields=["version", "media_item"], name="unique_version_media_item"),
+            models.UniqueConstraint(
+                fields=["media_list", "media_item"],
+                condition=models.Q(version__isnull=True),
+                name="unique_unversioned_media_list_item",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.media_item} in {self.media_list}"
+
+
+class CatalogSyncCheckpoint(models.Model):
+    """Bookmark recording how far a TMDb sync job has progressed."""
+
+    name = models.SlugField(max_length=80, unique=True)
+    synced_until = models.DateTimeField(blank=True, null=True)
+    last_report = models.JSONField(blank=True, default=dict)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return f"{self.name} @ {self.synced_until or 'never'}"
+
+
+class MediaListGenerationJob(models.Model):
+    """Queued request to (re)generate an identity-driven media list.
+
+    Jobs live in the database so web workers can hand generation off without a
+    broker; `run_generation_worker` processes claim and execute them. At most one
+    pending job may exist per tag and language so bursts of refreshes collapse.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    tag = models.ForeignKey(IdentityTag, on_delete=models.CASCADE, related_name="generation_jobs")
+    language = models.CharField(max_length=16, blank=True)
+    limit = models.PositiveIntegerField(default=12)
+    include_adult = models.BooleanField(default=False)
+    visibility = models.CharField(
+        max_length=16,
+        choices=MediaList.VISIBILITY_CHOICES,
+        default=MediaList.VISIBILITY_PUBLIC,
+    )
+    title = models.CharField(max_length=200, blank=True)
+    description = models.TextField(blank=True)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="media_list_jobs",
+    )
+
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    media_list = models.ForeignKey(
+        MediaList,
+        on_delete=models.SET_NULL,
+        related_name="generation_jobs",
+        null=True,
+        blank=True,
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [models.Index(fields=["status", "created_at"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tag", "language"],
+                condition=models.Q(status="pending"),
+                name="unique_pending_generation_job",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.tag} [{self.language or 'default'}] – {self.status}"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in {self.STATUS_SUCCEEDED, self.STATUS_FAILED}
+
+
+class MediaListLock(models.Model):
+    """Lease guarding a shared list while one worker regenerates it.
+
+    A row exists only while generation runs; its unique ``key`` makes acquisition
+    a single INSERT on any database. Expired leases are reclaimed by the next
+    caller so a crashed worker cannot block a list forever.
+    """
+
+    key = models.CharField(max_length=220, unique=True)
+    token = models.CharField(max_length=64)
+    acquired_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["key"]
+
+    def __str__(self) -> str:
+        return f"{self.key} (until {self.expires_at})"
@@ -1,6 +1,17 @@
 """Service entry points for the media catalog app."""
 
-from .generator import generate_media_list_for_identity
+from .generator import IdentityListRequest, generate_media_list_for_identity, generate_media_lists_for_identities
+from .jobs import GenerationJobConflict, enqueue_media_list_generation, run_pending_jobs
+from .sync import SyncReport, sync_catalog_changes
 
-__all__ = ["generate_media_list_for_identity"]
+__all__ = [
+    "IdentityListRequest",
+    "generate_media_list_for_identity",
+    "generate_media_lists_for_identities",
+    "GenerationJobConflict",
+    "enqueue_media_list_generation",
+    "run_pending_jobs",
+    "SyncReport",
+    "sync_catalog_changes",
+]
 
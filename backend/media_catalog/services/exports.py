@@ -0,0 +1,93 @@
+"""Constant-memory NDJSON/CSV exports of media lists and the catalog.
+
+Rows are read with ``values_list(...).iterator(chunk_size=...)`` and encoded one
+line at a time, so callers can hand the generators to a
+``StreamingHttpResponse`` or write them to a file without ever holding the
+export in memory.
+"""
+
+import csv
+from typing import Any, Iterable, Iterator, Sequence, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from media_catalog.models import MediaItem, MediaList
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+EXPORT_CHUNK_SIZE = 2000
+
+CATALOG_COLUMNS = (
+    "id",
+    "tmdb_id",
+    "media_type",
+    "title",
+    "original_title",
+    "release_date",
+    "poster_url",
+    "backdrop_url",
+    "overview",
+)
+# Output name → lookup from MediaListItem.
+LIST_COLUMNS = (
+    ("position", "position"),
+    ("tmdb_id", "media_item__tmdb_id"),
+    ("media_type", "media_item__media_type"),
+    ("title", "media_item__title"),
+    ("original_title", "media_item__original_title"),
+    ("release_date", "media_item__release_date"),
+    ("notes", "notes"),
+)
+
+
+class _Echo:
+    """File-like sink handing each CSV line back to the generator."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _encode_ndjson(names: Sequence[str], rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(names, row))) + "\n"
+
+
+def _encode_csv(names: Sequence[str], rows: Iterable[Tuple[Any, ...]]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(names)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _export(
+    queryset: QuerySet,
+    columns: Sequence[Tuple[str, str]],
+    export_format: str,
+    chunk_size: int,
+) -> Iterator[str]:
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format!r}; expected one of {', '.join(EXPORT_FORMATS)}.")
+    names = [name for name, _ in columns]
+    rows = queryset.values_list(*(lookup for _, lookup in columns)).iterator(chunk_size=chunk_size)
+    encode = _encode_ndjson if export_format == "ndjson" else _encode_csv
+    return encode(names, rows)
+
+
+def export_catalog(export_format: str, *, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """Every MediaItem, by id; ``metadata`` is left out to keep rows flat."""
+
+    queryset = MediaItem.objects.order_by("id")
+    return _export(queryset, [(name, name) for name in CATALOG_COLUMNS], export_format, chunk_size)
+
+
+def export_media_list(media_list: MediaList, export_format: str, *, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """The published entries of ``media_list`` in list order."""
+
+    queryset = media_list.current_items().select_related(None)
+    return _export(queryset, LIST_COLUMNS, export_format, chunk_size)
+
@@ -4,21 +4,34 @@ import logging
 from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from django.db import transaction
+from django.db.models import F
 from django.utils.text import slugify
 
 from tmdb import TmdbClient, TmdbError, TmdbNotFoundError, get_tmdb_client
-from tmdb.services import resolve_keyword_id
-from tmdb.keywords import get_primary_keyword_for_theme, get_keywords_for_theme
+from tmdb.services import discover_movies_with_stats, resolve_keyword_id
 
 from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListItem
 
+from .keywords import get_keyword_index, tag_ids_for_details
+from .locks import acquire_list_lock, release_list_lock, wait_for_list_lock
+from .masks import media_masks
+from .ranking import rank_candidates
+from .triggers import trigger_mask_for_details
+from .versions import publish_media_list_version
+
 LOGGER = logging.getLogger(__name__)
 
 POSTER_BASE_URL = "https://image.tmdb.org/t/p/w500"
 BACKDROP_BASE_URL = "https://image.tmdb.org/t/p/w780"
+DEFAULT_LOCK_WAIT = 30.0
+# Keywords of a tag ORed into its discover query (the TMDb cap).
+MAX_DISCOVERY_KEYWORDS = 5
+# Discover pages a tag may spend, as a multiple of what its OR query needs for
+# ``limit``; the rest of the budget goes to one page per keyword.
+DISCOVERY_PAGE_BUDGET = 2
 DEFAULT_APPEND = "credits,external_ids,keywords,release_dates,watch/providers,similar,recommendations"
 
 
@@ -43,7 +56,9 @@ def _build_image_url(path: Optional[str], base: str) -> Optional[str]:
     return f"{base}{path}" if not base.endswith("/") else f"{base[:-1]}{path}"
 
 
-def _normalize_movie(summary: Dict[str, object], details: Dict[str, object]) -> Optional[MoviePayload]:
+def normalize_movie(summary: Dict[str, object], details: Dict[str, object]) -> Optional[MoviePayload]:
+    """Merge a discover summary and its detail payload; None without a usable id or title."""
+
     tmdb_id = int(details.get("id") or summary.get("id") or 0)
     if not tmdb_id:
         return None
@@ -92,13 +107,13 @@ def _ensure_keyword_id(tag: IdentityTag, client: TmdbClient) -> int:
     if tag.tmdb_keyword_id:
         return tag.tmdb_keyword_id
 
-    # Try to get keyword ID from our experimental mappings
-    experimental_keyword_id = get_primary_keyword_for_theme(tag.slug)
-    if experimental_keyword_id:
-        LOGGER.info("Using experimental keyword ID %s for tag '%s'", experimental_keyword_id, tag.name)
-        tag.tmdb_keyword_id = experimental_keyword_id
+    # Then the heaviest keyword mapped to the tag
+    mapped_keyword_id = get_keyword_index().primary_keyword(tag.pk)
+    if mapped_keyword_id:
+        LOGGER.info("Using mapped keyword ID %s for tag '%s'", mapped_keyword_id, tag.name)
+        tag.tmdb_keyword_id = mapped_keyword_id
         tag.save(update_fields=["tmdb_keyword_id", "updated_at"])
-        return experimental_keyword_id
+        return mapped_keyword_id
 
     # Fallback to dynamic keyword resolution
     keyword_id = resolve_keyword_id(client, tag.name)
@@ -113,28 +128,24 @@ def _ensure_keyword_id(tag: IdentityTag, client: TmdbClient) -> int:
 def _discover_movies(
     client: TmdbClient,
     *,
-    keyword_id: int,
+    keyword_ids: Sequence[int],
     limit: int,
     include_adult: bool,
     language: Optional[str],
-    theme_slug: Optional[str] = None,
-) -> Sequence[Dict[str, object]]:
+    max_pages: Optional[int] = None,
+) -> Tuple[List[Dict[str, object]], int]:
+    """Results matching any of ``keyword_ids`` in popularity order, and the pages read.
+
+    Pages until ``limit`` results are found, or ``max_pages`` have been read.
+    """
+
     collected: List[Dict[str, object]] = []
     seen: set[int] = set()
     page = 1
 
-    # Use multiple keywords from experiments if available for better results
-    keyword_filter = str(keyword_id)
-    if theme_slug:
-        all_keywords = get_keywords_for_theme(theme_slug)
-        if all_keywords and len(all_keywords) > 1:
-            # Use up to 5 keywords (TMDb API limit) for better discovery
-            keyword_filter = "|".join(str(k) for k in all_keywords[:5])
-            LOGGER.info("Using multiple keywords for %s: %s", theme_slug, keyword_filter)
-
     while len(collected) < limit:
         params = {
-            "with_keywords": keyword_filter,
+            "with_keywords": "|".join(str(keyword) for keyword in keyword_ids),
             "include_adult": include_adult,
             "page": page,
             "sort_by": "popularity.desc",  # Get popular movies first
@@ -142,42 +153,190 @@ def _discover_movies(
         if language:
             params["language"] = language
 
-        payload = client.discover_movies(**params)
+        payload = discover_movies_with_stats(client, **params)
         results = payload.get("results") or []
 
         for result in results:
             movie_id = result.get("id")
             if not movie_id or movie_id in seen:
                 continue
+            # Keep the whole page: ranking picks the best ``limit`` afterwards.
             collected.append(result)
             seen.add(movie_id)
-            if len(collected) >= limit:
-                break
 
         total_pages = payload.get("total_pages") or 0
-        if page >= total_pages or not results:
+        if page >= total_pages or not results or (max_pages is not None and page >= max_pages):
             break
         page += 1
 
-    return collected
+    return collected, page
+
+
+def _discover_sources(
+    client: TmdbClient,
+    *,
+    keyword_id: int,
+    limit: int,
+    include_adult: bool,
+    language: Optional[str],
+    keyword_ids: Sequence[int] = (),
+) -> List[List[Dict[str, object]]]:
+    """Ranked result lists for rank fusion, within a fixed discover budget.
+
+    The first source ORs the tag's heaviest keywords and pages to ``limit``, as
+    a single query would. Tags with several keywords then spend as many pages
+    again on one page per keyword, heaviest first, so a film found under more of
+    them collects more keyword matches when ranked.
+    """
+
+    keywords = list(keyword_ids[:MAX_DISCOVERY_KEYWORDS]) if len(keyword_ids) > 1 else [keyword_id]
+    primary, pages = _discover_movies(
+        client, keyword_ids=keywords, limit=limit, include_adult=include_adult, language=language
+    )
+    sources = [primary]
+    if len(keywords) > 1 and primary:
+        spare = pages * (DISCOVERY_PAGE_BUDGET - 1)
+        LOGGER.info("Discovering from keywords %s", keywords[:spare])
+        for keyword in keywords[:spare]:
+            results, _ = _discover_movies(
+                client,
+                keyword_ids=[keyword],
+                limit=limit,
+                include_adult=include_adult,
+                language=language,
+                max_pages=1,
+            )
+            sources.append(results)
+    return sources
+
 
+def _listed_tmdb_ids(slug: str) -> Set[int]:
+    """TMDb ids on the published version of list ``slug``; being listed is no evidence for a regeneration."""
 
-def _fetch_movie_details(
+    return set(
+        MediaListItem.objects.filter(
+            media_list__slug=slug, version_id=F("media_list__current_version_id")
+        ).values_list("media_item__tmdb_id", flat=True)
+    )
+
+
+def _catalog_source(
+    tag: IdentityTag, *, limit: int, include_adult: bool, exclude_ids: Set[int]
+) -> List[Dict[str, object]]:
+    """Films the local catalog carries ``tag`` on, newest first, as discover-like summaries."""
+
+    summaries: List[Dict[str, object]] = []
+    media_items = (
+        MediaItem.objects.filter(identity_tags=tag, media_type=MediaItem.MEDIA_TYPE_MOVIE)
+        .exclude(tmdb_id__in=exclude_ids)
+        .order_by(F("release_date").desc(nulls_last=True), "-pk")
+        .only("tmdb_id", "metadata")[: limit * 2]
+    )
+    for media_item in media_items:
+        metadata = media_item.metadata or {}
+        details = metadata.get("details") or {}
+        if details.get("adult") and not include_adult:
+            continue
+        summary = {**details, **(metadata.get("summary") or {}), "id": media_item.tmdb_id}
+        summaries.append(summary)
+        if len(summaries) >= limit:
+            break
+    return summaries
+
+
+def _catalog_tag_ids(tmdb_ids: Iterable[int]) -> Dict[int, Set[int]]:
+    """Identity tags the catalog already holds for each of ``tmdb_ids``, in one query."""
+
+    tag_ids: Dict[int, Set[int]] = {}
+    rows = MediaItem.identity_tags.through.objects.filter(mediaitem__tmdb_id__in=list(tmdb_ids)).values_list(
+        "mediaitem__tmdb_id", "identitytag_id"
+    )
+    for tmdb_id, tag_id in rows:
+        tag_ids.setdefault(tmdb_id, set()).add(tag_id)
+    return tag_ids
+
+
+def fetch_movie_details(
     client: TmdbClient,
     movie_ids: Iterable[int],
     *,
     append_to_response: Optional[str],
+    skip_missing: bool = False,
 ) -> Dict[int, Dict[str, object]]:
+    """TMDb details by id; with ``skip_missing``, ids TMDb no longer knows are left out."""
+
     details: Dict[int, Dict[str, object]] = {}
     for movie_id in movie_ids:
-        details[movie_id] = client.get_movie_details(
-            movie_id,
-            append_to_response=append_to_response,
-        )
+        try:
+            details[movie_id] = client.get_movie_details(
+                movie_id,
+                append_to_response=append_to_response,
+            )
+        except TmdbNotFoundError:
+            if not skip_missing:
+                raise
+            LOGGER.info("TMDb id %s no longer exists, skipping", movie_id)
     return details
 
 
-@transaction.atomic
+def media_item_defaults(payload: MoviePayload) -> Dict[str, object]:
+    """``MediaItem`` column values for ``payload``, masks included."""
+
+    return {
+        "media_type": payload.media_type,
+        "title": payload.title,
+        "original_title": payload.original_title or payload.title,
+        "release_date": payload.release_date,
+        "poster_url": payload.poster_url or "",
+        "backdrop_url": payload.backdrop_url or "",
+        "overview": payload.overview,
+        "metadata": payload.metadata,
+        **media_masks(payload.metadata),
+        "trigger_mask": trigger_mask_for_details(payload.metadata["details"]),
+    }
+
+
+def media_list_slug_for_tag(tag: IdentityTag, language: Optional[str] = None) -> str:
+    """Slug of the shared list generated for ``tag`` in ``language`` (one per pair, whoever asks)."""
+
+    suffix = f"-{language}" if language else ""
+    return slugify(f"{tag.slug}-spotlight-{tag.pk}{suffix}")
+
+
+@dataclass(frozen=True, slots=True)
+class IdentityListRequest:
+    """One tag's list within a batched generation."""
+
+    tag: IdentityTag
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+def _claim_list_lock(slug: str, *, lock_wait: float) -> Tuple[Optional[str], Optional[MediaList]]:
+    """Take the per-list lease, or find the list another worker is producing.
+
+    Returns ``(token, None)`` when the caller should generate (``token`` is None
+    if it must do so without the lease), or ``(None, media_list)`` when that list
+    should be served instead.
+    """
+
+    token = acquire_list_lock(slug)
+    if token is None:
+        previous = MediaList.objects.filter(slug=slug).first()
+        if previous is not None:
+            LOGGER.info("List %s is being regenerated elsewhere; serving previous version", slug)
+            return None, previous
+        if wait_for_list_lock(slug, timeout=lock_wait):
+            generated = MediaList.objects.filter(slug=slug).first()
+            if generated is not None:
+                return None, generated
+        # The winner failed or stalled without producing a list: do the work ourselves.
+        token = acquire_list_lock(slug)
+        if token is None:
+            LOGGER.warning("Generating %s without its lock after waiting %.1fs", slug, lock_wait)
+    return token, None
+
+
 def generate_media_list_for_identity(
     *,
     tag: IdentityTag,
@@ -190,69 +349,176 @@ def generate_media_list_for_identity(
     description: Optional[str] = None,
     append_to_response: str = DEFAULT_APPEND,
     client: Optional[TmdbClient] = None,
+    lock_wait: float = DEFAULT_LOCK_WAIT,
 ) -> MediaList:
-    """Generate or refresh a media list for the provided identity tag."""
+    """Generate or refresh a media list for the provided identity tag.
+
+    Generated lists are shared per tag and language, so generation runs under a
+    per-list lock.
+    A caller arriving while another worker holds it does not repeat the work: it
+    serves the list's previous version when there is one, otherwise waits up to
+    ``lock_wait`` seconds for the winner's result.
+    """
 
     if limit <= 0:
         raise ValueError("limit must be positive")
 
-    provided_client = client is not None
-    client = client or get_tmdb_client()
-    if client is None:
-        raise TmdbError("TMDb client could not be initialized")
+    slug = media_list_slug_for_tag(tag, language)
+    token, ready = _claim_list_lock(slug, lock_wait=lock_wait)
+    if ready is not None:
+        return ready
 
-    context = client if not provided_client else nullcontext(client)
-    with context:
-        keyword_id = _ensure_keyword_id(tag, client)
-        summaries = _discover_movies(
-            client,
-            keyword_id=keyword_id,
+    try:
+        return _generate_media_list(
+            tag=tag,
+            slug=slug,
+            owner=owner,
             limit=limit,
             include_adult=include_adult,
             language=language,
-            theme_slug=tag.slug,
+            visibility=visibility,
+            title=title,
+            description=description,
+            append_to_response=append_to_response,
+            client=client,
         )
+    finally:
+        if token is not None:
+            release_list_lock(slug, token)
 
-        if not summaries:
-            raise TmdbNotFoundError(
-                f"TMDb discovery returned no results for keyword '{tag.name}' (id={keyword_id})"
+
+def generate_media_lists_for_identities(
+    requests: Sequence[IdentityListRequest],
+    *,
+    owner: Any,
+    limit: int = 12,
+    include_adult: bool = False,
+    language: Optional[str] = None,
+    visibility: str = MediaList.VISIBILITY_PUBLIC,
+    append_to_response: str = DEFAULT_APPEND,
+    client: Optional[TmdbClient] = None,
+    lock_wait: float = DEFAULT_LOCK_WAIT,
+) -> Dict[int, MediaList]:
+    """Generate several identity lists as a single work plan.
+
+    Discovery still runs per tag, but the union of discovered movies is fetched
+    and upserted once, however many lists it lands in. Returns lists keyed by tag
+    id; a tag whose discovery fails is logged and left out so callers can fall
+    back for it alone.
+    """
+
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+
+    lists: Dict[int, MediaList] = {}
+    tokens: Dict[str, str] = {}
+    planned: List[Tuple[IdentityListRequest, str]] = []
+    try:
+        for request in requests:
+            slug = media_list_slug_for_tag(request.tag, language)
+            token, ready = _claim_list_lock(slug, lock_wait=lock_wait)
+            if ready is not None:
+                lists[request.tag.pk] = ready
+                continue
+            if token is not None:
+                tokens[slug] = token
+            planned.append((request, slug))
+
+        if planned:
+            lists.update(
+                _generate_planned_lists(
+                    planned,
+                    owner=owner,
+                    limit=limit,
+                    include_adult=include_adult,
+                    language=language,
+                    visibility=visibility,
+                    append_to_response=append_to_response,
+                    client=client,
+                )
             )
+    finally:
+        for slug, token in tokens.items():
+            release_list_lock(slug, token)
+    return lists
 
-        movie_ids = [int(entry["id"]) for entry in summaries if entry.get("id")]
-        detail_map = _fetch_movie_details(client, movie_ids, append_to_response=append_to_response)
 
-    normalized: List[MoviePayload] = []
+def _discover_for_tag(
+    client: TmdbClient,
+    tag: IdentityTag,
+    *,
+    limit: int,
+    include_adult: bool,
+    language: Optional[str],
+) -> List[Dict[str, object]]:
+    keyword_id = _ensure_keyword_id(tag, client)
+    sources = _discover_sources(
+        client,
+        keyword_id=keyword_id,
+        limit=limit,
+        include_adult=include_adult,
+        language=language,
+        keyword_ids=get_keyword_index().keywords_for(tag.pk),
+    )
+
+    if not any(sources):
+        raise TmdbNotFoundError(
+            f"TMDb discovery returned no results for keyword '{tag.name}' (id={keyword_id})"
+        )
+    # The catalog's films for the tag count as one more source, and its tags as
+    # overlap evidence; films on the list being regenerated vouch for neither, or
+    # a list would keep re-ranking itself first.
+    listed_ids = _listed_tmdb_ids(media_list_slug_for_tag(tag, language))
+    sources.append(_catalog_source(tag, limit=limit, include_adult=include_adult, exclude_ids=listed_ids))
+    candidate_ids = {int(summary["id"]) for source in sources for summary in source if summary.get("id")}
+    # Fuse popularity orders, keyword matches, rating, recency and catalog tag overlap.
+    return rank_candidates(
+        sources,
+        limit=limit,
+        wanted_tag_ids=[tag.pk],
+        tag_ids_by_movie=_catalog_tag_ids(candidate_ids - listed_ids),
+    )
+
+
+def _upsert_movies(
+    summaries: Iterable[Dict[str, object]],
+    detail_map: Dict[int, Dict[str, object]],
+    *,
+    tag_ids_by_movie: Dict[int, Set[int]],
+) -> Dict[int, MediaItem]:
+    """Normalize and upsert each distinct movie once; returns items by TMDb id."""
+
+    media_items: Dict[int, MediaItem] = {}
     for summary in summaries:
         movie_id = int(summary.get("id") or 0)
+        if movie_id in media_items:
+            continue
         detail = detail_map.get(movie_id, {})
-        payload = _normalize_movie(summary, detail)
-        if payload:
-            normalized.append(payload)
-
-    if not normalized:
-        raise TmdbError("No valid TMDb entries could be normalized into media items")
-
-    media_items: List[MediaItem] = []
-    for payload in normalized:
-        defaults = {
-            "media_type": payload.media_type,
-            "title": payload.title,
-            "original_title": payload.original_title or payload.title,
-            "release_date": payload.release_date,
-            "poster_url": payload.poster_url or "",
-            "backdrop_url": payload.backdrop_url or "",
-            "overview": payload.overview,
-            "metadata": payload.metadata,
-        }
+        payload = normalize_movie(summary, detail)
+        if not payload:
+            continue
         media_item, _ = MediaItem.objects.update_or_create(
             tmdb_id=payload.tmdb_id,
-            defaults=defaults,
+            defaults=media_item_defaults(payload),
         )
-        media_item.identity_tags.add(tag)
-        media_items.append(media_item)
+        # Tag with every identity whose keywords the movie carries, not just the requesting ones.
+        tag_ids = tag_ids_for_details(detail) | tag_ids_by_movie.get(movie_id, set())
+        media_item.identity_tags.add(*tag_ids)
+        media_items[movie_id] = media_item
+    return media_items
+
 
+def _publish_tag_list(
+    *,
+    tag: IdentityTag,
+    slug: str,
+    owner: Any,
+    media_items: List[MediaItem],
+    visibility: str,
+    title: Optional[str],
+    description: Optional[str],
+) -> MediaList:
     list_title = title or f"{tag.name} Spotlight"
-    slug = slugify(f"{tag.slug}-spotlight-{tag.pk}")
 
     media_list, created = MediaList.objects.get_or_create(
         slug=slug,
@@ -283,28 +549,128 @@ def generate_media_list_for_identity(
             setattr(media_list, field, value)
         media_list.save(update_fields=list(updates.keys()) + ["updated_at"])
 
-    existing_items = {
-        item.media_item_id: item for item in media_list.items.select_related("media_item")
-    }
-
-    desired_ids = [item.id for item in media_items]
-    for obsolete_id, list_item in list(existing_items.items()):
-        if obsolete_id not in desired_ids:
-            list_item.delete()
-            existing_items.pop(obsolete_id, None)
-
-    for index, media_item in enumerate(media_items, start=1):
-        list_item = existing_items.get(media_item.id)
-        if list_item:
-            if list_item.position != index:
-                list_item.position = index
-                list_item.save(update_fields=["position"])
-            continue
-        MediaListItem.objects.create(
-            media_list=media_list,
-            media_item=media_item,
-            position=index,
-        )
+    publish_media_list_version(media_list, media_items)
 
     media_list.refresh_from_db()
     return media_list
+
+
+def open_client(client: Optional[TmdbClient]) -> Tuple[TmdbClient, Any]:
+    """The client to use and a context closing it only when it was created here."""
+
+    provided_client = client is not None
+    client = client or get_tmdb_client()
+    if client is None:
+        raise TmdbError("TMDb client could not be initialized")
+    return client, (client if not provided_client else nullcontext(client))
+
+
+def _generate_media_list(
+    *,
+    tag: IdentityTag,
+    slug: str,
+    owner: Any,
+    limit: int,
+    include_adult: bool,
+    language: Optional[str],
+    visibility: str,
+    title: Optional[str],
+    description: Optional[str],
+    append_to_response: str,
+    client: Optional[TmdbClient],
+) -> MediaList:
+    client, context = open_client(client)
+    with context:
+        summaries = _discover_for_tag(client, tag, limit=limit, include_adult=include_adult, language=language)
+        movie_ids = [int(entry["id"]) for entry in summaries if entry.get("id")]
+        # Catalog candidates may since have left TMDb; they drop out of the list.
+        detail_map = fetch_movie_details(client, movie_ids, append_to_response=append_to_response, skip_missing=True)
+        movie_ids = [movie_id for movie_id in movie_ids if movie_id in detail_map]
+
+    # Only the writes share a transaction: keyword lookups cached during discovery
+    # (negative answers included) must survive a generation that then fails.
+    with transaction.atomic():
+        items_by_id = _upsert_movies(
+            summaries, detail_map, tag_ids_by_movie={movie_id: {tag.pk} for movie_id in movie_ids}
+        )
+        media_items = [items_by_id[movie_id] for movie_id in movie_ids if movie_id in items_by_id]
+        if not media_items:
+            raise TmdbError("No valid TMDb entries could be normalized into media items")
+
+        return _publish_tag_list(
+            tag=tag,
+            slug=slug,
+            owner=owner,
+            media_items=media_items,
+            visibility=visibility,
+            title=title,
+            description=description,
+        )
+
+
+def _generate_planned_lists(
+    planned: Sequence[Tuple[IdentityListRequest, str]],
+    *,
+    owner: Any,
+    limit: int,
+    include_adult: bool,
+    language: Optional[str],
+    visibility: str,
+    append_to_response: str,
+    client: Optional[TmdbClient],
+) -> Dict[int, MediaList]:
+    ordered_ids: Dict[int, List[int]] = {}
+    summaries: Dict[int, Dict[str, object]] = {}
+    tag_ids_by_movie: Dict[int, Set[int]] = {}
+
+    client, context = open_client(client)
+    with context:
+        for request, _ in planned:
+            tag = request.tag
+            try:
+                tag_summaries = _discover_for_tag(
+                    client, tag, limit=limit, include_adult=include_adult, language=language
+                )
+            except TmdbError as exc:
+                LOGGER.warning("Leaving %s out of the batch: %s", tag.slug, exc)
+                continue
+            ordered_ids[tag.pk] = []
+            for summary in tag_summaries:
+                if not summary.get("id"):
+                    continue
+                movie_id = int(summary["id"])
+                ordered_ids[tag.pk].append(movie_id)
+                summaries.setdefault(movie_id, summary)
+                tag_ids_by_movie.setdefault(movie_id, set()).add(tag.pk)
+
+        # Each movie is fetched once, however many themes discovered it.
+        detail_map = fetch_movie_details(
+            client,
+            list(summaries),
+            append_to_response=append_to_response,
+            skip_missing=True,
+        )
+
+    with transaction.atomic():
+        items_by_id = _upsert_movies(summaries.values(), detail_map, tag_ids_by_movie=tag_ids_by_movie)
+
+    lists: Dict[int, MediaList] = {}
+    for request, slug in planned:
+        movie_ids = ordered_ids.get(request.tag.pk)
+        if not movie_ids:
+            continue
+        media_items = [items_by_id[movie_id] for movie_id in movie_ids if movie_id in items_by_id]
+        if not media_items:
+            LOGGER.warning("No valid TMDb entries for %s in the batch", request.tag.slug)
+            continue
+        with transaction.atomic():
+            lists[request.tag.pk] = _publish_tag_list(
+                tag=request.tag,
+                slug=slug,
+                owner=owner,
+                media_items=media_items,
+                visibility=visibility,
+                title=request.title,
+                description=request.description,
+            )
+    return lists
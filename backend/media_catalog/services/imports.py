@@ -0,0 +1,221 @@
+"""Bulk import of hand-made media lists from TMDb ids."""
+
+import csv
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import IntegrityError, transaction
+from django.utils.text import slugify
+
+from tmdb import TmdbAuthorizationError, TmdbClient, TmdbError, TmdbNotFoundError
+
+from media_catalog.models import MediaItem, MediaList, MediaListItem
+
+from .generator import DEFAULT_APPEND, media_item_defaults, normalize_movie, open_client
+from .keywords import tag_ids_for_details
+
+LOGGER = logging.getLogger(__name__)
+
+IMPORT_MAX_IDS = 1000
+IMPORT_FETCH_WORKERS = 8
+# Fresh slugs tried when concurrent imports of the same title race for one.
+SLUG_ATTEMPTS = 5
+
+
+@dataclass(frozen=True, slots=True)
+class ImportReport:
+    media_list: MediaList
+    existing: int
+    fetched: int
+    not_found: Tuple[int, ...]
+    failed: Tuple[int, ...]
+
+
+def parse_tmdb_ids(value: Any, *, max_ids: int = IMPORT_MAX_IDS) -> List[int]:
+    """Distinct ids, in order, from a list or CSV text (first column, optional header).
+
+    Raises ``ValueError`` with a user-facing message on bad input.
+    """
+
+    if isinstance(value, str):
+        rows = csv.reader(io.StringIO(value))
+        raw = [row[0].strip() for row in rows if row and row[0].strip()]
+        if raw and raw[0].lower() in {"tmdb_id", "id"}:
+            raw = raw[1:]
+    elif isinstance(value, (list, tuple)):
+        raw = list(value)
+    else:
+        raise ValueError("Expected a list of TMDb ids or CSV text.")
+
+    ids: List[int] = []
+    seen = set()
+    for entry in raw:
+        try:
+            tmdb_id = int(entry)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid TMDb id: {entry!r}.") from None
+        if tmdb_id <= 0:
+            raise ValueError(f"Invalid TMDb id: {entry!r}.")
+        if tmdb_id not in seen:
+            seen.add(tmdb_id)
+            ids.append(tmdb_id)
+    if not ids:
+        raise ValueError("No TMDb ids given.")
+    if len(ids) > max_ids:
+        raise ValueError(f"At most {max_ids} TMDb ids per import.")
+    return ids
+
+
+def _fetch_details_concurrently(
+    client: TmdbClient,
+    movie_ids: Sequence[int],
+    *,
+    language: Optional[str],
+    workers: int,
+) -> Tuple[Dict[int, Dict[str, Any]], List[int], List[int]]:
+    """TMDb details for ``movie_ids`` in parallel.
+
+    Also returns the ids TMDb doesn't know and those whose request failed (rate
+    limit, timeout, transport). A rejected API key fails every id, so it is raised.
+    """
+
+    def fetch(movie_id: int) -> Tuple[Optional[Dict[str, Any]], Optional[TmdbError]]:
+        try:
+            return client.get_movie_details(movie_id, language=language, append_to_response=DEFAULT_APPEND), None
+        except TmdbAuthorizationError:
+            raise
+        except TmdbError as exc:
+            return None, exc
+
+    # httpx clients are thread-safe, so the workers share one connection pool.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(movie_ids))), thread_name_prefix="list-import") as pool:
+        results = list(pool.map(fetch, movie_ids))
+
+    details: Dict[int, Dict[str, Any]] = {}
+    not_found: List[int] = []
+    failed: List[int] = []
+    for movie_id, (payload, error) in zip(movie_ids, results):
+        if payload:
+            details[movie_id] = payload
+        elif error is None or isinstance(error, TmdbNotFoundError):
+            not_found.append(movie_id)
+        else:
+            LOGGER.warning("Fetching TMDb id %s for an import failed: %s", movie_id, error)
+            failed.append(movie_id)
+    return details, not_found, failed
+
+
+def _create_media_items(detail_map: Dict[int, Dict[str, Any]]) -> Dict[int, MediaItem]:
+    new_items = []
+    for details in detail_map.values():
+        payload = normalize_movie({}, details)
+        if payload:
+            new_items.append(MediaItem(tmdb_id=payload.tmdb_id, **media_item_defaults(payload)))
+    # A concurrent import or generation may have created some of them meanwhile.
+    MediaItem.objects.bulk_create(new_items, ignore_conflicts=True)
+
+    created = MediaItem.objects.in_bulk([item.tmdb_id for item in new_items], field_name="tmdb_id")
+    Tagging = MediaItem.identity_tags.through
+    Tagging.objects.bulk_create(
+        [
+            Tagging(mediaitem_id=created[tmdb_id].pk, identitytag_id=tag_id)
+            for tmdb_id, details in detail_map.items()
+            if tmdb_id in created
+            for tag_id in tag_ids_for_details(details)
+        ],
+        ignore_conflicts=True,
+    )
+    return created
+
+
+def _unique_slug(title: str) -> str:
+    base = slugify(title)[:200] or "list"
+    taken = set(MediaList.objects.filter(slug__startswith=base).values_list("slug", flat=True))
+    slug, suffix = base, 2
+    while slug in taken:
+        slug = f"{base}-{suffix}"
+        suffix += 1
+    return slug
+
+
+def _create_media_list(*, title: str, **fields: Any) -> MediaList:
+    """Create the list under a free slug, picking another if a concurrent import takes it first."""
+
+    for _ in range(SLUG_ATTEMPTS - 1):
+        slug = _unique_slug(title)
+        try:
+            # A savepoint, so the caller's transaction survives the collision.
+            with transaction.atomic():
+                return MediaList.objects.create(title=title, slug=slug, **fields)
+        except IntegrityError:
+            LOGGER.info("Slug %s was taken concurrently; retrying", slug)
+    return MediaList.objects.create(title=title, slug=_unique_slug(title), **fields)
+
+
+def import_media_list(
+    *,
+    owner: Any,
+    title: str,
+    tmdb_ids: Iterable[int],
+    description: str = "",
+    visibility: str = MediaList.VISIBILITY_PUBLIC,
+    language: Optional[str] = None,
+    client: Optional[TmdbClient] = None,
+    workers: int = IMPORT_FETCH_WORKERS,
+) -> ImportReport:
+    """Create a hand-made list of ``tmdb_ids`` in the given order.
+
+    Ids already in the catalog are resolved with one ``in_bulk`` query; only the
+    others are fetched from TMDb, concurrently. Ids TMDb doesn't know, and ids
+    whose lookup failed, are reported and skipped; only when no id resolved at
+    all and every lookup failed is TMDb taken to be down and ``TmdbError``
+    raised. Like other hand-made lists, the list is unversioned: its items are
+    written in one bulk insert and stay editable in place.
+    """
+
+    tmdb_ids = list(tmdb_ids)
+    existing = MediaItem.objects.in_bulk(tmdb_ids, field_name="tmdb_id")
+    missing = [tmdb_id for tmdb_id in tmdb_ids if tmdb_id not in existing]
+
+    fetched: Dict[int, MediaItem] = {}
+    not_found: List[int] = []
+    failed: List[int] = []
+    media_items = dict(existing)
+    if missing:
+        client, context = open_client(client)
+        with context:
+            detail_map, not_found, failed = _fetch_details_concurrently(
+                client, missing, language=language, workers=workers
+            )
+        if len(failed) == len(missing) and not existing:
+            raise TmdbError(f"Every TMDb lookup of the import failed ({len(failed)} id(s))")
+        if not_found:
+            LOGGER.info("Import for %s skipped unknown TMDb ids %s", owner, not_found)
+        fetched = _create_media_items(detail_map)
+        media_items.update(fetched)
+
+    ordered = [media_items[tmdb_id] for tmdb_id in tmdb_ids if tmdb_id in media_items]
+    with transaction.atomic():
+        media_list = _create_media_list(
+            title=title,
+            description=description,
+            owner=owner,
+            visibility=visibility,
+            item_count=len(ordered),
+        )
+        MediaListItem.objects.bulk_create(
+            [
+                MediaListItem(media_list=media_list, media_item=media_item, position=position, added_by=owner)
+                for position, media_item in enumerate(ordered, start=1)
+            ]
+        )
+    return ImportReport(
+        media_list=media_list,
+        existing=len(existing),
+        fetched=len(fetched),
+        not_found=tuple(not_found),
+        failed=tuple(failed),
+    )
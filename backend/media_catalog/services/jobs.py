@@ -0,0 +1,189 @@
+"""DB-backed job queue that moves list generation out of the request thread."""
+
+import logging
+from datetime import timedelta
+from typing import Any, Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tmdb import TmdbError
+
+from media_catalog.models import IdentityTag, MediaList, MediaListGenerationJob
+
+from .generator import generate_media_list_for_identity
+
+LOGGER = logging.getLogger(__name__)
+
+STALE_JOB_AFTER = timedelta(minutes=15)
+
+# A request merges into a pending job only when these match; ``limit`` may differ.
+MERGE_FIELDS = ("include_adult", "visibility", "title", "description")
+
+
+class GenerationJobConflict(Exception):
+    """A job for the same tag and language is pending with other parameters."""
+
+    def __init__(self, job: MediaListGenerationJob) -> None:
+        super().__init__(f"Generation job {job.pk} is already pending for this tag with other parameters")
+        self.job = job
+
+
+def enqueue_media_list_generation(
+    *,
+    tag: IdentityTag,
+    requested_by: Any,
+    limit: int = 12,
+    include_adult: bool = False,
+    language: Optional[str] = None,
+    visibility: str = MediaList.VISIBILITY_PUBLIC,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Tuple[MediaListGenerationJob, bool]:
+    """Queue a generation job, merging into an identical pending one.
+
+    Returns the job and whether it was newly created. A merged request widens the
+    pending job's ``limit`` so the single run satisfies every caller. Only one job
+    may be pending per tag and language, so a request whose other parameters
+    differ from it raises ``GenerationJobConflict``.
+    """
+
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+
+    language = language or ""
+    parameters = {
+        "include_adult": include_adult,
+        "visibility": visibility,
+        "title": title or "",
+        "description": description or "",
+    }
+    pending = MediaListGenerationJob.objects.filter(
+        tag=tag,
+        language=language,
+        status=MediaListGenerationJob.STATUS_PENDING,
+    )
+
+    existing = pending.first()
+    if existing is None:
+        try:
+            with transaction.atomic():
+                job = MediaListGenerationJob.objects.create(
+                    tag=tag,
+                    requested_by=requested_by,
+                    limit=limit,
+                    language=language,
+                    **parameters,
+                )
+            return job, True
+        except IntegrityError:
+            # Another request queued the same job between our read and insert.
+            existing = pending.first()
+            if existing is None:
+                raise
+
+    if any(getattr(existing, field) != parameters[field] for field in MERGE_FIELDS):
+        raise GenerationJobConflict(existing)
+    if limit > existing.limit:
+        pending.filter(pk=existing.pk).update(limit=limit, updated_at=timezone.now())
+        existing.refresh_from_db()
+    return existing, False
+
+
+def claim_next_job() -> Optional[MediaListGenerationJob]:
+    """Atomically move the oldest pending job to running and return it.
+
+    The conditional UPDATE makes the claim safe across concurrent worker
+    processes on every database backend, without row locks.
+    """
+
+    while True:
+        candidate = (
+            MediaListGenerationJob.objects.filter(status=MediaListGenerationJob.STATUS_PENDING)
+            .order_by("created_at", "pk")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if candidate is None:
+            return None
+        claimed = MediaListGenerationJob.objects.filter(
+            pk=candidate,
+            status=MediaListGenerationJob.STATUS_PENDING,
+        ).update(
+            status=MediaListGenerationJob.STATUS_RUNNING,
+            started_at=timezone.now(),
+            attempts=F("attempts") + 1,
+            updated_at=timezone.now(),
+        )
+        if claimed:
+            return MediaListGenerationJob.objects.select_related("tag", "requested_by").get(pk=candidate)
+
+
+def _fail_job(job: MediaListGenerationJob, exc: Exception) -> MediaListGenerationJob:
+    job.status = MediaListGenerationJob.STATUS_FAILED
+    job.error = str(exc) or exc.__class__.__name__
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "finished_at", "updated_at"])
+    return job
+
+
+def run_job(job: MediaListGenerationJob) -> MediaListGenerationJob:
+    """Execute a claimed job and record its outcome.
+
+    Any error fails the job, so pollers always get a final status and the
+    worker moves on to the next one.
+    """
+
+    try:
+        media_list = generate_media_list_for_identity(
+            tag=job.tag,
+            owner=job.requested_by,
+            limit=job.limit,
+            include_adult=job.include_adult,
+            language=job.language or None,
+            visibility=job.visibility,
+            title=job.title or None,
+            description=job.description or None,
+        )
+    except (TmdbError, ValueError) as exc:
+        LOGGER.warning("Generation job %s failed: %s", job.pk, exc)
+        return _fail_job(job, exc)
+    except Exception as exc:  # noqa: BLE001 - a crashed job must not stay running
+        LOGGER.exception("Generation job %s crashed", job.pk)
+        return _fail_job(job, exc)
+
+    job.status = MediaListGenerationJob.STATUS_SUCCEEDED
+    job.media_list = media_list
+    job.error = ""
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "media_list", "error", "finished_at", "updated_at"])
+    return job
+
+
+def run_pending_jobs(*, max_jobs: Optional[int] = None) -> int:
+    """Drain the queue in the current process; returns the number of jobs run."""
+
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        job = claim_next_job()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
+
+
+def expire_stale_jobs(*, older_than: timedelta = STALE_JOB_AFTER) -> int:
+    """Fail running jobs whose worker vanished so pollers get a final status."""
+
+    cutoff = timezone.now() - older_than
+    return MediaListGenerationJob.objects.filter(
+        status=MediaListGenerationJob.STATUS_RUNNING,
+        started_at__lt=cutoff,
+    ).update(
+        status=MediaListGenerationJob.STATUS_FAILED,
+        error="Worker timed out",
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
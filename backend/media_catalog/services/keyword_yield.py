@@ -0,0 +1,138 @@
+"""Offline scoring of tag keywords by how much distinct material they discover."""
+
+import logging
+import statistics
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from tmdb import TmdbClient, TmdbError, get_tmdb_client
+from tmdb.services import discover_movies_with_stats
+
+from media_catalog.models import IdentityTag, IdentityTagKeyword
+
+from .keywords import invalidate_keyword_index
+
+LOGGER = logging.getLogger(__name__)
+
+SCORE_FIELDS = ["rank", "result_count", "overlap", "median_popularity", "scored_at", "updated_at"]
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordYield:
+    keyword_id: int
+    result_count: int
+    movie_ids: FrozenSet[int]
+    median_popularity: float
+
+
+def measure_keyword_yield(client: TmdbClient, keyword_id: int, *, pages: int = 1) -> KeywordYield:
+    """Sample the most popular discover pages for a single keyword."""
+
+    movie_ids: set[int] = set()
+    popularity: List[float] = []
+    result_count = 0
+    for page in range(1, pages + 1):
+        payload = discover_movies_with_stats(
+            client,
+            with_keywords=str(keyword_id),
+            include_adult=False,
+            sort_by="popularity.desc",
+            page=page,
+        )
+        result_count = payload.get("total_results") or 0
+        for result in payload.get("results") or []:
+            if result.get("id"):
+                movie_ids.add(int(result["id"]))
+                popularity.append(float(result.get("popularity") or 0))
+        if page >= (payload.get("total_pages") or 0):
+            break
+    return KeywordYield(
+        keyword_id=keyword_id,
+        result_count=result_count,
+        movie_ids=frozenset(movie_ids),
+        median_popularity=statistics.median(popularity) if popularity else 0.0,
+    )
+
+
+def rank_keyword_yields(yields: Sequence[KeywordYield]) -> List[Tuple[KeywordYield, float]]:
+    """Order keywords greedily by the new results each adds to those ranked before it.
+
+    Returns ``(yield, overlap)`` pairs, where ``overlap`` is the share of the
+    keyword's sampled movies already covered by better-ranked keywords.
+    """
+
+    remaining = list(yields)
+    covered: set[int] = set()
+    ranked: List[Tuple[KeywordYield, float]] = []
+
+    def overlap_of(candidate: KeywordYield) -> float:
+        if not candidate.movie_ids:
+            return 1.0
+        return len(candidate.movie_ids & covered) / len(candidate.movie_ids)
+
+    while remaining:
+        best = max(
+            remaining,
+            key=lambda y: (y.result_count * (1 - overlap_of(y)), y.median_popularity, -y.keyword_id),
+        )
+        ranked.append((best, overlap_of(best)))
+        covered |= best.movie_ids
+        remaining.remove(best)
+    return ranked
+
+
+def score_tag_keywords(
+    *,
+    tags: Optional[Iterable[IdentityTag]] = None,
+    pages: int = 1,
+    client: Optional[TmdbClient] = None,
+) -> Dict[str, List[int]]:
+    """Measure and rank every keyword of ``tags`` (default: all mapped tags).
+
+    Costs ``pages`` discover requests per keyword. Returns the new keyword order
+    per tag slug.
+    """
+
+    if pages <= 0:
+        raise ValueError("pages must be positive")
+
+    provided_client = client is not None
+    client = client or get_tmdb_client()
+    if client is None:
+        raise TmdbError("TMDb client could not be initialized")
+
+    if tags is None:
+        tags = IdentityTag.objects.filter(keywords__isnull=False).distinct()
+
+    rankings: Dict[str, List[int]] = {}
+    context = client if not provided_client else nullcontext(client)
+    with context:
+        for tag in tags:
+            rows = {row.keyword_id: row for row in IdentityTagKeyword.objects.filter(tag=tag)}
+            if not rows:
+                continue
+            yields = [measure_keyword_yield(client, keyword_id, pages=pages) for keyword_id in rows]
+
+            now = timezone.now()
+            for rank, (measured, overlap) in enumerate(rank_keyword_yields(yields), start=1):
+                row = rows[measured.keyword_id]
+                row.rank = rank
+                row.result_count = measured.result_count
+                row.overlap = round(overlap, 4)
+                row.median_popularity = measured.median_popularity
+                row.scored_at = now
+                # bulk_update bypasses auto_now, so stamp the row ourselves.
+                row.updated_at = now
+            with transaction.atomic():
+                IdentityTagKeyword.objects.bulk_update(list(rows.values()), SCORE_FIELDS)
+
+            rankings[tag.slug] = [row.keyword_id for row in sorted(rows.values(), key=lambda row: row.rank)]
+            LOGGER.info("Ranked %d keywords for %s", len(rows), tag.slug)
+
+    # bulk_update sends no signals.
+    invalidate_keyword_index()
+    return rankings
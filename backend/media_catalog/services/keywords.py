@@ -0,0 +1,90 @@
+"""In-process index over `IdentityTagKeyword`, in both directions."""
+
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from django.db.models import F
+
+from media_catalog.models import IdentityTagKeyword
+
+
+@dataclass(frozen=True, slots=True)
+class KeywordIndex:
+    """Tag → keywords (best ranked first) and keyword → tags, as read-only maps."""
+
+    by_tag: Mapping[int, Tuple[int, ...]]
+    by_keyword: Mapping[int, Tuple[int, ...]]
+
+    def keywords_for(self, tag_id: int) -> Tuple[int, ...]:
+        return self.by_tag.get(tag_id, ())
+
+    def primary_keyword(self, tag_id: int) -> Optional[int]:
+        keywords = self.by_tag.get(tag_id)
+        return keywords[0] if keywords else None
+
+    def tags_for(self, keyword_ids: Iterable[int]) -> Set[int]:
+        tag_ids: Set[int] = set()
+        for keyword_id in keyword_ids:
+            tag_ids.update(self.by_keyword.get(keyword_id, ()))
+        return tag_ids
+
+
+# Invalidation signals only reach the process that saved the change; other
+# workers rebuild their copy once it is INDEX_TTL seconds old.
+INDEX_TTL = 60.0
+
+_INDEX: Optional[KeywordIndex] = None
+_INDEX_EXPIRES = 0.0
+_INDEX_LOCK = threading.Lock()
+
+
+def _build_index() -> KeywordIndex:
+    by_tag: Dict[int, List[int]] = {}
+    by_keyword: Dict[int, List[int]] = {}
+    rows = IdentityTagKeyword.objects.order_by(
+        "tag_id", F("rank").asc(nulls_last=True), "-weight", "keyword_id"
+    ).values_list("tag_id", "keyword_id")
+    for tag_id, keyword_id in rows:
+        by_tag.setdefault(tag_id, []).append(keyword_id)
+        by_keyword.setdefault(keyword_id, []).append(tag_id)
+    return KeywordIndex(
+        by_tag=MappingProxyType({tag_id: tuple(ids) for tag_id, ids in by_tag.items()}),
+        by_keyword=MappingProxyType({keyword_id: tuple(ids) for keyword_id, ids in by_keyword.items()}),
+    )
+
+
+def get_keyword_index() -> KeywordIndex:
+    global _INDEX, _INDEX_EXPIRES
+    index = _INDEX
+    if index is None or time.monotonic() >= _INDEX_EXPIRES:
+        with _INDEX_LOCK:
+            if _INDEX is None or time.monotonic() >= _INDEX_EXPIRES:
+                _INDEX = _build_index()
+                _INDEX_EXPIRES = time.monotonic() + INDEX_TTL
+            index = _INDEX
+    return index
+
+
+def invalidate_keyword_index(**kwargs) -> None:
+    """Drop the cached index; usable directly or as a model signal receiver."""
+
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def extract_keyword_ids(details: Dict[str, Any]) -> List[int]:
+    """Keyword ids from a movie detail payload fetched with `keywords` appended."""
+
+    block = details.get("keywords") or {}
+    entries = block.get("keywords") if isinstance(block, dict) else None
+    return [int(entry["id"]) for entry in entries or [] if isinstance(entry, dict) and entry.get("id")]
+
+
+def tag_ids_for_details(details: Dict[str, Any]) -> Set[int]:
+    """Identity tags whose keywords appear on the movie."""
+
+    return get_keyword_index().tags_for(extract_keyword_ids(details))
@@ -0,0 +1,60 @@
+"""Lease-based locks that keep concurrent workers from regenerating one list."""
+
+import logging
+import time
+import uuid
+from datetime import timedelta
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from media_catalog.models import MediaListLock
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LOCK_TTL = timedelta(minutes=2)
+DEFAULT_POLL_INTERVAL = 0.25
+
+
+def acquire_list_lock(key: str, *, ttl: timedelta = DEFAULT_LOCK_TTL) -> Optional[str]:
+    """Try to take the lease for ``key``; returns the owner token or None if held."""
+
+    now = timezone.now()
+    MediaListLock.objects.filter(key=key, expires_at__lte=now).delete()
+
+    token = uuid.uuid4().hex
+    try:
+        with transaction.atomic():
+            MediaListLock.objects.create(key=key, token=token, expires_at=now + ttl)
+    except IntegrityError:
+        return None
+    return token
+
+
+def release_list_lock(key: str, token: str) -> None:
+    """Drop the lease, unless it expired and someone else has taken it since."""
+
+    MediaListLock.objects.filter(key=key, token=token).delete()
+
+
+def wait_for_list_lock(
+    key: str,
+    *,
+    timeout: float,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+) -> bool:
+    """Block until the lease on ``key`` is released or expires.
+
+    Returns False when ``timeout`` seconds elapse first.
+    """
+
+    deadline = time.monotonic() + timeout
+    while True:
+        held = MediaListLock.objects.filter(key=key, expires_at__gt=timezone.now()).exists()
+        if not held:
+            return True
+        if time.monotonic() >= deadline:
+            LOGGER.info("Gave up waiting for list lock %s after %.1fs", key, timeout)
+            return False
+        time.sleep(poll_interval)
@@ -0,0 +1,115 @@
+"""Compact bitmasks computed once at ingest.
+
+Readers bucket and filter items with bitwise tests instead of re-parsing TMDb
+metadata. Genre bits are positions in ``TMDB_GENRES`` (append only); trigger
+bits come from ``triggers``. Run the ``refresh_media_masks`` command after
+changing either table or a trigger topic's keywords.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from .triggers import trigger_mask_for_details
+
+# TMDb's movie genre ids with their English names. Names only match when the id
+# is missing (fallback data, old summaries); ids work whatever the language.
+TMDB_GENRES = (
+    (28, "action"),
+    (12, "adventure"),
+    (16, "animation"),
+    (35, "comedy"),
+    (80, "crime"),
+    (99, "documentary"),
+    (18, "drama"),
+    (10751, "family"),
+    (14, "fantasy"),
+    (36, "history"),
+    (27, "horror"),
+    (10402, "music"),
+    (9648, "mystery"),
+    (10749, "romance"),
+    (878, "science fiction"),
+    (10770, "tv movie"),
+    (53, "thriller"),
+    (10752, "war"),
+    (37, "western"),
+)
+
+_BIT_BY_GENRE_ID = {genre_id: 1 << index for index, (genre_id, _) in enumerate(TMDB_GENRES)}
+_BIT_BY_GENRE_NAME = {name: 1 << index for index, (_, name) in enumerate(TMDB_GENRES)}
+
+FORMAT_SHORT = 1
+FORMAT_LONG = 2
+FORMAT_UNKNOWN_RUNTIME = 4
+
+SHORT_FORM_MAX_RUNTIME = 45
+
+
+def genre_bits(*names: str) -> int:
+    """Mask for English genre names, e.g. ``genre_bits("romance", "drama")``."""
+
+    mask = 0
+    for name in names:
+        mask |= _BIT_BY_GENRE_NAME[name.lower()]
+    return mask
+
+
+def genre_mask(genres: Iterable[Any]) -> int:
+    """Mask for TMDb genres given as ``{"id", "name"}`` dicts, ids or names."""
+
+    mask = 0
+    for genre in genres or ():
+        if isinstance(genre, Mapping):
+            bit = _BIT_BY_GENRE_ID.get(genre.get("id")) or _BIT_BY_GENRE_NAME.get((genre.get("name") or "").lower())
+        elif isinstance(genre, int):
+            bit = _BIT_BY_GENRE_ID.get(genre)
+        else:
+            bit = _BIT_BY_GENRE_NAME.get(str(genre).lower())
+        mask |= bit or 0
+    return mask
+
+
+def format_mask(runtime: Optional[Any]) -> int:
+    if not isinstance(runtime, (int, float)) or isinstance(runtime, bool) or runtime <= 0:
+        return FORMAT_UNKNOWN_RUNTIME
+    return FORMAT_SHORT if runtime <= SHORT_FORM_MAX_RUNTIME else FORMAT_LONG
+
+
+def media_masks(metadata: Optional[Mapping[str, Any]]) -> Dict[str, int]:
+    """``genre_mask`` and ``format_mask`` for a MediaItem's stored metadata."""
+
+    metadata = metadata or {}
+    summary = metadata.get("summary") or {}
+    details = metadata.get("details") or {}
+    return {
+        "genre_mask": genre_mask(details.get("genres") or summary.get("genre_ids") or ()),
+        "format_mask": format_mask(details.get("runtime") or summary.get("runtime")),
+    }
+
+
+def _stored_masks(metadata: Optional[Mapping[str, Any]]) -> Dict[str, int]:
+    masks = media_masks(metadata)
+    masks["trigger_mask"] = trigger_mask_for_details((metadata or {}).get("details") or {})
+    return masks
+
+
+def backfill_media_masks(queryset, *, batch_size: int = 500) -> int:
+    """Recompute every mask of the items in ``queryset``; returns rows changed."""
+
+    fields = list(_stored_masks(None))
+    changed: List[Any] = []
+    updated = 0
+    for media_item in queryset.only("pk", "metadata", *fields).iterator(chunk_size=batch_size):
+        masks = _stored_masks(media_item.metadata)
+        if all(getattr(media_item, field) == value for field, value in masks.items()):
+            continue
+        for field, value in masks.items():
+            setattr(media_item, field, value)
+        changed.append(media_item)
+        if len(changed) >= batch_size:
+            queryset.model.objects.bulk_update(changed, fields)
+            updated += len(changed)
+            changed = []
+    if changed:
+        queryset.model.objects.bulk_update(changed, fields)
+        updated += len(changed)
+    return updated
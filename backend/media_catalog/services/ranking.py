@@ -0,0 +1,125 @@
+"""Rank fusion over candidate lists from several sources (keyword batches, local catalog)."""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+RRF_K = 60  # Reciprocal-rank-fusion damping; 60 is the usual choice.
+RATING_PRIOR_MEAN = 6.5
+RATING_PRIOR_VOTES = 50
+RECENCY_HALF_LIFE_YEARS = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class RankingWeights:
+    source_rank: float = 1.0
+    keyword_matches: float = 1.0
+    rating: float = 1.0
+    recency: float = 0.5
+    tag_overlap: float = 0.5
+
+
+DEFAULT_WEIGHTS = RankingWeights()
+
+
+@dataclass(slots=True)
+class Candidate:
+    tmdb_id: int
+    summary: Dict[str, Any]
+    fusion: float = 0.0
+    keyword_matches: int = 0
+    tag_ids: Set[int] = field(default_factory=set)
+
+
+def bayesian_rating(
+    vote_average: Optional[float],
+    vote_count: Optional[int],
+    *,
+    prior_mean: float = RATING_PRIOR_MEAN,
+    prior_votes: int = RATING_PRIOR_VOTES,
+) -> float:
+    """Shrink a TMDb average towards ``prior_mean`` until it has enough votes."""
+
+    votes = max(vote_count or 0, 0)
+    average = vote_average or 0.0
+    return (votes * average + prior_votes * prior_mean) / (votes + prior_votes)
+
+
+def recency_score(release_date: Optional[str], *, today: date, half_life_years: float = RECENCY_HALF_LIFE_YEARS) -> float:
+    """1.0 for this year's releases, halving every ``half_life_years``; 0 if unknown."""
+
+    if not release_date:
+        return 0.0
+    try:
+        released = date.fromisoformat(str(release_date)[:10])
+    except ValueError:
+        return 0.0
+    age_years = max((today - released).days, 0) / 365.25
+    return 0.5 ** (age_years / half_life_years)
+
+
+def fuse_sources(sources: Iterable[Sequence[Mapping[str, Any]]]) -> Dict[int, Candidate]:
+    """Merge ranked result lists, one candidate per TMDb id.
+
+    Each appearance adds ``1 / (RRF_K + rank)`` to the candidate's fusion score
+    and counts as one keyword match.
+    """
+
+    candidates: Dict[int, Candidate] = {}
+    for source in sources:
+        seen_in_source: Set[int] = set()
+        for rank, summary in enumerate(source, start=1):
+            tmdb_id = summary.get("id")
+            if not tmdb_id or tmdb_id in seen_in_source:
+                continue
+            seen_in_source.add(tmdb_id)
+            candidate = candidates.get(tmdb_id)
+            if candidate is None:
+                candidate = candidates[tmdb_id] = Candidate(tmdb_id=int(tmdb_id), summary=dict(summary))
+            candidate.fusion += 1 / (RRF_K + rank)
+            candidate.keyword_matches += 1
+    return candidates
+
+
+def rank_candidates(
+    sources: Sequence[Sequence[Mapping[str, Any]]],
+    *,
+    limit: int,
+    weights: RankingWeights = DEFAULT_WEIGHTS,
+    wanted_tag_ids: Iterable[int] = (),
+    tag_ids_by_movie: Optional[Mapping[int, Iterable[int]]] = None,
+    today: Optional[date] = None,
+) -> List[Dict[str, Any]]:
+    """Return the ``limit`` best summaries across ``sources``, best first.
+
+    Scores are a weighted sum of features normalised to [0, 1]; selection uses a
+    bounded heap, so ranking thousands of candidates stays O(n log limit).
+    """
+
+    if limit <= 0:
+        return []
+
+    candidates = fuse_sources(sources)
+    if tag_ids_by_movie:
+        for tmdb_id, tag_ids in tag_ids_by_movie.items():
+            if tmdb_id in candidates:
+                candidates[tmdb_id].tag_ids.update(tag_ids)
+
+    source_count = max(len(sources), 1)
+    max_fusion = source_count / (RRF_K + 1)
+    wanted = set(wanted_tag_ids)
+    today = today or date.today()
+
+    def score(candidate: Candidate) -> float:
+        summary = candidate.summary
+        value = weights.source_rank * candidate.fusion / max_fusion
+        value += weights.keyword_matches * candidate.keyword_matches / source_count
+        value += weights.rating * bayesian_rating(summary.get("vote_average"), summary.get("vote_count")) / 10
+        value += weights.recency * recency_score(summary.get("release_date"), today=today)
+        if wanted:
+            value += weights.tag_overlap * len(candidate.tag_ids & wanted) / len(wanted)
+        return value
+
+    best = heapq.nlargest(limit, candidates.values(), key=score)
+    return [candidate.summary for candidate in best]
@@ -0,0 +1,181 @@
+"""Incremental catalog refresh driven by TMDb's movie change feed."""
+
+import logging
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from django.db import transaction
+from django.utils import timezone
+
+from tmdb import TmdbClient, TmdbError, get_tmdb_client
+
+from media_catalog.models import CatalogSyncCheckpoint, MediaItem
+
+from .generator import DEFAULT_APPEND, fetch_movie_details, media_item_defaults, normalize_movie
+from .keywords import extract_keyword_ids, get_keyword_index
+
+LOGGER = logging.getLogger(__name__)
+
+MOVIE_CHANGES_CHECKPOINT = "tmdb-movie-changes"
+MAX_CHANGE_WINDOW = timedelta(days=14)  # TMDb rejects wider /movie/changes ranges.
+INITIAL_LOOKBACK = timedelta(days=1)
+REFRESH_FIELDS = [
+    "media_type",
+    "title",
+    "original_title",
+    "release_date",
+    "poster_url",
+    "backdrop_url",
+    "overview",
+    "metadata",
+    "genre_mask",
+    "format_mask",
+    "trigger_mask",
+    "updated_at",
+]
+
+
+@dataclass(slots=True)
+class SyncReport:
+    """Outcome of a change-feed sync run.
+
+    ``changed`` counts every TMDb id reported in the window, ``skipped`` the ones
+    absent from our catalog, and ``missing`` the local items TMDb no longer serves.
+    """
+
+    window_start: datetime
+    window_end: datetime
+    changed: int = 0
+    refreshed: int = 0
+    skipped: int = 0
+    missing: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["window_start"] = self.window_start.isoformat()
+        data["window_end"] = self.window_end.isoformat()
+        return data
+
+
+def _collect_changed_ids(client: TmdbClient, *, start: datetime, end: datetime) -> Set[int]:
+    changed: Set[int] = set()
+    window_start = start
+    while window_start < end:
+        window_end = min(window_start + MAX_CHANGE_WINDOW, end)
+        page = 1
+        while True:
+            payload = client.get_movie_changes(
+                start_date=window_start.date().isoformat(),
+                end_date=window_end.date().isoformat(),
+                page=page,
+            )
+            for entry in payload.get("results") or []:
+                movie_id = entry.get("id")
+                if movie_id:
+                    changed.add(int(movie_id))
+            total_pages = payload.get("total_pages") or 0
+            if page >= total_pages:
+                break
+            page += 1
+        window_start = window_end
+    return changed
+
+
+def _refresh_batch(
+    client: TmdbClient,
+    media_items: List[MediaItem],
+    *,
+    append_to_response: Optional[str],
+) -> int:
+    detail_map = fetch_movie_details(
+        client,
+        [item.tmdb_id for item in media_items],
+        append_to_response=append_to_response,
+        skip_missing=True,
+    )
+
+    refreshed: List[MediaItem] = []
+    now = timezone.now()
+    for media_item in media_items:
+        details = detail_map.get(media_item.tmdb_id)
+        if not details:
+            continue
+        summary = (media_item.metadata or {}).get("summary") or {}
+        payload = normalize_movie(summary, details)
+        if not payload:
+            continue
+        for field, value in media_item_defaults(payload).items():
+            setattr(media_item, field, value)
+        # bulk_update bypasses auto_now, so stamp the row ourselves.
+        media_item.updated_at = now
+        refreshed.append(media_item)
+
+    if refreshed:
+        index = get_keyword_index()
+        Tagging = MediaItem.identity_tags.through
+        taggings = [
+            Tagging(mediaitem_id=media_item.pk, identitytag_id=tag_id)
+            for media_item in refreshed
+            for tag_id in index.tags_for(extract_keyword_ids(detail_map[media_item.tmdb_id]))
+        ]
+        with transaction.atomic():
+            MediaItem.objects.bulk_update(refreshed, REFRESH_FIELDS)
+            Tagging.objects.bulk_create(taggings, ignore_conflicts=True)
+    return len(refreshed)
+
+
+def sync_catalog_changes(
+    *,
+    client: Optional[TmdbClient] = None,
+    now: Optional[datetime] = None,
+    batch_size: int = 20,
+    append_to_response: str = DEFAULT_APPEND,
+) -> SyncReport:
+    """Refresh the `MediaItem`s TMDb reports as changed since the last checkpoint.
+
+    The checkpoint only advances once every batch has been refreshed, so a failed
+    run is simply retried over the same window next time.
+    """
+
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+
+    now = now or timezone.now()
+    checkpoint, _ = CatalogSyncCheckpoint.objects.get_or_create(name=MOVIE_CHANGES_CHECKPOINT)
+    start = checkpoint.synced_until or now - INITIAL_LOOKBACK
+    report = SyncReport(window_start=start, window_end=now)
+
+    provided_client = client is not None
+    client = client or get_tmdb_client()
+    if client is None:
+        raise TmdbError("TMDb client could not be initialized")
+
+    context = client if not provided_client else nullcontext(client)
+    with context:
+        changed_ids = sorted(_collect_changed_ids(client, start=start, end=now))
+        report.changed = len(changed_ids)
+
+        for offset in range(0, len(changed_ids), batch_size):
+            batch_ids = changed_ids[offset:offset + batch_size]
+            local_items = list(MediaItem.objects.filter(tmdb_id__in=batch_ids))
+            report.skipped += len(batch_ids) - len(local_items)
+            if not local_items:
+                continue
+            refreshed = _refresh_batch(client, local_items, append_to_response=append_to_response)
+            report.refreshed += refreshed
+            report.missing += len(local_items) - refreshed
+
+    checkpoint.synced_until = now
+    checkpoint.last_report = report.as_dict()
+    checkpoint.save(update_fields=["synced_until", "last_report", "updated_at"])
+
+    LOGGER.info(
+        "TMDb change sync: %s changed, %s refreshed, %s skipped, %s missing",
+        report.changed,
+        report.refreshed,
+        report.skipped,
+        report.missing,
+    )
+    return report
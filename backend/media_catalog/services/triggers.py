@@ -0,0 +1,79 @@
+"""In-process keyword → trigger bit index behind `MediaItem.trigger_mask`."""
+
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from accounts.models import TriggerTopic, TriggerTopicKeyword
+
+from .keywords import extract_keyword_ids
+
+
+@dataclass(frozen=True, slots=True)
+class TriggerIndex:
+    """Keyword id → OR of the bits of every topic it flags."""
+
+    by_keyword: Mapping[int, int]
+
+    def mask_for(self, keyword_ids: Iterable[int]) -> int:
+        mask = 0
+        for keyword_id in keyword_ids:
+            mask |= self.by_keyword.get(keyword_id, 0)
+        return mask
+
+
+# Seconds before a process rebuilds the index; bounds how long other workers
+# miss an admin edit, since the invalidating signal fires in one process only.
+INDEX_TTL = 60.0
+
+_INDEX: Optional[TriggerIndex] = None
+_INDEX_EXPIRES = 0.0
+_INDEX_LOCK = threading.Lock()
+
+
+def _build_index() -> TriggerIndex:
+    by_keyword: Dict[int, int] = {}
+    rows = TriggerTopicKeyword.objects.filter(topic__bit__isnull=False).values_list("keyword_id", "topic__bit")
+    for keyword_id, bit in rows:
+        by_keyword[keyword_id] = by_keyword.get(keyword_id, 0) | (1 << bit)
+    return TriggerIndex(by_keyword=MappingProxyType(by_keyword))
+
+
+def get_trigger_index() -> TriggerIndex:
+    global _INDEX, _INDEX_EXPIRES
+    index = _INDEX
+    if index is None or time.monotonic() >= _INDEX_EXPIRES:
+        with _INDEX_LOCK:
+            if _INDEX is None or time.monotonic() >= _INDEX_EXPIRES:
+                _INDEX = _build_index()
+                _INDEX_EXPIRES = time.monotonic() + INDEX_TTL
+            index = _INDEX
+    return index
+
+
+def invalidate_trigger_index(**kwargs) -> None:
+    """Drop the cached index; usable directly or as a model signal receiver."""
+
+    global _INDEX
+    with _INDEX_LOCK:
+        _INDEX = None
+
+
+def trigger_mask_for_details(details: Dict[str, Any]) -> int:
+    """Trigger bits of a movie detail payload fetched with `keywords` appended."""
+
+    return get_trigger_index().mask_for(extract_keyword_ids(details))
+
+
+def trigger_mask_for_user(user: Any) -> int:
+    """Bits of the curated topics ``user`` opted out of; 0 for anonymous users."""
+
+    if not getattr(user, "is_authenticated", False):
+        return 0
+    mask = 0
+    bits = TriggerTopic.objects.filter(user_preferences__user=user, bit__isnull=False).values_list("bit", flat=True)
+    for bit in bits.order_by():
+        mask |= 1 << bit
+    return mask
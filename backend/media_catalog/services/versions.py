@@ -0,0 +1,119 @@
+"""Immutable list versions: publishing by pointer swap and garbage collection."""
+
+import logging
+from datetime import timedelta
+from typing import Any, Iterable, List, Sequence
+
+from django.db.models import Max
+from django.utils import timezone
+
+from media_catalog.models import MediaItem, MediaList, MediaListItem, MediaListVersion
+
+LOGGER = logging.getLogger(__name__)
+
+# Superseded versions stay readable this long for requests that started before the swap.
+VERSION_GRACE_PERIOD = timedelta(hours=1)
+
+
+def publish_media_list_version(
+    media_list: MediaList,
+    media_items: Sequence[MediaItem],
+    *,
+    added_by: Any = None,
+) -> MediaListVersion:
+    """Write ``media_items`` as a new immutable version and make it current.
+
+    Notes and contributors carry over for items already in the published version.
+    Readers keep seeing the previous version until the single pointer UPDATE.
+    """
+
+    previous = {entry.media_item_id: entry for entry in media_list.current_items()}
+    last_number = media_list.versions.aggregate(last=Max("number"))["last"] or 0
+    version = MediaListVersion.objects.create(media_list=media_list, number=last_number + 1)
+
+    entries: List[MediaListItem] = []
+    seen: set[int] = set()
+    for media_item in media_items:
+        if media_item.pk in seen:
+            continue
+        seen.add(media_item.pk)
+        carried = previous.get(media_item.pk)
+        entries.append(
+            MediaListItem(
+                media_list=media_list,
+                version=version,
+                media_item=media_item,
+                position=len(entries) + 1,
+                notes=carried.notes if carried else "",
+                added_by_id=carried.added_by_id if carried else getattr(added_by, "pk", None),
+            )
+        )
+    MediaListItem.objects.bulk_create(entries)
+
+    MediaList.objects.filter(pk=media_list.pk).update(
+        current_version=version,
+        item_count=len(entries),
+        updated_at=timezone.now(),
+    )
+    media_list.current_version = version
+    media_list.item_count = len(entries)
+    return version
+
+
+def prune_media_list_versions(
+    *,
+    keep: int = 2,
+    grace_period: timedelta = VERSION_GRACE_PERIOD,
+) -> int:
+    """Delete superseded versions beyond the newest ``keep`` per list.
+
+    Current versions are never removed, nor versions younger than ``grace_period``.
+    Unversioned items of lists that have since published a version are dropped
+    too. Returns the number of versions deleted.
+    """
+
+    if keep < 1:
+        raise ValueError("keep must be at least 1")
+
+    cutoff = timezone.now() - grace_period
+    stale_ids: List[int] = []
+    candidates = (
+        MediaListVersion.objects.filter(created_at__lt=cutoff)
+        .exclude(pk__in=MediaList.objects.filter(current_version__isnull=False).values("current_version"))
+        .values_list("pk", "media_list_id", "number")
+    )
+    newest = dict(
+        MediaListVersion.objects.values("media_list_id")
+        .annotate(last=Max("number"))
+        .values_list("media_list_id", "last")
+    )
+    for pk, media_list_id, number in candidates.iterator():
+        if number <= newest.get(media_list_id, 0) - keep:
+            stale_ids.append(pk)
+
+    deleted = 0
+    if stale_ids:
+        deleted = MediaListVersion.objects.filter(pk__in=stale_ids).delete()[1].get(
+            MediaListVersion._meta.label, 0
+        )
+
+    MediaListItem.objects.filter(
+        version__isnull=True,
+        media_list__current_version__isnull=False,
+    ).delete()
+
+    if deleted:
+        LOGGER.info("Pruned %s superseded media list version(s)", deleted)
+    return deleted
+
+
+def refresh_item_counts(media_list_ids: Iterable[int]) -> None:
+    """Recount the hand-made lists among ``media_list_ids`` after their items were edited.
+
+    There is deliberately no signal receiver on ``MediaListItem``: one would turn
+    every cascade delete into row-by-row deletes. Paths editing items call this
+    once instead; versioned lists get their count from ``publish_media_list_version``.
+    """
+
+    for media_list in MediaList.objects.filter(pk__in=set(media_list_ids), current_version__isnull=True):
+        media_list.refresh_item_count()
@@ -3,11 +3,16 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListItem
+from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListGenerationJob, MediaListItem
+from media_catalog.services import run_pending_jobs
+from media_catalog.services.versions import publish_media_list_version
 
 
 class MediaListAPITestCase(APITestCase):
@@ -37,10 +42,10 @@ class MediaListAPITestCase(APITestCase):
             overview="A love letter to trans celebration.",
         )
         MediaListItem.objects.create(media_list=media_list, media_item=item, position=1)
+        media_list.refresh_item_count()
         return media_list
 
-    def test_generate_media_list_invokes_service(self) -> None:
-        media_list = self._create_media_list(owner=self.curator)
+    def test_generate_media_list_queues_job(self) -> None:
         url = reverse("media-list-list")
         payload = {
             "identity_tag": self.tag.id,
@@ -49,21 +54,54 @@ class MediaListAPITestCase(APITestCase):
         }
 
         self.client.force_authenticate(self.curator)
-        with patch("media_catalog.api.views.generate_media_list_for_identity") as generate_mock:
-            generate_mock.return_value = media_list
-
+        with patch("media_catalog.services.jobs.generate_media_list_for_identity") as generate_mock:
             response = self.client.post(url, payload, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        generate_mock.assert_called_once()
-        args, kwargs = generate_mock.call_args
-        self.assertEqual(kwargs["owner"], self.curator)
-        self.assertEqual(kwargs["tag"], self.tag)
-        self.assertEqual(kwargs["limit"], 8)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        generate_mock.assert_not_called()
 
         data = response.json()
-        self.assertEqual(data["slug"], media_list.slug)
-        self.assertEqual(len(data["items"]), 1)
+        job = MediaListGenerationJob.objects.get(pk=data["id"])
+        self.assertEqual(job.status, MediaListGenerationJob.STATUS_PENDING)
+        self.assertEqual(job.requested_by, self.curator)
+        self.assertEqual(job.tag, self.tag)
+        self.assertEqual(job.limit, 8)
+        self.assertEqual(response["Location"], data["status_url"])
+
+    def test_job_status_reports_generated_list(self) -> None:
+        media_list = self._create_media_list(owner=self.curator)
+        self.client.force_authenticate(self.curator)
+        response = self.client.post(
+            reverse("media-list-list"),
+            {"identity_tag": self.tag.id, "limit": 4},
+            format="json",
+        )
+        job_id = response.json()["id"]
+
+        with patch("media_catalog.services.jobs.generate_media_list_for_identity") as generate_mock:
+            generate_mock.return_value = media_list
+            self.assertEqual(run_pending_jobs(), 1)
+
+        status_response = self.client.get(reverse("media-list-job-detail", kwargs={"pk": job_id}))
+
+        self.assertEqual(status_response.status_code, status.HTTP_200_OK)
+        data = status_response.json()
+        self.assertEqual(data["status"], MediaListGenerationJob.STATUS_SUCCEEDED)
+        self.assertEqual(data["media_list"], media_list.slug)
+
+    def test_job_status_is_private_to_its_requester(self) -> None:
+        self.client.force_authenticate(self.curator)
+        job_id = self.client.post(
+            reverse("media-list-list"),
+            {"identity_tag": self.tag.id, "limit": 4, "visibility": MediaList.VISIBILITY_PRIVATE},
+            format="json",
+        ).json()["id"]
+        other = get_user_model().objects.create_user("nosy-neighbour", password="strong-pass-123")
+
+        self.client.force_authenticate(other)
+        response = self.client.get(reverse("media-list-job-detail", kwargs={"pk": job_id}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_public_media_list_is_shareable(self) -> None:
         media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
@@ -76,6 +114,168 @@ class MediaListAPITestCase(APITestCase):
         self.assertEqual(data["slug"], media_list.slug)
         self.assertEqual(len(data["items"]), 1)
 
+    def test_detail_answers_conditional_requests_with_304(self) -> None:
+        media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
+        url = reverse("media-list-detail", kwargs={"slug": media_list.slug})
+
+        first = self.client.get(url)
+        self.assertEqual(first["Cache-Control"], "public, max-age=60")
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached["ETag"], first["ETag"])
+
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(since.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        publish_media_list_version(media_list, [])
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed["ETag"], first["ETag"])
+
+    def test_item_edits_on_a_hand_made_list_change_the_etag(self) -> None:
+        media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
+        url = reverse("media-list-detail", kwargs={"slug": media_list.slug})
+        first = self.client.get(url)
+
+        entry = media_list.items.get()
+        entry.notes = "Coup de cœur"
+        entry.save()
+
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.json()["items"][0]["notes"], "Coup de cœur")
+
+    def test_note_edits_and_media_renames_on_a_versioned_list_change_the_etag(self) -> None:
+        media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
+        media_item = media_list.items.get().media_item
+        publish_media_list_version(media_list, [media_item])
+        url = reverse("media-list-detail", kwargs={"slug": media_list.slug})
+        first = self.client.get(url)
+
+        entry = media_list.current_items().get()
+        entry.notes = "Coup de cœur"
+        entry.save(update_fields=["notes", "updated_at"])
+        noted = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(noted.status_code, status.HTTP_200_OK)
+
+        # Catalog sync renames in bulk, stamping updated_at itself.
+        MediaItem.objects.filter(pk=media_item.pk).update(title="Renamed", updated_at=timezone.now())
+        renamed = self.client.get(url, HTTP_IF_NONE_MATCH=noted["ETag"])
+        self.assertEqual(renamed.status_code, status.HTTP_200_OK)
+        self.assertEqual(renamed.json()["items"][0]["media_item"]["title"], "Renamed")
+
+    def test_cache_control_follows_visibility(self) -> None:
+        media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_UNLISTED)
+        url = reverse("media-list-detail", kwargs={"slug": media_list.slug})
+        self.client.force_authenticate(self.curator)
+
+        self.assertEqual(self.client.get(url)["Cache-Control"], "private, max-age=60")
+
+        MediaList.objects.filter(pk=media_list.pk).update(visibility=MediaList.VISIBILITY_PRIVATE)
+        self.assertEqual(self.client.get(url)["Cache-Control"], "private, no-cache")
+
+    def test_listing_returns_304_until_a_list_changes(self) -> None:
+        media_list = self._create_media_list(owner=self.curator)
+        url = reverse("media-list-list")
+        self.client.force_authenticate(self.curator)
+
+        etag = self.client.get(url)["ETag"]
+        # Only the page itself is read; there is no count over every list.
+        with self.assertNumQueries(1):
+            cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        media_list.title = "Renamed"
+        media_list.save()
+        renamed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(renamed.status_code, status.HTTP_200_OK)
+
+        media_list.delete()
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=renamed["ETag"]).status_code,
+            status.HTTP_200_OK,
+        )
+
+    def test_listing_pages_with_a_cursor(self) -> None:
+        for index in range(3):
+            MediaList.objects.create(title=f"List {index}", slug=f"list-{index}", owner=self.curator)
+        self.client.force_authenticate(self.curator)
+
+        first = self.client.get(reverse("media-list-list"), {"page_size": 2}).json()
+        second = self.client.get(first["next"]).json()
+
+        self.assertEqual([entry["slug"] for entry in first["results"]], ["list-2", "list-1"])
+        self.assertEqual([entry["slug"] for entry in second["results"]], ["list-0"])
+        self.assertIsNone(second["next"])
+
+    def test_item_count_is_kept_in_step_with_edits_and_publishing(self) -> None:
+        media_list = self._create_media_list(owner=self.curator)
+        media_list.refresh_from_db()
+        self.assertEqual(media_list.item_count, 1)
+
+        extra = MediaItem.objects.create(tmdb_id=322, title="Second Star")
+        admin_user = get_user_model().objects.create_superuser("catalog-admin", password="pass-strong-42")
+        self.client.force_login(admin_user)
+        response = self.client.post(
+            reverse("admin:media_catalog_medialistitem_add"),
+            {"media_list": media_list.pk, "media_item": extra.pk, "position": 2},
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.client.force_authenticate(self.curator)
+        with self.assertNumQueries(1):
+            listing = self.client.get(reverse("media-list-list")).json()
+        self.assertEqual(listing["results"][0]["item_count"], 2)
+
+        # Deleting a film cascades to its list entries without a per-row signal.
+        self.client.force_login(admin_user)
+        response = self.client.post(
+            reverse("admin:media_catalog_mediaitem_delete", args=[extra.pk]), {"post": "yes"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        media_list.refresh_from_db()
+        self.assertEqual(media_list.item_count, 1)
+
+        publish_media_list_version(media_list, [MediaItem.objects.get(tmdb_id=321)])
+        media_list.refresh_from_db()
+        self.assertEqual(media_list.item_count, 1)
+
+    def test_sparse_fieldset_loads_only_requested_columns(self) -> None:
+        media_list = self._create_media_list(owner=self.curator)
+        url = reverse("media-list-detail", kwargs={"slug": media_list.slug})
+        full = self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"fields": "slug,items.position,items.media_item.title", "expand": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {"slug": media_list.slug, "items": [{"position": 1, "media_item": {"title": "Joyful Nebula"}}]},
+        )
+        sql = " ".join(query["sql"] for query in queries.captured_queries)
+        self.assertNotIn('"metadata"', sql)
+        self.assertNotIn('"description"', sql)
+        self.assertNotEqual(response["ETag"], full["ETag"])
+
+    def test_unexpanded_keyword_is_rendered_as_its_id(self) -> None:
+        media_list = self._create_media_list(owner=self.curator)
+
+        data = self.client.get(reverse("media-list-list"), {"expand": ""}).json()
+
+        self.assertEqual(data["results"][0]["source_keyword"], self.tag.pk)
+        self.assertEqual(data["results"][0]["slug"], media_list.slug)
+
+    def test_unknown_fields_and_listing_items_are_rejected(self) -> None:
+        media_list = self._create_media_list(owner=self.curator)
+        detail = reverse("media-list-detail", kwargs={"slug": media_list.slug})
+
+        self.assertEqual(self.client.get(detail, {"fields": "owner"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(detail, {"expand": "owner"}).status_code, status.HTTP_400_BAD_REQUEST)
+        listing = self.client.get(reverse("media-list-list"), {"expand": "items"})
+        self.assertEqual(listing.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_private_media_list_hidden_from_other_members(self) -> None:
         private_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PRIVATE)
         url = reverse("media-list-detail", kwargs={"slug": private_list.slug})
@@ -96,17 +296,44 @@ class MediaListAPITestCase(APITestCase):
         media_list.refresh_from_db()
         self.assertEqual(media_list.visibility, MediaList.VISIBILITY_PUBLIC)
 
-    def test_refresh_calls_generator_again(self) -> None:
+    def test_refresh_queues_job(self) -> None:
         media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
         url = reverse("media-list-refresh", kwargs={"slug": media_list.slug})
 
         self.client.force_authenticate(self.curator)
-        with patch("media_catalog.api.views.generate_media_list_for_identity") as generate_mock:
-            generate_mock.return_value = media_list
-            response = self.client.post(url, {"limit": 3}, format="json")
+        response = self.client.post(url, {"limit": 3}, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        generate_mock.assert_called_once()
-        args, kwargs = generate_mock.call_args
-        self.assertEqual(kwargs["limit"], 3)
-        self.assertEqual(kwargs["tag"], self.tag)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = MediaListGenerationJob.objects.get(pk=response.json()["id"])
+        self.assertEqual(job.limit, 3)
+        self.assertEqual(job.tag, self.tag)
+        self.assertEqual(job.title, media_list.title)
+
+    def test_refresh_burst_merges_into_one_job(self) -> None:
+        media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
+        url = reverse("media-list-refresh", kwargs={"slug": media_list.slug})
+
+        self.client.force_authenticate(self.curator)
+        job_ids = {
+            self.client.post(url, {"limit": limit}, format="json").json()["id"]
+            for limit in (3, 5, 4)
+        }
+
+        self.assertEqual(len(job_ids), 1)
+        job = MediaListGenerationJob.objects.get()
+        self.assertEqual(job.limit, 5)
+
+    def test_refresh_conflicting_with_a_pending_job_is_rejected(self) -> None:
+        media_list = self._create_media_list(owner=self.curator, visibility=MediaList.VISIBILITY_PUBLIC)
+        self.client.force_authenticate(self.curator)
+        queued = self.client.post(
+            reverse("media-list-list"),
+            {"identity_tag": self.tag.id, "limit": 8, "visibility": MediaList.VISIBILITY_PRIVATE},
+            format="json",
+        ).json()
+
+        response = self.client.post(reverse("media-list-refresh", kwargs={"slug": media_list.slug}), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.json()["job"]["id"], queued["id"])
+        self.assertEqual(MediaListGenerationJob.objects.get().visibility, MediaList.VISIBILITY_PRIVATE)
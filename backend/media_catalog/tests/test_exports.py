@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from media_catalog.models import MediaItem, MediaList
+from media_catalog.services.exports import export_catalog
+from media_catalog.services.versions import publish_media_list_version
+
+
+class MediaExportTests(APITestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.curator = User.objects.create_user("curator", password="pass-strong-42")
+        self.staff = User.objects.create_user("staff", password="pass-strong-42", is_staff=True)
+        self.items = [
+            MediaItem.objects.create(tmdb_id=500 + index, title=f"Étoile {index}", release_date=date(2020, 1, index + 1))
+            for index in range(3)
+        ]
+        self.media_list = MediaList.objects.create(title="Stars", slug="stars", owner=self.curator)
+        publish_media_list_version(self.media_list, list(reversed(self.items)))
+
+    def test_catalog_ndjson_has_one_object_per_line(self) -> None:
+        lines = list(export_catalog("ndjson", chunk_size=2))
+
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["tmdb_id"] for row in rows], [500, 501, 502])
+        self.assertEqual(rows[0]["release_date"], "2020-01-01")
+        self.assertEqual(rows[0]["title"], "Étoile 0")
+        self.assertNotIn("metadata", rows[0])
+
+    def test_list_export_streams_csv_in_list_order(self) -> None:
+        url = reverse("media-list-export", kwargs={"slug": self.media_list.slug})
+
+        response = self.client.get(url, {"output": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="stars.csv"')
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([row["tmdb_id"] for row in rows], ["502", "501", "500"])
+        self.assertEqual(rows[0]["position"], "1")
+
+    def test_export_rejects_unknown_output_and_non_staff_catalog_reads(self) -> None:
+        list_url = reverse("media-list-export", kwargs={"slug": self.media_list.slug})
+        self.assertEqual(self.client.get(list_url, {"output": "xml"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+        catalog_url = reverse("media-item-export")
+        self.client.force_authenticate(self.curator)
+        self.assertEqual(self.client.get(catalog_url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(self.staff)
+        response = self.client.get(catalog_url)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 3)
+
+    def test_command_exports_a_list(self) -> None:
+        out, err = io.StringIO(), io.StringIO()
+
+        call_command("export_media", "--list=stars", "--output=csv", "--chunk-size=1", stdout=out, stderr=err)
+
+        self.assertEqual(out.getvalue().splitlines()[0], "position,tmdb_id,media_type,title,original_title,release_date,notes")
+        self.assertIn("Exported 3 row(s).", err.getvalue())
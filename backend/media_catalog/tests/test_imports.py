@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from media_catalog.models import MediaItem, MediaList
+from media_catalog.services import imports
+from media_catalog.services.imports import import_media_list, parse_tmdb_ids
+from tmdb import TmdbError, TmdbNotFoundError, TmdbRateLimitError
+
+
+def _details(movie_id: int, *, language=None, append_to_response=None) -> dict:
+    if movie_id == 404:
+        raise TmdbNotFoundError("TMDb resource not found")
+    if movie_id == 429:
+        raise TmdbRateLimitError("TMDb rate limit exceeded")
+    return {
+        "id": movie_id,
+        "title": f"Fetched {movie_id}",
+        "release_date": "2021-05-01",
+        "poster_path": f"/{movie_id}.jpg",
+        "genres": [{"id": 18, "name": "Drama"}],
+        "runtime": 95,
+    }
+
+
+class ParseTmdbIdsTests(TestCase):
+    def test_accepts_lists_and_csv_with_header(self) -> None:
+        self.assertEqual(parse_tmdb_ids([3, "1", 3, 2]), [3, 1, 2])
+        self.assertEqual(parse_tmdb_ids("tmdb_id,title\n7,Seven\n\n8,Eight\n"), [7, 8])
+
+    def test_rejects_bad_or_oversized_input(self) -> None:
+        for value in ([], ["abc"], [-1], "id\n", 42):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_tmdb_ids(value)
+        with self.assertRaises(ValueError):
+            parse_tmdb_ids(list(range(1, 5)), max_ids=3)
+
+
+class ImportMediaListTests(TestCase):
+    def setUp(self) -> None:
+        self.owner = get_user_model().objects.create_user("curator", password="pass-strong-42")
+        self.known = MediaItem.objects.create(tmdb_id=10, title="Known")
+
+    def test_fetches_only_missing_ids_and_keeps_the_given_order(self) -> None:
+        client = MagicMock()
+        client.get_movie_details.side_effect = _details
+
+        report = import_media_list(owner=self.owner, title="My picks", tmdb_ids=[11, 10, 404, 12], client=client)
+
+        fetched = sorted(call.args[0] for call in client.get_movie_details.call_args_list)
+        self.assertEqual(fetched, [11, 12, 404])
+        self.assertEqual((report.existing, report.fetched, report.not_found), (1, 2, (404,)))
+        media_list = report.media_list
+        self.assertEqual(media_list.slug, "my-picks")
+        self.assertEqual(media_list.item_count, 3)
+        # Hand-made like any other: unversioned, so edits in place stay visible.
+        self.assertIsNone(media_list.current_version_id)
+        self.assertEqual(
+            [entry.media_item.tmdb_id for entry in media_list.current_items()],
+            [11, 10, 12],
+        )
+        created = MediaItem.objects.get(tmdb_id=11)
+        self.assertEqual(created.poster_url, "https://image.tmdb.org/t/p/w500/11.jpg")
+        self.assertNotEqual(created.genre_mask, 0)
+
+    def test_failed_lookups_are_reported_apart_from_unknown_ids(self) -> None:
+        client = MagicMock()
+        client.get_movie_details.side_effect = _details
+
+        report = import_media_list(owner=self.owner, title="Partial", tmdb_ids=[429, 11, 404], client=client)
+
+        self.assertEqual((report.fetched, report.not_found, report.failed), (1, (404,), (429,)))
+        self.assertEqual([entry.media_item.tmdb_id for entry in report.media_list.current_items()], [11])
+
+    def test_known_ids_need_no_tmdb_client(self) -> None:
+        MediaList.objects.create(title="Taken", slug="my-picks", owner=self.owner)
+
+        with patch("media_catalog.services.generator.get_tmdb_client") as get_client:
+            report = import_media_list(owner=self.owner, title="My picks", tmdb_ids=[10])
+
+        get_client.assert_not_called()
+        self.assertEqual(report.media_list.slug, "my-picks-2")
+        self.assertEqual(report.media_list.item_count, 1)
+
+    def test_known_ids_are_imported_when_every_lookup_fails(self) -> None:
+        client = MagicMock()
+        client.get_movie_details.side_effect = TmdbError("boom")
+
+        report = import_media_list(owner=self.owner, title="Offline", tmdb_ids=[11, 10, 12], client=client)
+
+        self.assertEqual((report.existing, report.fetched, report.failed), (1, 0, (11, 12)))
+        self.assertEqual([entry.media_item.tmdb_id for entry in report.media_list.current_items()], [10])
+
+    def test_slug_taken_by_a_concurrent_import_is_retried(self) -> None:
+        real_unique_slug = imports._unique_slug
+
+        def stale_then_real(title: str) -> str:
+            # The first read misses a list committed just before our insert.
+            if not MediaList.objects.filter(slug="my-picks").exists():
+                MediaList.objects.create(title="Racer", slug="my-picks", owner=self.owner)
+                return "my-picks"
+            return real_unique_slug(title)
+
+        with patch.object(imports, "_unique_slug", side_effect=stale_then_real):
+            report = import_media_list(owner=self.owner, title="My picks", tmdb_ids=[10])
+
+        self.assertEqual(report.media_list.slug, "my-picks-2")
+        self.assertEqual(MediaList.objects.filter(slug__startswith="my-picks").count(), 2)
+
+
+class MediaListImportAPITests(APITestCase):
+    def setUp(self) -> None:
+        self.curator = get_user_model().objects.create_user("curator", password="pass-strong-42")
+        MediaItem.objects.create(tmdb_id=10, title="Known")
+        MediaItem.objects.create(tmdb_id=20, title="Also known")
+        self.url = reverse("media-list-bulk-import")
+
+    def test_imports_a_csv_body(self) -> None:
+        self.client.force_authenticate(self.curator)
+
+        response = self.client.generic(
+            "POST",
+            f"{self.url}?title=From%20CSV&visibility=unlisted",
+            "tmdb_id\n20\n10\n",
+            content_type="text/csv",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.json()
+        self.assertEqual(data["media_list"]["visibility"], MediaList.VISIBILITY_UNLISTED)
+        self.assertEqual([item["media_item"]["tmdb_id"] for item in data["media_list"]["items"]], [20, 10])
+        self.assertEqual(data["existing"], 2)
+        self.assertEqual(data["failed"], [])
+        self.assertTrue(response["Location"].endswith("/api/media-lists/from-csv/"))
+
+    def test_rejects_anonymous_users_and_bad_ids(self) -> None:
+        payload = {"title": "Nope", "tmdb_ids": [10, "x"]}
+        self.assertIn(
+            self.client.post(self.url, payload, format="json").status_code,
+            {status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN},
+        )
+
+        self.client.force_authenticate(self.curator)
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("tmdb_ids", response.json())
+
+    def test_tmdb_outage_is_a_bad_gateway(self) -> None:
+        self.client.force_authenticate(self.curator)
+        client = MagicMock()
+        client.get_movie_details.side_effect = TmdbError("boom")
+
+        with patch("media_catalog.services.generator.get_tmdb_client", return_value=client):
+            response = self.client.post(self.url, {"title": "Later", "tmdb_ids": [99]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_502_BAD_GATEWAY)
+        self.assertFalse(MediaList.objects.filter(title="Later").exists())
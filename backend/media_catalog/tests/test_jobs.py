@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from media_catalog.models import IdentityTag, MediaListGenerationJob
+from media_catalog.services import GenerationJobConflict, enqueue_media_list_generation
+from media_catalog.services.jobs import claim_next_job, run_job
+from tmdb import TmdbError
+
+
+class MediaListGenerationJobQueueTest(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.user = User.objects.create_user("queue-keeper", password="strong-pass-123")
+        self.tag = IdentityTag.objects.get(slug="trans-joy")
+
+    def test_pending_jobs_are_merged_per_tag_and_language(self) -> None:
+        first, created_first = enqueue_media_list_generation(tag=self.tag, requested_by=self.user, language="fr-FR")
+        second, created_second = enqueue_media_list_generation(tag=self.tag, requested_by=self.user, language="fr-FR")
+        other, created_other = enqueue_media_list_generation(tag=self.tag, requested_by=self.user, language="en-US")
+
+        self.assertTrue(created_first)
+        self.assertFalse(created_second)
+        self.assertEqual(first.pk, second.pk)
+        self.assertTrue(created_other)
+        self.assertNotEqual(first.pk, other.pk)
+
+    def test_requests_with_other_parameters_conflict_instead_of_merging(self) -> None:
+        pending, _ = enqueue_media_list_generation(tag=self.tag, requested_by=self.user, title="Joie")
+
+        for changes in ({"include_adult": True}, {"visibility": "private"}, {"title": "Autre"}, {"description": "x"}):
+            with self.subTest(changes=changes), self.assertRaises(GenerationJobConflict) as raised:
+                enqueue_media_list_generation(tag=self.tag, requested_by=self.user, **{"title": "Joie", **changes})
+            self.assertEqual(raised.exception.job.pk, pending.pk)
+
+        pending.refresh_from_db()
+        self.assertEqual((pending.title, pending.include_adult, pending.limit), ("Joie", False, 12))
+
+    def test_claimed_job_is_not_merged_into(self) -> None:
+        first, _ = enqueue_media_list_generation(tag=self.tag, requested_by=self.user)
+
+        claimed = claim_next_job()
+        assert claimed is not None
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual(claimed.status, MediaListGenerationJob.STATUS_RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNone(claim_next_job())
+
+        # A refresh requested while the job runs queues a fresh one.
+        follow_up, created = enqueue_media_list_generation(tag=self.tag, requested_by=self.user)
+        self.assertTrue(created)
+        self.assertNotEqual(follow_up.pk, first.pk)
+
+    def test_failed_generation_is_recorded(self) -> None:
+        enqueue_media_list_generation(tag=self.tag, requested_by=self.user)
+        job = claim_next_job()
+        assert job is not None
+
+        with patch(
+            "media_catalog.services.jobs.generate_media_list_for_identity",
+            side_effect=TmdbError("TMDb request timed out"),
+        ):
+            job = run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, MediaListGenerationJob.STATUS_FAILED)
+        self.assertEqual(job.error, "TMDb request timed out")
+        self.assertIsNotNone(job.finished_at)
+
+    def test_unexpected_error_fails_the_job(self) -> None:
+        enqueue_media_list_generation(tag=self.tag, requested_by=self.user)
+        job = claim_next_job()
+        assert job is not None
+
+        with patch(
+            "media_catalog.services.jobs.generate_media_list_for_identity",
+            side_effect=RuntimeError("database is locked"),
+        ), self.assertLogs("media_catalog.services.jobs", level="ERROR"):
+            job = run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, MediaListGenerationJob.STATUS_FAILED)
+        self.assertEqual(job.error, "database is locked")
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from media_catalog.models import IdentityTag, IdentityTagKeyword
+from media_catalog.services import generate_media_list_for_identity, keywords
+from media_catalog.services.keyword_yield import KeywordYield, rank_keyword_yields, score_tag_keywords
+from media_catalog.services.keywords import get_keyword_index, invalidate_keyword_index
+
+from .test_services import FakeTmdbClient
+
+
+class KeywordIndexTest(TestCase):
+    def setUp(self) -> None:
+        invalidate_keyword_index()
+        self.addCleanup(invalidate_keyword_index)
+
+    def test_seeded_mappings_are_indexed_both_ways(self) -> None:
+        trans = IdentityTag.objects.get(slug="trans-joy")
+        non_binary = IdentityTag.objects.get(slug="non-binary")
+        gender_studies = IdentityTag.objects.get(slug="gender-studies")
+
+        with self.assertNumQueries(1):
+            index = get_keyword_index()
+            primary = index.primary_keyword(trans.pk)
+            shared = index.tags_for([34214])
+
+        self.assertEqual(primary, 265451)
+        self.assertEqual(shared, {non_binary.pk, gender_studies.pk})
+
+    def test_weight_orders_keywords_and_changes_invalidate(self) -> None:
+        tag = IdentityTag.objects.create(name="Keyword Test", slug="keyword-test")
+        IdentityTagKeyword.objects.create(tag=tag, keyword_id=2, weight=0.5)
+        IdentityTagKeyword.objects.create(tag=tag, keyword_id=1, weight=0.9)
+
+        self.assertEqual(get_keyword_index().keywords_for(tag.pk), (1, 2))
+
+        IdentityTagKeyword.objects.filter(tag=tag, keyword_id=1).delete()
+        self.assertEqual(get_keyword_index().keywords_for(tag.pk), (2,))
+
+
+    def test_changes_made_by_other_processes_show_up_after_the_ttl(self) -> None:
+        tag = IdentityTag.objects.create(name="Keyword Test", slug="keyword-test")
+        self.assertEqual(get_keyword_index().keywords_for(tag.pk), ())
+
+        # bulk_create sends no signal, like a write from another worker.
+        IdentityTagKeyword.objects.bulk_create([IdentityTagKeyword(tag=tag, keyword_id=900003, weight=1.0)])
+        self.assertEqual(get_keyword_index().keywords_for(tag.pk), ())
+
+        later = time.monotonic() + keywords.INDEX_TTL
+        with patch("media_catalog.services.keywords.time.monotonic", return_value=later):
+            self.assertEqual(get_keyword_index().keywords_for(tag.pk), (900003,))
+
+
+class IngestTaggingTest(TestCase):
+    def setUp(self) -> None:
+        invalidate_keyword_index()
+        self.addCleanup(invalidate_keyword_index)
+        self.user = get_user_model().objects.create_user("tagger", password="strong-pass-123")
+        self.tag = IdentityTag.objects.create(name="Keyword Test", slug="keyword-test")
+        IdentityTagKeyword.objects.create(tag=self.tag, keyword_id=900001, weight=1.0)
+        IdentityTagKeyword.objects.create(tag=self.tag, keyword_id=900002, weight=0.5)
+
+    def test_ingested_movie_gets_every_matching_identity(self) -> None:
+        details = {
+            "id": 7,
+            "title": "Fluid Orbit",
+            "release_date": "2022-02-02",
+            "keywords": {"keywords": [{"id": 34214, "name": "gender identity"}]},
+        }
+        client = FakeTmdbClient(
+            discover_batches=[{"results": [{"id": 7, "title": "Fluid Orbit"}], "total_pages": 1}],
+            details={7: details},
+        )
+
+        media_list = generate_media_list_for_identity(tag=self.tag, owner=self.user, limit=1, client=client)
+
+        # One ORed query over the tag's keywords, then one page for its best keyword.
+        self.assertEqual([call["with_keywords"] for call in client.discover_calls], ["900001|900002", "900001"])
+        self.assertEqual(client.search_calls, [])
+        media_item = media_list.current_items().get().media_item
+        self.assertEqual(
+            set(media_item.identity_tags.values_list("slug", flat=True)),
+            {"keyword-test", "non-binary", "gender-studies"},
+        )
+
+
+    def test_films_found_under_several_keywords_rank_first(self) -> None:
+        client = FakeTmdbClient(
+            discover_batches=[
+                # The ORed query, then the single page spent on the best keyword.
+                {"results": [{"id": 1, "title": "Popular"}, {"id": 2, "title": "Shared"}], "total_pages": 1},
+                {"results": [{"id": 2, "title": "Shared"}, {"id": 3, "title": "Niche"}], "total_pages": 1},
+            ],
+            details={movie_id: {"id": movie_id, "title": f"Film {movie_id}"} for movie_id in (1, 2, 3)},
+        )
+
+        media_list = generate_media_list_for_identity(tag=self.tag, owner=self.user, limit=3, client=client)
+
+        self.assertEqual([entry.media_item.tmdb_id for entry in media_list.current_items()], [2, 1, 3])
+
+
+class FakeYieldClient:
+    """Discover-only TMDb double serving one result page per keyword."""
+
+    default_language = "fr-FR"
+
+    def __init__(self, results: dict[int, tuple[int, list[int]]]) -> None:
+        self.results = results
+        self.discover_calls: list[dict[str, object]] = []
+
+    def discover_movies(self, **params) -> dict[str, object]:
+        self.discover_calls.append(params)
+        total, ids = self.results.get(int(params["with_keywords"]), (0, []))
+        return {
+            "results": [{"id": movie_id, "popularity": 10.0} for movie_id in ids],
+            "total_pages": 1 if ids else 0,
+            "total_results": total,
+        }
+
+
+class KeywordYieldTest(TestCase):
+    def setUp(self) -> None:
+        invalidate_keyword_index()
+        self.addCleanup(invalidate_keyword_index)
+
+    def test_redundant_keywords_rank_below_distinct_ones(self) -> None:
+        broad = KeywordYield(1, 400, frozenset({1, 2, 3, 4}), 20.0)
+        duplicate = KeywordYield(2, 300, frozenset({1, 2, 3, 4}), 20.0)
+        distinct = KeywordYield(3, 100, frozenset({7, 8}), 5.0)
+        empty = KeywordYield(4, 0, frozenset(), 0.0)
+
+        ranked = rank_keyword_yields([empty, duplicate, distinct, broad])
+
+        self.assertEqual([entry.keyword_id for entry, _ in ranked], [1, 3, 2, 4])
+        self.assertEqual([overlap for _, overlap in ranked], [0.0, 0.0, 1.0, 1.0])
+
+    def test_scoring_stores_ranking_used_by_discovery(self) -> None:
+        tag = IdentityTag.objects.create(name="Keyword Test", slug="keyword-test")
+        for keyword_id, weight in ((10, 1.0), (20, 0.8), (30, 0.5)):
+            IdentityTagKeyword.objects.create(tag=tag, keyword_id=keyword_id, weight=weight)
+        self.assertEqual(get_keyword_index().keywords_for(tag.pk), (10, 20, 30))
+
+        client = FakeYieldClient({10: (2, [1]), 20: (0, []), 30: (90, [5, 6])})
+        rankings = score_tag_keywords(tags=[tag], client=client)
+
+        self.assertEqual(rankings, {"keyword-test": [30, 10, 20]})
+        self.assertEqual(len(client.discover_calls), 3)
+        self.assertEqual(get_keyword_index().keywords_for(tag.pk), (30, 10, 20))
+        best = IdentityTagKeyword.objects.get(tag=tag, keyword_id=30)
+        self.assertEqual((best.rank, best.result_count, best.overlap), (1, 90, 0.0))
@@ -0,0 +1,63 @@
+from django.test import SimpleTestCase, TestCase
+
+from media_catalog.models import MediaItem
+from media_catalog.services.masks import (
+    FORMAT_LONG,
+    FORMAT_SHORT,
+    FORMAT_UNKNOWN_RUNTIME,
+    backfill_media_masks,
+    format_mask,
+    genre_bits,
+    genre_mask,
+    media_masks,
+)
+
+
+class MediaMasksTest(SimpleTestCase):
+    def test_genre_mask_matches_ids_and_names(self) -> None:
+        expected = genre_bits("documentary", "drama")
+
+        self.assertEqual(genre_mask([{"id": 99, "name": "Documentaire"}, {"id": 18, "name": "Drame"}]), expected)
+        self.assertEqual(genre_mask([99, 18]), expected)
+        self.assertEqual(genre_mask(["Documentary", "drama", "Unknown"]), expected)
+        self.assertEqual(genre_mask([]), 0)
+
+    def test_format_mask_splits_on_runtime(self) -> None:
+        self.assertEqual(format_mask(40), FORMAT_SHORT)
+        self.assertEqual(format_mask(45), FORMAT_SHORT)
+        self.assertEqual(format_mask(96), FORMAT_LONG)
+        for runtime in (None, "", 0, "90"):
+            self.assertEqual(format_mask(runtime), FORMAT_UNKNOWN_RUNTIME)
+
+    def test_media_masks_prefer_details_over_summary(self) -> None:
+        masks = media_masks(
+            {
+                "summary": {"genre_ids": [27]},
+                "details": {"genres": [{"id": 35, "name": "Comedy"}], "runtime": 100},
+            }
+        )
+
+        self.assertEqual(masks, {"genre_mask": genre_bits("comedy"), "format_mask": FORMAT_LONG})
+        self.assertEqual(media_masks({"summary": {"genre_ids": [27]}})["genre_mask"], genre_bits("horror"))
+
+
+class BackfillMediaMasksTest(TestCase):
+    def test_updates_only_stale_rows(self) -> None:
+        stale = MediaItem.objects.create(
+            tmdb_id=1,
+            title="Stale",
+            metadata={"details": {"genres": [{"id": 878}], "runtime": 30}},
+        )
+        MediaItem.objects.create(
+            tmdb_id=2,
+            title="Current",
+            metadata={},
+            format_mask=FORMAT_UNKNOWN_RUNTIME,
+        )
+
+        updated = backfill_media_masks(MediaItem.objects.all(), batch_size=1)
+
+        self.assertEqual(updated, 1)
+        stale.refresh_from_db()
+        self.assertEqual(stale.genre_mask, genre_bits("science fiction"))
+        self.assertEqual(stale.format_mask, FORMAT_SHORT)
@@ -0,0 +1,60 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from media_catalog.services.ranking import RankingWeights, bayesian_rating, rank_candidates, recency_score
+
+TODAY = date(2026, 6, 1)
+
+
+class RankingTest(SimpleTestCase):
+    def test_bayesian_rating_distrusts_small_vote_counts(self) -> None:
+        self.assertLess(bayesian_rating(10.0, 1), bayesian_rating(8.0, 5000))
+        self.assertAlmostEqual(bayesian_rating(None, None), 6.5)
+
+    def test_recency_halves_every_half_life(self) -> None:
+        self.assertAlmostEqual(recency_score("2016-06-01", today=TODAY), 0.5, places=2)
+        self.assertEqual(recency_score(None, today=TODAY), 0.0)
+        self.assertEqual(recency_score("not a date", today=TODAY), 0.0)
+
+    def test_candidates_found_by_several_sources_rank_first(self) -> None:
+        batch_a = [{"id": 1}, {"id": 2}, {"id": 3}]
+        batch_b = [{"id": 4}, {"id": 3}]
+
+        ranked = rank_candidates([batch_a, batch_b], limit=2, today=TODAY)
+
+        self.assertEqual([entry["id"] for entry in ranked], [3, 1])
+
+    def test_weights_and_tag_overlap_are_configurable(self) -> None:
+        source = [
+            {"id": 1, "vote_average": 5.0, "vote_count": 900},
+            {"id": 2, "vote_average": 8.5, "vote_count": 900},
+        ]
+        by_rank = RankingWeights(source_rank=1.0, keyword_matches=0, rating=0, recency=0, tag_overlap=0)
+        by_rating = RankingWeights(source_rank=0, keyword_matches=0, rating=1.0, recency=0, tag_overlap=0)
+        by_tags = RankingWeights(source_rank=0, keyword_matches=0, rating=0, recency=0, tag_overlap=1.0)
+
+        self.assertEqual(rank_candidates([source], limit=1, weights=by_rank, today=TODAY)[0]["id"], 1)
+        self.assertEqual(rank_candidates([source], limit=1, weights=by_rating, today=TODAY)[0]["id"], 2)
+        self.assertEqual(
+            rank_candidates(
+                [source],
+                limit=1,
+                weights=by_tags,
+                wanted_tag_ids=[7, 8],
+                tag_ids_by_movie={1: {7, 8}, 2: {7}},
+                today=TODAY,
+            )[0]["id"],
+            1,
+        )
+
+    def test_top_k_over_thousands_of_candidates(self) -> None:
+        sources = [
+            [{"id": movie_id, "vote_average": movie_id % 10, "vote_count": 200} for movie_id in range(1, 3001)],
+            [{"id": movie_id} for movie_id in range(2990, 3001)],
+        ]
+
+        ranked = rank_candidates(sources, limit=5, today=TODAY)
+
+        self.assertEqual(len(ranked), 5)
+        self.assertTrue(all(entry["id"] >= 2990 for entry in ranked))
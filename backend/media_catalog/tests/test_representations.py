@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+
+from media_catalog.api.fieldsets import Fieldset
+from media_catalog.api.representations import detail_payload, listing_rows, summary_payloads
+from media_catalog.api.serializers import MediaListDetailSerializer, MediaListSummarySerializer
+from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListItem
+from media_catalog.services.versions import publish_media_list_version
+
+
+class FastPathEquivalenceTests(TestCase):
+    """The values() payloads must match the DRF serializers field for field."""
+
+    def setUp(self) -> None:
+        self.owner = get_user_model().objects.create_user("curator", password="pass-strong-42")
+        self.tag, _ = IdentityTag.objects.get_or_create(slug="trans-joy", defaults={"name": "Transidentités"})
+        self.request = APIRequestFactory().get("/api/media-lists/", HTTP_HOST="localhost")
+
+        self.media_list = MediaList.objects.create(
+            title="Trans Joy Spotlight",
+            slug="trans-joy-spotlight",
+            description="Celebrate trans joy",
+            owner=self.owner,
+            source_keyword=self.tag,
+            is_dynamic=True,
+        )
+        items = [
+            MediaItem.objects.create(
+                tmdb_id=400 + index,
+                title=f"Film {index}",
+                release_date=date(2019, 6, index + 1) if index % 2 else None,
+                poster_url="https://image.tmdb.org/t/p/w500/poster.jpg",
+                metadata={"summary": {"id": 400 + index, "genre_ids": [18]}},
+            )
+            for index in range(3)
+        ]
+        publish_media_list_version(self.media_list, items)
+        MediaList.objects.create(title="Untagged", slug="untagged", owner=self.owner)
+
+    def _instance(self, fieldset: Fieldset) -> MediaList:
+        return fieldset.restrict_lists(MediaList.objects.all()).get(pk=self.media_list.pk)
+
+    def _listing(self, fieldset: Fieldset):
+        return fieldset.restrict_lists(MediaList.objects.order_by("-created_at", "-id"))
+
+    def test_detail_matches_serializer(self) -> None:
+        MediaListItem.objects.filter(version=self.media_list.current_version, position=2).update(notes="Must watch")
+        for params in (
+            {},
+            {"expand": ""},
+            {"fields": "slug,share_url,items.position,items.media_item.title,items.media_item.release_date"},
+            {"fields": "title,source_keyword", "expand": "source_keyword"},
+        ):
+            with self.subTest(params=params):
+                fieldset = Fieldset.from_query(params, detail=True)
+                instance = self._instance(fieldset)
+                context = {"request": self.request, "fieldset": fieldset}
+
+                expected = MediaListDetailSerializer(instance, context=context).data
+
+                self.assertEqual(detail_payload(instance, fieldset, request=self.request), expected)
+
+    def test_summary_matches_serializer(self) -> None:
+        for params in ({}, {"expand": ""}, {"fields": "slug,item_count,updated_at"}):
+            with self.subTest(params=params):
+                fieldset = Fieldset.from_query(params, detail=False)
+                context = {"request": self.request, "fieldset": fieldset}
+
+                expected = MediaListSummarySerializer(self._listing(fieldset), many=True, context=context).data
+                rows = listing_rows(self._listing(fieldset), fieldset)
+
+                self.assertEqual(summary_payloads(rows, fieldset, request=self.request), expected)
+
+    def test_detail_reads_items_in_one_query(self) -> None:
+        instance = self._instance(Fieldset())
+
+        with self.assertNumQueries(1):
+            payload = detail_payload(instance, request=self.request)
+
+        self.assertEqual([item["position"] for item in payload["items"]], [1, 2, 3])
+
+    def test_benchmark_command_reports_both_paths(self) -> None:
+        out = StringIO()
+
+        call_command("benchmark_list_serializers", "--items=5", "--lists=2", "--rounds=1", stdout=out)
+
+        self.assertIn("detail (5 items): serializer", out.getvalue())
+        self.assertIn("summary (2 lists): serializer", out.getvalue())
+        self.assertFalse(MediaList.objects.filter(slug__startswith="benchmark-").exists())
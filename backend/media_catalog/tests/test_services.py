@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Dict, List, Optional
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
-from media_catalog.models import IdentityTag, MediaItem
-from media_catalog.services import generate_media_list_for_identity
-from media_catalog.services.generator import DEFAULT_APPEND
+from media_catalog.models import IdentityTag, MediaItem, MediaList, MediaListLock
+from media_catalog.services import (
+    IdentityListRequest,
+    generate_media_list_for_identity,
+    generate_media_lists_for_identities,
+)
+from media_catalog.services.generator import DEFAULT_APPEND, media_list_slug_for_tag
+from media_catalog.services.keywords import invalidate_keyword_index
+from media_catalog.services.locks import acquire_list_lock
+from media_catalog.services.versions import prune_media_list_versions
 from tmdb import TmdbNotFoundError
+from tmdb.models import KeywordLookup
 
 
 class FakeTmdbClient:
@@ -91,9 +100,9 @@ class GenerateMediaListServiceTest(TestCase):
 
         self.assertEqual(self.tag.tmdb_keyword_id, 777)
         self.assertEqual(media_list.source_keyword_id, self.tag.id)
-        self.assertEqual(media_list.items.count(), 1)
+        self.assertEqual(media_list.current_items().count(), 1)
 
-        list_item = media_list.items.select_related("media_item").first()
+        list_item = media_list.current_items().first()
         assert list_item is not None
         media_item = list_item.media_item
         self.assertEqual(media_item.tmdb_id, 42)
@@ -156,8 +165,8 @@ class GenerateMediaListServiceTest(TestCase):
         media_item = MediaItem.objects.get(tmdb_id=11)
         self.assertEqual(media_item.title, "First Cut (Remastered)")
         self.assertEqual(media_item.metadata["details"]["title"], "First Cut (Remastered)")
-        self.assertEqual(media_list.items.count(), 1)
-        list_item = media_list.items.first()
+        self.assertEqual(media_list.current_items().count(), 1)
+        list_item = media_list.current_items().first()
         self.assertIsNotNone(list_item)
         if list_item:
             self.assertEqual(list_item.position, 1)
@@ -167,3 +176,174 @@ class GenerateMediaListServiceTest(TestCase):
 
         with self.assertRaises(TmdbNotFoundError):
             generate_media_list_for_identity(tag=self.tag, owner=self.user, client=client)
+
+
+class UnresolvedKeywordGenerationTest(TestCase):
+    def setUp(self) -> None:
+        invalidate_keyword_index()
+        self.addCleanup(invalidate_keyword_index)
+        User = get_user_model()
+        self.user = User.objects.create_user("keyword-curator", password="strong-pass-123")
+        self.tag = IdentityTag.objects.create(name="Uncharted Orbit", slug="uncharted-orbit")
+
+    def test_negative_keyword_lookup_survives_the_failed_generation(self) -> None:
+        client = FakeTmdbClient()
+        client.search_keyword = lambda query, page=1: client.search_calls.append(query) or {"results": []}
+
+        for _ in range(2):
+            with self.assertRaises(TmdbNotFoundError):
+                generate_media_list_for_identity(tag=self.tag, owner=self.user, client=client)
+
+        self.assertEqual(client.search_calls, ["Uncharted Orbit"])
+        self.assertTrue(KeywordLookup.objects.filter(keyword_id__isnull=True).exists())
+
+
+class MediaListGenerationLockTest(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.user = User.objects.create_user("lock-curator", password="strong-pass-123")
+        self.tag = IdentityTag.objects.create(name="Lock Joy", slug="lock-joy", tmdb_keyword_id=99)
+        self.slug = media_list_slug_for_tag(self.tag)
+        summary = {"id": 7, "title": "Held Breath", "release_date": "2019-05-05"}
+        self.client_factory = lambda: FakeTmdbClient(
+            discover_batches=[{"results": [summary], "total_pages": 1}],
+            details={7: dict(summary)},
+        )
+
+    def test_late_arrival_serves_previous_version(self) -> None:
+        previous = MediaList.objects.create(title="Lock Joy", slug=self.slug, owner=self.user, source_keyword=self.tag)
+        token = acquire_list_lock(self.slug)
+        self.assertIsNotNone(token)
+        client = self.client_factory()
+
+        media_list = generate_media_list_for_identity(tag=self.tag, owner=self.user, client=client)
+
+        self.assertEqual(media_list.pk, previous.pk)
+        self.assertEqual(client.discover_calls, [])
+        self.assertEqual(client.detail_calls, [])
+
+    def test_generates_after_stale_holder_times_out(self) -> None:
+        self.assertIsNotNone(acquire_list_lock(self.slug))
+        client = self.client_factory()
+
+        media_list = generate_media_list_for_identity(tag=self.tag, owner=self.user, client=client, lock_wait=0)
+
+        self.assertEqual(media_list.current_items().count(), 1)
+        self.assertEqual(client.detail_calls, [7])
+
+    def test_lock_is_released_after_generation(self) -> None:
+        generate_media_list_for_identity(tag=self.tag, owner=self.user, client=self.client_factory())
+
+        self.assertFalse(MediaListLock.objects.filter(key=self.slug).exists())
+        self.assertIsNotNone(acquire_list_lock(self.slug))
+
+    def test_expired_lock_is_reclaimed(self) -> None:
+        self.assertIsNotNone(acquire_list_lock(self.slug, ttl=timedelta(seconds=-1)))
+
+        self.assertIsNotNone(acquire_list_lock(self.slug))
+
+
+class MediaListVersioningTest(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.user = User.objects.create_user("version-curator", password="strong-pass-123")
+        self.tag = IdentityTag.objects.create(name="Version Joy", slug="version-joy", tmdb_keyword_id=42)
+
+    def _generate(self, *movie_ids: int) -> MediaList:
+        summaries = [{"id": movie_id, "title": f"Film {movie_id}"} for movie_id in movie_ids]
+        # Films from earlier generations come back as catalog candidates and need details too.
+        client = FakeTmdbClient(
+            discover_batches=[{"results": summaries, "total_pages": 1}],
+            details={movie_id: {"id": movie_id, "title": f"Film {movie_id}"} for movie_id in range(1, 10)},
+        )
+        return generate_media_list_for_identity(tag=self.tag, owner=self.user, limit=len(movie_ids), client=client)
+
+    def test_regeneration_publishes_new_version_and_keeps_old_one_intact(self) -> None:
+        first = self._generate(1, 2)
+        first_version = first.current_version
+        second = self._generate(3, 1)
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(second.current_version.number, first_version.number + 1)
+        self.assertEqual(
+            [(entry.media_item.tmdb_id, entry.position) for entry in second.current_items()],
+            [(3, 1), (1, 2)],
+        )
+        # The superseded snapshot is untouched for readers still holding it.
+        self.assertEqual(
+            list(first_version.items.order_by("position").values_list("media_item__tmdb_id", flat=True)),
+            [1, 2],
+        )
+
+    def test_prune_keeps_current_and_recent_versions(self) -> None:
+        for movie_id in (1, 2, 3, 4):
+            media_list = self._generate(movie_id)
+        published = [entry.media_item.tmdb_id for entry in media_list.current_items()]
+
+        self.assertEqual(prune_media_list_versions(keep=2, grace_period=timedelta(hours=1)), 0)
+        self.assertEqual(prune_media_list_versions(keep=2, grace_period=timedelta(0)), 2)
+
+        media_list.refresh_from_db()
+        self.assertEqual(list(media_list.versions.values_list("number", flat=True)), [4, 3])
+        self.assertEqual([entry.media_item.tmdb_id for entry in media_list.current_items()], published)
+
+    def test_catalog_films_for_the_tag_join_discovered_ones(self) -> None:
+        shelved = MediaItem.objects.create(
+            tmdb_id=7, title="Film 7", media_type=MediaItem.MEDIA_TYPE_MOVIE, metadata={"details": {"id": 7}}
+        )
+        shelved.identity_tags.add(self.tag)
+        client = FakeTmdbClient(
+            discover_batches=[{"results": [{"id": 8, "title": "Film 8"}], "total_pages": 1}],
+            details={movie_id: {"id": movie_id, "title": f"Film {movie_id}"} for movie_id in (7, 8)},
+        )
+
+        media_list = generate_media_list_for_identity(tag=self.tag, owner=self.user, limit=2, client=client)
+
+        self.assertEqual(
+            sorted(entry.media_item.tmdb_id for entry in media_list.current_items()),
+            [7, 8],
+        )
+        self.assertEqual(len(client.discover_calls), 1)
+
+
+class GenerateMediaListsBatchTest(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.user = User.objects.create_user("batch-curator", password="strong-pass-123")
+        self.joy = IdentityTag.objects.create(name="Batch Joy", slug="batch-joy", tmdb_keyword_id=11)
+        self.history = IdentityTag.objects.create(name="Batch History", slug="batch-history", tmdb_keyword_id=22)
+        self.empty = IdentityTag.objects.create(name="Batch Empty", slug="batch-empty", tmdb_keyword_id=33)
+
+    def test_shared_movies_are_fetched_once_per_batch(self) -> None:
+        client = FakeTmdbClient(
+            discover_batches=[
+                {"results": [{"id": 1, "title": "Shared"}, {"id": 2, "title": "Joy only"}], "total_pages": 1},
+                {"results": [], "total_pages": 0},
+                {"results": [{"id": 1, "title": "Shared"}, {"id": 3, "title": "History only"}], "total_pages": 1},
+            ],
+            details={movie_id: {"id": movie_id, "title": f"Film {movie_id}"} for movie_id in (1, 2, 3)},
+        )
+
+        lists = generate_media_lists_for_identities(
+            [
+                IdentityListRequest(tag=self.joy, title="Joy"),
+                IdentityListRequest(tag=self.empty),
+                IdentityListRequest(tag=self.history),
+            ],
+            owner=self.user,
+            limit=2,
+            language="fr-FR",
+            client=client,
+        )
+
+        self.assertEqual(sorted(client.detail_calls), [1, 2, 3])
+        self.assertEqual(set(lists), {self.joy.pk, self.history.pk})
+        self.assertEqual(lists[self.joy.pk].title, "Joy")
+        self.assertEqual(lists[self.joy.pk].slug, media_list_slug_for_tag(self.joy, "fr-FR"))
+        self.assertEqual(
+            [entry.media_item.tmdb_id for entry in lists[self.history.pk].current_items()],
+            [1, 3],
+        )
+        shared = MediaItem.objects.get(tmdb_id=1)
+        self.assertEqual(set(shared.identity_tags.all()), {self.joy, self.history})
+        self.assertFalse(MediaListLock.objects.exists())
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, List, Optional
+
+from django.test import TestCase
+
+from media_catalog.models import CatalogSyncCheckpoint, MediaItem
+from media_catalog.services import sync_catalog_changes
+from media_catalog.services.masks import FORMAT_SHORT, genre_bits
+from media_catalog.services.sync import MOVIE_CHANGES_CHECKPOINT
+from tmdb import TmdbNotFoundError
+
+from .test_services import FakeTmdbClient
+
+
+class FakeChangesTmdbClient(FakeTmdbClient):
+    """Fake TMDb that also serves the `/movie/changes` feed."""
+
+    def __init__(
+        self,
+        *,
+        change_pages: Optional[List[List[int]]] = None,
+        missing: Optional[List[int]] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.change_pages = change_pages or []
+        self.missing = set(missing or [])
+        self.change_calls: List[Dict[str, object]] = []
+
+    def get_movie_changes(self, *, start_date=None, end_date=None, page: int = 1) -> Dict[str, object]:
+        self.change_calls.append({"start_date": start_date, "end_date": end_date, "page": page})
+        ids = self.change_pages[page - 1] if page <= len(self.change_pages) else []
+        return {
+            "results": [{"id": movie_id, "adult": False} for movie_id in ids],
+            "page": page,
+            "total_pages": len(self.change_pages),
+        }
+
+    def get_movie_details(self, movie_id: int, *, append_to_response: Optional[str] = None) -> Dict[str, object]:
+        if movie_id in self.missing:
+            self.detail_calls.append(movie_id)
+            raise TmdbNotFoundError("TMDb resource not found")
+        return super().get_movie_details(movie_id, append_to_response=append_to_response)
+
+
+class SyncCatalogChangesTest(TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2026, 3, 1, 12, 0, tzinfo=dt_timezone.utc)
+        for tmdb_id, title in ((1, "Old Title"), (2, "Untouched"), (3, "Vanished")):
+            MediaItem.objects.create(
+                tmdb_id=tmdb_id,
+                title=title,
+                metadata={"summary": {"id": tmdb_id, "title": title}, "details": {}},
+            )
+
+    def test_refreshes_only_changed_local_items(self) -> None:
+        client = FakeChangesTmdbClient(
+            change_pages=[[1, 500], [3, 501]],
+            missing=[3],
+            details={
+                1: {
+                    "id": 1,
+                    "title": "New Title",
+                    "release_date": "2021-06-01",
+                    "runtime": 30,
+                    "genres": [{"id": 99, "name": "Documentary"}],
+                }
+            },
+        )
+
+        report = sync_catalog_changes(client=client, now=self.now)
+
+        self.assertEqual(report.changed, 4)
+        self.assertEqual(report.refreshed, 1)
+        self.assertEqual(report.skipped, 2)
+        self.assertEqual(report.missing, 1)
+        self.assertEqual(sorted(client.detail_calls), [1, 3])
+        self.assertEqual(len(client.change_calls), 2)
+
+        refreshed = MediaItem.objects.get(tmdb_id=1)
+        self.assertEqual(refreshed.title, "New Title")
+        self.assertEqual(refreshed.metadata["summary"]["title"], "Old Title")
+        self.assertEqual(refreshed.format_mask, FORMAT_SHORT)
+        self.assertEqual(refreshed.genre_mask, genre_bits("documentary"))
+        self.assertEqual(MediaItem.objects.get(tmdb_id=2).title, "Untouched")
+
+    def test_resumes_from_stored_checkpoint(self) -> None:
+        CatalogSyncCheckpoint.objects.create(
+            name=MOVIE_CHANGES_CHECKPOINT,
+            synced_until=self.now - timedelta(days=20),
+        )
+        client = FakeChangesTmdbClient(change_pages=[[]])
+
+        sync_catalog_changes(client=client, now=self.now)
+
+        # A 20-day gap is split into two windows TMDb accepts.
+        self.assertEqual(
+            [(call["start_date"], call["end_date"]) for call in client.change_calls],
+            [("2026-02-09", "2026-02-23"), ("2026-02-23", "2026-03-01")],
+        )
+        checkpoint = CatalogSyncCheckpoint.objects.get(name=MOVIE_CHANGES_CHECKPOINT)
+        self.assertEqual(checkpoint.synced_until, self.now)
+        self.assertEqual(checkpoint.last_report["changed"], 0)
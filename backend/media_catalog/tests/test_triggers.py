@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+
+from accounts.models import TriggerTopic, TriggerTopicKeyword, UserTriggerPreference
+from media_catalog.models import MediaItem
+from media_catalog.services.masks import backfill_media_masks
+from media_catalog.services.triggers import (
+    get_trigger_index,
+    invalidate_trigger_index,
+    trigger_mask_for_details,
+    trigger_mask_for_user,
+)
+
+
+class TriggerIndexTest(TestCase):
+    def setUp(self) -> None:
+        invalidate_trigger_index()
+        self.addCleanup(invalidate_trigger_index)
+        self.violence = TriggerTopic.objects.create(name="Violence", slug="violence")
+        self.grief = TriggerTopic.objects.create(name="Deuil", slug="deuil")
+        TriggerTopicKeyword.objects.create(topic=self.violence, keyword_id=100)
+        TriggerTopicKeyword.objects.create(topic=self.grief, keyword_id=100)
+        TriggerTopicKeyword.objects.create(topic=self.grief, keyword_id=200)
+
+    def test_topics_get_distinct_bits_and_reuse_freed_ones(self) -> None:
+        self.assertEqual({self.violence.bit, self.grief.bit}, {0, 1})
+
+        freed = self.violence.bit
+        self.violence.delete()
+        replacement = TriggerTopic.objects.create(name="Addiction", slug="addiction")
+
+        self.assertEqual(replacement.bit, freed)
+
+    def test_keywords_map_to_every_topic_bit(self) -> None:
+        violence, grief = 1 << self.violence.bit, 1 << self.grief.bit
+        index = get_trigger_index()
+
+        self.assertEqual(index.mask_for([100]), violence | grief)
+        self.assertEqual(index.mask_for([200, 999]), grief)
+        self.assertEqual(trigger_mask_for_details({"keywords": {"keywords": [{"id": 200}]}}), grief)
+
+    def test_index_follows_keyword_edits(self) -> None:
+        self.assertEqual(get_trigger_index().mask_for([300]), 0)
+
+        TriggerTopicKeyword.objects.create(topic=self.violence, keyword_id=300)
+
+        self.assertEqual(get_trigger_index().mask_for([300]), 1 << self.violence.bit)
+
+    def test_user_mask_covers_curated_preferences_only(self) -> None:
+        user = get_user_model().objects.create_user("nova", password="orbit-strong-42")
+        UserTriggerPreference.objects.create(user=user, topic=self.grief)
+        UserTriggerPreference.objects.create(user=user, custom_label="Orages")
+
+        self.assertEqual(trigger_mask_for_user(user), 1 << self.grief.bit)
+        self.assertEqual(trigger_mask_for_user(AnonymousUser()), 0)
+
+    def test_backfill_flags_items_from_stored_keywords(self) -> None:
+        item = MediaItem.objects.create(
+            tmdb_id=1,
+            title="Storm",
+            metadata={"details": {"keywords": {"keywords": [{"id": 100}]}}},
+        )
+
+        backfill_media_masks(MediaItem.objects.all())
+
+        item.refresh_from_db()
+        self.assertEqual(item.trigger_mask, (1 << self.violence.bit) | (1 << self.grief.bit))
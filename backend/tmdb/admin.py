@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import DiscoverPageStat, KeywordLookup
+
+
+@admin.register(KeywordLookup)
+class KeywordLookupAdmin(admin.ModelAdmin):
+    list_display = ("query", "keyword_id", "prefer_exact", "expires_at", "updated_at")
+    search_fields = ("query",)
+    list_filter = ("prefer_exact",)
+
+
+@admin.register(DiscoverPageStat)
+class DiscoverPageStatAdmin(admin.ModelAdmin):
+    list_display = ("with_keywords", "sort_by", "include_adult", "language", "total_pages", "total_results", "expires_at")
+    search_fields = ("with_keywords",)
+    list_filter = ("include_adult", "sort_by")
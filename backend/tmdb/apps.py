@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class TmdbConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "tmdb"
+    verbose_name = "TMDb"
@@ -153,6 +153,24 @@ class TmdbClient:
 
         return self._request("GET", f"/movie/{movie_id}", params=params)
 
+    def get_movie_changes(
+        self,
+        *,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        page: int = 1,
+    ) -> Dict[str, Any]:
+        """List ids of movies edited on TMDb between two dates (YYYY-MM-DD).
+
+        TMDb only accepts windows of up to 14 days and defaults to the last 24h.
+        """
+
+        return self._request(
+            "GET",
+            "/movie/changes",
+            params={"start_date": start_date, "end_date": end_date, "page": page},
+        )
+
     def get_configuration(self) -> Dict[str, Any]:
         """Fetch TMDb API configuration (useful for image base URLs)."""
 
@@ -3,7 +3,7 @@ TMDb Keywords mapping based on previous experiments.
 Contains comprehensive keyword IDs for LGBT+ themes.
 """
 
-from typing import Dict, List, Optional
+from typing import List
 
 # Complete keyword mapping from previous experiments
 TMDB_KEYWORDS = {
@@ -217,83 +217,7 @@ QUEER_ACTIVISM_KEYWORDS = [
 ]
 
 
-def get_keywords_for_theme(theme_slug: str) -> List[int]:
-    """
-    Get TMDb keyword IDs for a given theme slug.
-    Returns a list of related keyword IDs based on the theme.
-    """
-    keyword_map = {
-        "trans-joy": [
-            265451, 343076, 254152, 268076, 335948,
-            274776, 14702, 290527, 325300, 317540,
-            328899, 307399, 217271, 189962, 312909
-        ],
-        "lesbian-love": [
-            264386, 308586, 315385, 319872, 9833,
-            15136, 305694, 328765, 345079, 308587,
-            290382, 272066
-        ],
-        "gay-celebration": [
-            258533, 10180, 275157, 173672, 264411,
-            241179, 259285, 326218, 293495, 267923,
-            272617, 239239, 250937, 157096
-        ],
-        "queer-joy": [
-            250606, 321567, 333327, 333766, 332049,
-            312912, 300642, 346116, 304694, 207958,
-            314127, 265587, 347179
-        ],
-        "lgbt-history": [
-            158718, 346871, 348563, 275749, 313433,
-            280179, 156501, 267488, 271115, 271167,
-            325395, 253337, 236454
-        ],
-        "non-binary": [
-            252909, 266529, 281283, 210039, 34221,
-            312910, 34214, 234700, 11402
-        ],
-        "gender-studies": [
-            246413, 34214, 210039, 234700, 34221,
-            273188, 299718, 11402
-        ],
-        "radical-feminism": [
-            309966, 2383, 11718, 301659, 293179,
-            228965, 6337, 338884, 161166, 208591,
-            221195, 296536
-        ],
-        "intersex": [
-            240109, 257264, 9331, 273188
-        ],
-        "asexual": [
-            329977, 247099, 329976, 322171
-        ],
-        "tds-sex-work": [
-            271159, 13059, 245541, 226543, 190178,
-            163791, 279793, 254724
-        ],
-        "bisexual": [
-            329968, 168812, 287417, 3183
-        ],
-        "pansexual": [
-            262765, 155870
-        ],
-        "disability-joy": [
-            # Note: Limited disability representation in original experiments
-            # Would need additional TMDb keyword research
-        ],
-        "bipoc-lgbtq": [
-            316515, 195624, 272309, 291081, 233840,
-            11550, 257456, 10144
-        ],
-    }
-
-    return keyword_map.get(theme_slug, [])
-
-
-def get_primary_keyword_for_theme(theme_slug: str) -> Optional[int]:
-    """Get the primary TMDb keyword ID for a theme."""
-    keywords = get_keywords_for_theme(theme_slug)
-    return keywords[0] if keywords else None
+# Per-tag keyword mappings live in the database (`media_catalog.IdentityTagKeyword`).
 
 
 def build_tmdb_keyword_filter(keyword_ids: List[int]) -> str:
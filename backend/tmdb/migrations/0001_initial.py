@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='KeywordLookup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(max_length=255)),
+                ('prefer_exact', models.BooleanField(default=True)),
+                ('keyword_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('expires_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['query'],
+                'constraints': [models.UniqueConstraint(fields=('query', 'prefer_exact'), name='unique_keyword_lookup')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tmdb', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscoverPageStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('with_keywords', models.CharField(max_length=255)),
+                ('sort_by', models.CharField(max_length=64)),
+                ('include_adult', models.BooleanField(default=False)),
+                ('language', models.CharField(blank=True, max_length=16)),
+                ('total_pages', models.PositiveIntegerField(default=0)),
+                ('total_results', models.PositiveIntegerField(default=0)),
+                ('expires_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['with_keywords'],
+                'constraints': [models.UniqueConstraint(fields=('with_keywords', 'sort_by', 'include_adult', 'language'), name='unique_discover_page_stat')],
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+"""Persistent caches that spare us repeated TMDb lookups."""
+
+from django.db import models
+from django.utils import timezone
+
+
+class KeywordLookup(models.Model):
+    """Cached outcome of a `/search/keyword` resolution.
+
+    A null ``keyword_id`` is a negative entry: TMDb had no match, and we keep
+    that answer until ``expires_at`` instead of asking again.
+    """
+
+    query = models.CharField(max_length=255)
+    prefer_exact = models.BooleanField(default=True)
+    keyword_id = models.PositiveIntegerField(blank=True, null=True)
+    expires_at = models.DateTimeField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["query"]
+        constraints = [
+            models.UniqueConstraint(fields=["query", "prefer_exact"], name="unique_keyword_lookup")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.query} → {self.keyword_id or 'missing'}"
+
+    @property
+    def is_negative(self) -> bool:
+        return self.keyword_id is None
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at > timezone.now()
+
+
+class DiscoverPageStat(models.Model):
+    """Last known pagination size of a `/discover/movie` filter.
+
+    Lets random sampling jump straight to a page instead of probing page 1
+    first. Any discover call for the same filter refreshes the row.
+    """
+
+    with_keywords = models.CharField(max_length=255)
+    sort_by = models.CharField(max_length=64)
+    include_adult = models.BooleanField(default=False)
+    language = models.CharField(max_length=16, blank=True)
+    total_pages = models.PositiveIntegerField(default=0)
+    total_results = models.PositiveIntegerField(default=0)
+    expires_at = models.DateTimeField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["with_keywords"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["with_keywords", "sort_by", "include_adult", "language"],
+                name="unique_discover_page_stat",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.with_keywords} [{self.sort_by}] → {self.total_pages} pages"
@@ -1,8 +1,15 @@
 """Service helpers built on top of the TMDb client."""
 
-from .discovery import resolve_keyword_id, sample_movie_by_keyword
+from .discovery import (
+    discover_movies_with_stats,
+    get_discover_page_stat,
+    resolve_keyword_id,
+    sample_movie_by_keyword,
+)
 
 __all__ = [
+    "discover_movies_with_stats",
+    "get_discover_page_stat",
     "resolve_keyword_id",
     "sample_movie_by_keyword",
 ]
@@ -1,12 +1,26 @@
 """Higher-level discovery helpers built on the TMDb client."""
 
 import random
+from datetime import timedelta
 from typing import Any, Dict, Optional
 
+from django.utils import timezone
+
 from ..client import TmdbClient
 from ..exceptions import TmdbNotFoundError
+from ..models import DiscoverPageStat, KeywordLookup
 
 MAX_DISCOVER_PAGES = 500  # TMDb caps discover pagination at 500.
+KEYWORD_CACHE_TTL = timedelta(days=30)
+KEYWORD_NEGATIVE_CACHE_TTL = timedelta(days=1)
+DISCOVER_STAT_TTL = timedelta(hours=12)
+
+# Filters that identify a `DiscoverPageStat`; any other filter changes the counts.
+_STAT_FILTERS = {"with_keywords", "sort_by", "include_adult", "language"}
+
+
+def _lookup_key(keyword_query: str) -> str:
+    return " ".join(keyword_query.split()).lower()[:255]
 
 
 def resolve_keyword_id(
@@ -14,16 +28,43 @@ def resolve_keyword_id(
     keyword_query: str,
     *,
     prefer_exact: bool = True,
+    use_cache: bool = True,
 ) -> Optional[int]:
     """Resolve a human-readable keyword into a TMDb keyword ID.
 
     We attempt to find an exact, case-insensitive match first. If no exact match
     exists, the first result is returned as a best-effort fallback.
+
+    Answers, including "no such keyword", are persisted in `KeywordLookup` and
+    reused until they expire, so repeated lookups never reach TMDb.
     """
 
     if not keyword_query:
         raise ValueError("keyword_query must not be empty")
 
+    key = _lookup_key(keyword_query)
+    if use_cache:
+        cached = KeywordLookup.objects.filter(
+            query=key,
+            prefer_exact=prefer_exact,
+            expires_at__gt=timezone.now(),
+        ).first()
+        if cached is not None:
+            return cached.keyword_id
+
+    keyword_id = _search_keyword_id(client, keyword_query, prefer_exact=prefer_exact)
+
+    if use_cache:
+        ttl = KEYWORD_CACHE_TTL if keyword_id else KEYWORD_NEGATIVE_CACHE_TTL
+        KeywordLookup.objects.update_or_create(
+            query=key,
+            prefer_exact=prefer_exact,
+            defaults={"keyword_id": keyword_id, "expires_at": timezone.now() + ttl},
+        )
+    return keyword_id
+
+
+def _search_keyword_id(client: TmdbClient, keyword_query: str, *, prefer_exact: bool) -> Optional[int]:
     response = client.search_keyword(keyword_query)
     results = response.get("results", []) or []
 
@@ -40,6 +81,47 @@ def resolve_keyword_id(
     return results[0].get("id")
 
 
+def _stat_key(client: TmdbClient, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if set(params) - _STAT_FILTERS - {"page"} or not params.get("with_keywords"):
+        return None
+    return {
+        "with_keywords": str(params["with_keywords"])[:255],
+        "sort_by": params.get("sort_by") or "popularity.desc",
+        "include_adult": bool(params.get("include_adult", False)),
+        "language": params.get("language") or getattr(client, "default_language", "") or "",
+    }
+
+
+def get_discover_page_stat(client: TmdbClient, **params: Any) -> Optional[DiscoverPageStat]:
+    """Return the unexpired page statistics for a discover filter, if any."""
+
+    key = _stat_key(client, params)
+    if key is None:
+        return None
+    return DiscoverPageStat.objects.filter(expires_at__gt=timezone.now(), **key).first()
+
+
+def discover_movies_with_stats(client: TmdbClient, **params: Any) -> Dict[str, Any]:
+    """Call `/discover/movie` and remember the filter's pagination size.
+
+    Every discover response carries `total_pages`/`total_results`, so recording
+    them here keeps `DiscoverPageStat` fresh at no extra request cost.
+    """
+
+    payload = client.discover_movies(**params)
+    key = _stat_key(client, params)
+    if key is not None and "total_pages" in payload:
+        DiscoverPageStat.objects.update_or_create(
+            **key,
+            defaults={
+                "total_pages": payload.get("total_pages") or 0,
+                "total_results": payload.get("total_results") or 0,
+                "expires_at": timezone.now() + DISCOVER_STAT_TTL,
+            },
+        )
+    return payload
+
+
 def sample_movie_by_keyword(
     client: TmdbClient,
     keyword_query: str,
@@ -71,21 +153,31 @@ def sample_movie_by_keyword(
         "page": 1,
     }
 
-    payload = client.discover_movies(**discover_params)
-    total_results = payload.get("total_results", 0)
-    total_pages = payload.get("total_pages", 0)
-
-    if not total_results:
-        raise TmdbNotFoundError(
-            f"No TMDb titles found for keyword '{keyword_query}' (id={keyword_id})"
-        )
-
-    capped_pages = min(total_pages or 1, MAX_DISCOVER_PAGES)
+    payload: Dict[str, Any] = {}
     target_page = 1
-    if capped_pages > 1:
-        target_page = random.randint(1, capped_pages)
-        if target_page != 1:
-            payload = client.discover_movies(**{**discover_params, "page": target_page})
+    stat = get_discover_page_stat(client, **discover_params)
+    if stat is not None and stat.total_results:
+        # Known page count: go straight to a random page, skipping the probe.
+        target_page = random.randint(1, min(stat.total_pages or 1, MAX_DISCOVER_PAGES))
+        payload = discover_movies_with_stats(client, **{**discover_params, "page": target_page})
+
+    if not payload.get("results"):
+        # No stat yet, or it was stale enough that the page is now empty.
+        target_page = 1
+        payload = discover_movies_with_stats(client, **discover_params)
+        total_results = payload.get("total_results", 0)
+        total_pages = payload.get("total_pages", 0)
+
+        if not total_results:
+            raise TmdbNotFoundError(
+                f"No TMDb titles found for keyword '{keyword_query}' (id={keyword_id})"
+            )
+
+        capped_pages = min(total_pages or 1, MAX_DISCOVER_PAGES)
+        if capped_pages > 1:
+            target_page = random.randint(1, capped_pages)
+            if target_page != 1:
+                payload = discover_movies_with_stats(client, **{**discover_params, "page": target_page})
 
     results = payload.get("results") or []
     if not results:
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from typing import Dict, List
+
+from django.test import TestCase
+from django.utils import timezone
+
+from tmdb.models import DiscoverPageStat, KeywordLookup
+from tmdb.services import resolve_keyword_id, sample_movie_by_keyword
+
+
+class FakeKeywordClient:
+    def __init__(self, results: Dict[str, List[Dict[str, object]]]) -> None:
+        self.results = results
+        self.search_calls: List[str] = []
+
+    def search_keyword(self, query: str, *, page: int = 1) -> Dict[str, object]:
+        self.search_calls.append(query)
+        return {"results": self.results.get(query, [])}
+
+
+class ResolveKeywordIdCacheTest(TestCase):
+    def test_positive_answer_is_reused(self) -> None:
+        client = FakeKeywordClient({"Queer": [{"id": 250606, "name": "queer"}]})
+
+        first = resolve_keyword_id(client, "Queer")
+        second = resolve_keyword_id(client, "  queer ")
+
+        self.assertEqual(first, 250606)
+        self.assertEqual(second, 250606)
+        self.assertEqual(client.search_calls, ["Queer"])
+
+    def test_missing_keyword_is_negatively_cached(self) -> None:
+        client = FakeKeywordClient({})
+
+        self.assertIsNone(resolve_keyword_id(client, "Joies handies"))
+        self.assertIsNone(resolve_keyword_id(client, "Joies handies"))
+
+        self.assertEqual(client.search_calls, ["Joies handies"])
+        lookup = KeywordLookup.objects.get(query="joies handies")
+        self.assertTrue(lookup.is_negative)
+        self.assertLess(lookup.expires_at, timezone.now() + timedelta(days=2))
+
+    def test_expired_entry_is_refreshed(self) -> None:
+        KeywordLookup.objects.create(query="trans", keyword_id=None, expires_at=timezone.now() - timedelta(seconds=1))
+        client = FakeKeywordClient({"Trans": [{"id": 265451, "name": "trans"}]})
+
+        self.assertEqual(resolve_keyword_id(client, "Trans"), 265451)
+        self.assertEqual(KeywordLookup.objects.get(query="trans").keyword_id, 265451)
+
+
+class FakeDiscoverClient(FakeKeywordClient):
+    default_language = "fr-FR"
+
+    def __init__(self, *, total_pages: int) -> None:
+        super().__init__({"queer": [{"id": 250606, "name": "queer"}]})
+        self.total_pages = total_pages
+        self.discover_pages: List[int] = []
+
+    def discover_movies(self, **params: object) -> Dict[str, object]:
+        page = int(params["page"])
+        self.discover_pages.append(page)
+        results = [{"id": page * 100 + 1}] if page <= self.total_pages else []
+        return {
+            "page": page,
+            "results": results,
+            "total_pages": self.total_pages,
+            "total_results": self.total_pages * 20,
+        }
+
+    def get_movie_details(self, movie_id: int, **kwargs: object) -> Dict[str, object]:
+        return {"id": movie_id}
+
+
+class DiscoverPageStatTest(TestCase):
+    def test_first_sample_probes_and_records_page_count(self) -> None:
+        client = FakeDiscoverClient(total_pages=1)
+
+        sample_movie_by_keyword(client, "queer")
+
+        self.assertEqual(client.discover_pages, [1])
+        stat = DiscoverPageStat.objects.get(with_keywords="250606")
+        self.assertEqual((stat.total_pages, stat.language), (1, "fr-FR"))
+
+    def test_fresh_stat_skips_the_probe_request(self) -> None:
+        client = FakeDiscoverClient(total_pages=40)
+        sample_movie_by_keyword(client, "queer")
+        client.discover_pages.clear()
+
+        for _ in range(5):
+            sample_movie_by_keyword(client, "queer")
+
+        # One discover call per sample, on whichever page was drawn.
+        self.assertEqual(len(client.discover_pages), 5)
+
+    def test_stale_page_count_falls_back_to_probe(self) -> None:
+        DiscoverPageStat.objects.create(
+            with_keywords="250606",
+            sort_by="popularity.desc",
+            language="fr-FR",
+            total_pages=500,
+            total_results=10000,
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        client = FakeDiscoverClient(total_pages=1)
+
+        result = sample_movie_by_keyword(client, "queer")
+
+        self.assertEqual(result["page"], 1)
+        self.assertEqual(client.discover_pages[-1], 1)
+        self.assertEqual(DiscoverPageStat.objects.get().total_pages, 1)